@@ -1 +1,11 @@
 from ._functions import find_race as find_race
+from .crawler import (
+    CrawlJob as CrawlJob,
+    CrawlReport as CrawlReport,
+    CrawlScheduler as CrawlScheduler,
+    JobType as JobType,
+    SourceLimits as SourceLimits,
+)
+from .pipeline import parse_race_pages as parse_race_pages
+from .resolver import RaceCluster as RaceCluster, RaceResolver as RaceResolver, resolve_races as resolve_races
+from .sync import SyncReport as SyncReport, sync_season as sync_season
@@ -1,21 +1,24 @@
 import socket
 from collections.abc import Generator
 from datetime import date, datetime, timedelta
+from functools import cached_property
 from ipaddress import ip_address
-from typing import Self, override
+from typing import Any, Self, override
 from urllib.parse import urlparse
 
 import requests
 from parsel.selector import Selector
 
 from rscraping.data.constants import GENDER_FEMALE, GENDER_MALE, HTTP_HEADERS
-from rscraping.data.models import Datasource, Race, RaceName
+from rscraping.data.models import Datasource, Race, RaceName, RacePage, RaceSummary, RaceView
+from rscraping.instrumentation import measure
 from rscraping.parsers.html import HtmlParser
 
 from ._protocol import ClientProtocol
 
 
 class Client(ClientProtocol):
+    # only written when the subclasses are defined (under the import lock), read-only afterwards so it's thread-safe
     _registry: dict[Datasource, type[Self]] = {}
     _gender: str = GENDER_MALE
 
@@ -42,6 +45,19 @@ class Client(ClientProtocol):
     def _html_parser(self) -> HtmlParser:
         raise NotImplementedError
 
+    @classmethod
+    def _fetch(cls, url: str, data: dict[str, Any] | None = None) -> requests.Response:
+        """
+        Single entry point for the datasource requests, a GET unless 'data' is given to POST it.
+        """
+        with measure("fetch", cls.DATASOURCE) as set_size:
+            if data is None:
+                response = requests.get(url=url, headers=HTTP_HEADERS())
+            else:
+                response = requests.post(url=url, headers=HTTP_HEADERS(), data=data)
+            set_size(len(response.content))
+        return response
+
     @override
     def _is_valid_gender(self, gender: str) -> bool:
         return gender in [GENDER_MALE, GENDER_FEMALE]
@@ -85,13 +101,12 @@ class Client(ClientProtocol):
     @override
     def get_race_by_url(self, url: str, race_id: str, **kwargs) -> Race | None:
         self.validate_url(url)
+        selector = Selector(self._fetch(url).content.decode("utf-8"))
         try:
-            race = self._html_parser.parse_race(
-                selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8")),
-                race_id=race_id,
-                is_female=self.is_female,
-                **kwargs,
-            )
+            with measure("parse", self.DATASOURCE):
+                race = self._html_parser.parse_race(
+                    selector=selector, race_id=race_id, is_female=self.is_female, **kwargs
+                )
         except AssertionError:
             return None
         else:
@@ -99,45 +114,110 @@ class Client(ClientProtocol):
                 race.url = url
             return race
 
+    @override
+    def get_race_view_by_id(self, race_id: str, **kwargs) -> RaceView | None:
+        url = self.get_race_details_url(race_id, is_female=self.is_female)
+        self.validate_url(url)
+        selector = Selector(self._fetch(url).content.decode("utf-8"))
+        try:
+            with measure("parse", self.DATASOURCE):
+                view = self._html_parser.parse_race_view(
+                    selector=selector, race_id=race_id, is_female=self.is_female, **kwargs
+                )
+        except AssertionError:
+            return None
+        view.url = url
+        return view
+
+    @override
+    def get_race_page(self, race_id: str, **kwargs) -> RacePage:
+        url = self.get_race_details_url(race_id, is_female=self.is_female)
+        self.validate_url(url)
+        return RacePage(
+            datasource=self.DATASOURCE,
+            race_id=race_id,
+            url=url,
+            content=self._fetch(url).content,
+            is_female=self.is_female,
+            options=kwargs,
+        )
+
     @override
     def get_race_ids_by_year(self, year: int, **kwargs) -> Generator[str]:
         self.validate_year(year)
 
         url = self.get_races_url(year, is_female=self.is_female)
         yield from self._html_parser.parse_race_ids(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).text),
+            selector=Selector(self._fetch(url).text),
             is_female=self.is_female,
             **kwargs,
         )
 
+    @override
+    def get_race_ids_by_date_range(self, start: date, end: date, **kwargs) -> Generator[str]:
+        if start > end:
+            raise ValueError(f"invalid range, {start=} is after {end=}")
+
+        for year, days in _days_by_year(start, end).items():
+            for selector in self._get_listing(year):
+                yield from self._html_parser.parse_race_ids_by_days(
+                    selector=selector,
+                    is_female=self.is_female,
+                    days=days,
+                    **kwargs,
+                )
+
     @override
     def get_last_weekend_race_ids(self, **kwargs) -> Generator[str]:
-        today = datetime.today()
-        last_saturday = today - timedelta(days=(today.weekday() + 1) % 7 + 1)
-        last_sunday = today - timedelta(days=(today.weekday()) % 7 + 1)
+        today = date.today()
+        last_sunday = today - timedelta(days=today.weekday() + 1)
+        yield from self.get_race_ids_by_date_range(last_sunday - timedelta(days=1), last_sunday, **kwargs)
 
-        url = self.get_races_url(today.year, is_female=self.is_female)
-        yield from self._html_parser.parse_race_ids_by_days(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).text),
+    @override
+    def get_race_names_by_year(self, year: int, **kwargs) -> Generator[RaceName]:
+        self.validate_year(year)
+
+        url = self.get_races_url(year, is_female=self.is_female)
+        yield from self._html_parser.parse_race_names(
+            selector=Selector(self._fetch(url).content.decode("utf-8")),
             is_female=self.is_female,
-            days=[
-                datetime.combine(last_saturday.date(), datetime.min.time()),
-                datetime.combine(last_sunday.date(), datetime.min.time()),
-            ],
             **kwargs,
         )
 
     @override
-    def get_race_names_by_year(self, year: int, **kwargs) -> Generator[RaceName]:
+    def get_race_summaries_by_year(self, year: int, **kwargs) -> Generator[RaceSummary]:
         self.validate_year(year)
 
         url = self.get_races_url(year, is_female=self.is_female)
-        yield from self._html_parser.parse_race_names(
-            selector=Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8")),
+        yield from self._html_parser.parse_race_summaries(
+            selector=Selector(self._fetch(url).content.decode("utf-8")),
+            year=year,
             is_female=self.is_female,
             **kwargs,
         )
 
+    def _get_listing(self, year: int) -> list[Selector]:
+        """
+        Pages of the season races listing. Finished seasons are fetched once per client so consecutive queries reuse
+        them, the current one is fetched every time as new races keep being added.
+        """
+        if year in self._listings:
+            return self._listings[year]
+
+        self.validate_year(year)
+        listing = self._fetch_listing(year)
+        if year < date.today().year:
+            self._listings[year] = listing
+        return listing
+
+    def _fetch_listing(self, year: int) -> list[Selector]:
+        url = self.get_races_url(year, is_female=self.is_female)
+        return [Selector(self._fetch(url).text)]
+
+    @cached_property
+    def _listings(self) -> dict[int, list[Selector]]:
+        return {}
+
     ####################################################
     #                     ABSTRACT                     #
     ####################################################
@@ -153,3 +233,14 @@ class Client(ClientProtocol):
     @override
     def get_race_ids_by_club(self, club_id: str, year: int, **kwargs) -> Generator[str]:
         raise NotImplementedError
+
+
+def _days_by_year(start: date, end: date) -> dict[int, set[datetime]]:
+    """
+    Every day of the range as the midnight datetimes the parsers compare with, grouped by year.
+    """
+    days: dict[int, set[datetime]] = {}
+    for offset in range((end - start).days + 1):
+        day = datetime.combine(start + timedelta(days=offset), datetime.min.time())
+        days.setdefault(day.year, set()).add(day)
+    return days
@@ -1,8 +1,9 @@
 from collections.abc import Generator
+from datetime import date
 from typing import Protocol
 
 from rscraping.data.constants import GENDER_MALE
-from rscraping.data.models import Datasource, Race, RaceName
+from rscraping.data.models import Datasource, Race, RaceName, RacePage, RaceSummary, RaceView
 from rscraping.parsers.html import HtmlParser
 
 
@@ -64,6 +65,30 @@ class ClientProtocol(Protocol):
         """
         ...
 
+    def get_race_view_by_id(self, race_id: str, **kwargs) -> RaceView | None:
+        """
+        Retrieve the race by ID parsing only its metadata, the rest of the race is parsed when first accessed.
+
+        Args:
+            race_id (str): The ID of the race.
+            **kwargs: Additional keyword arguments.
+
+        Returns: RaceView | None: The lazy race or None if the race is not found.
+        """
+        ...
+
+    def get_race_page(self, race_id: str, **kwargs) -> RacePage:
+        """
+        Download the raw pages needed to parse a race, without parsing them.
+
+        Args:
+            race_id (str): The ID of the race.
+            **kwargs: Additional keyword arguments passed to the parser.
+
+        Returns: RacePage: The downloaded content.
+        """
+        ...
+
     def get_race_names_by_year(self, year: int, **kwargs) -> Generator[RaceName]:
         """
         Find the names of the races that took place in a given year.
@@ -76,6 +101,21 @@ class ClientProtocol(Protocol):
         """
         ...
 
+    def get_race_summaries_by_year(self, year: int, **kwargs) -> Generator[RaceSummary]:
+        """
+        Find the metadata of the races that took place in a given year using only the races listing.
+
+        Datasources whose listing doesn't cover past seasons (LGT) fall back to the details page of every race of the
+        season, one request per race instead of a single one.
+
+        Args:
+            year (int): The year for which find the races.
+            **kwargs: Additional keyword arguments.
+
+        Yields: RaceSummary: Race summaries.
+        """
+        ...
+
     def get_race_ids_by_year(self, year: int, **kwargs) -> Generator[str]:
         """
         Find the IDs of the races that took place in a given year.
@@ -101,6 +141,22 @@ class ClientProtocol(Protocol):
         """
         ...
 
+    def get_race_ids_by_date_range(self, start: date, end: date, **kwargs) -> Generator[str]:
+        """
+        Find the IDs of the races that took place between two days, both included.
+
+        Past seasons are found with 'get_race_summaries_by_year', so they cost one request per race in the datasources
+        without a listing for them (LGT).
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range, can be from a later year than 'start'.
+            **kwargs: Additional keyword arguments.
+
+        Yields: str: Race IDs.
+        """
+        ...
+
     def get_last_weekend_race_ids(self, **kwargs) -> Generator[str]:
         """
         Find the IDs for the races that took place the last weekend.
@@ -14,7 +14,7 @@ class ACTClient(Client, source=Datasource.ACT):
 
     @property
     def _html_parser(self) -> ACTHtmlParser:
-        return ACTHtmlParser()
+        return ACTHtmlParser.instance()
 
     @override
     def get_race_details_url(self, race_id: str, *, is_female: bool = False, **_) -> str:
@@ -16,7 +16,7 @@ class ARCClient(Client, source=Datasource.ARC):
 
     @property
     def _html_parser(self) -> ARCHtmlParser:
-        return ARCHtmlParser()
+        return ARCHtmlParser.instance()
 
     @override
     def _is_valid_gender(self, gender: str) -> bool:
@@ -16,7 +16,7 @@ class ETEClient(Client, source=Datasource.ETE):
 
     @property
     def _html_parser(self) -> ETEHtmlParser:
-        return ETEHtmlParser()
+        return ETEHtmlParser.instance()
 
     @override
     def _is_valid_gender(self, gender: str) -> bool:
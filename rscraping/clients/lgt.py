@@ -1,18 +1,21 @@
+import logging
 import re
+import threading
 from collections.abc import Generator
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import override
 
-import requests
 from parsel.selector import Selector
 
 from pyutils.strings import whitespaces_clean
-from rscraping.data.constants import HTTP_HEADERS
-from rscraping.data.models import Datasource, Race, RaceName
+from rscraping.data.constants import DATE_FORMAT
+from rscraping.data.models import Datasource, Race, RaceName, RacePage, RaceSummary, RaceView
 from rscraping.parsers.html import LGTHtmlParser
 
 from ._client import Client
 
+logger = logging.getLogger(__name__)
+
 
 class LGTClient(Client, source=Datasource.LGT):
     # fmt: off
@@ -28,24 +31,27 @@ class LGTClient(Client, source=Datasource.LGT):
 
     @property
     def _html_parser(self) -> LGTHtmlParser:
-        return LGTHtmlParser()
+        return LGTHtmlParser.instance()
 
     @override
     def get_race_details_url(self, race_id: str, **_) -> str:
         return f"https://www.ligalgt.com/principal/regata/{race_id}"
 
     def get_results_selector(self, race_id: str) -> Selector:
+        return Selector(self.get_results_content(race_id).decode("utf-8"))
+
+    def get_results_content(self, race_id: str) -> bytes:
         if race_id in self._excluded_ids:
             raise ValueError(f"Invalid {race_id=}")
         url = "https://www.ligalgt.com/ajax/principal/ver_resultados.php"
         data = {"liga_id": 1, "regata_id": race_id}
-        return Selector(requests.post(url=url, headers=HTTP_HEADERS(), data=data).content.decode("utf-8"))
+        return self._fetch(url, data=data).content
 
-    @staticmethod
-    def get_calendar_selector() -> Selector:
+    @classmethod
+    def get_calendar_selector(cls) -> Selector:
         url = "https://www.ligalgt.com/ajax/principal/regatas.php"
         data = {"lng": "es"}
-        return Selector(requests.post(url=url, headers=HTTP_HEADERS(), data=data).content.decode("utf-8"))
+        return Selector(cls._fetch(url, data=data).content.decode("utf-8"))
 
     @override
     def validate_url(self, url: str):
@@ -68,6 +74,14 @@ class LGTClient(Client, source=Datasource.LGT):
         kwargs["results_selector"] = self.get_results_selector(race_id)
         return super().get_race_by_id(race_id, **kwargs)
 
+    @override
+    def get_race_view_by_id(self, race_id: str, **kwargs) -> RaceView | None:
+        if race_id in self._excluded_ids:
+            return None
+
+        kwargs["results_selector"] = self.get_results_selector(race_id)
+        return super().get_race_view_by_id(race_id, **kwargs)
+
     @override
     def get_race_by_url(self, url: str, race_id: str, **kwargs):
         if race_id in self._excluded_ids:
@@ -76,6 +90,12 @@ class LGTClient(Client, source=Datasource.LGT):
         kwargs["results_selector"] = self.get_results_selector(race_id)
         return super().get_race_by_url(url, race_id, **kwargs)
 
+    @override
+    def get_race_page(self, race_id: str, **kwargs) -> RacePage:
+        page = super().get_race_page(race_id, **kwargs)
+        page.results = self.get_results_content(race_id)
+        return page
+
     @override
     def get_race_names_by_year(self, year: int, **_) -> Generator[RaceName]:
         today = date.today().year
@@ -87,11 +107,35 @@ class LGTClient(Client, source=Datasource.LGT):
 
         for id in self.get_race_ids_by_year(year, is_female=self.is_female):
             url = self.get_race_details_url(id)
-            selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+            selector = Selector(self._fetch(url).content.decode("utf-8"))
             if self._html_parser.is_valid_race(selector):
                 name = self._html_parser.get_name(selector)
                 yield RaceName(race_id=id, name=whitespaces_clean(name).upper())
 
+    @override
+    def get_race_summaries_by_year(self, year: int, **_) -> Generator[RaceSummary]:
+        """
+        The calendar only lists the current season, older ones need the details page of each race: one request per
+        race ID of the season (see 'get_race_ids_by_year').
+        """
+        if date.today().year == year:
+            yield from self._html_parser.parse_race_summaries(selector=self.get_calendar_selector(), year=year)
+            return
+
+        logger.info(f"{self.DATASOURCE}: {year} is not in the calendar, fetching the details page of each race")
+        for id in self.get_race_ids_by_year(year, is_female=self.is_female):
+            url = self.get_race_details_url(id)
+            selector = Selector(self._fetch(url).content.decode("utf-8"))
+            if self._html_parser.is_valid_race(selector):
+                name = self._html_parser.get_name(selector)
+                yield RaceSummary(
+                    datasource=self.DATASOURCE.value,
+                    race_id=id,
+                    name=name,
+                    date=self._html_parser.get_date(selector).strftime(DATE_FORMAT),
+                    gender=self._html_parser.get_gender(name, self._html_parser.get_league(selector)),
+                )
+
     @override
     def get_race_ids_by_year(self, year: int, **_) -> Generator[str]:
         """
@@ -152,37 +196,46 @@ class LGTClient(Client, source=Datasource.LGT):
         yield from (str(r) for r in range(lower_race_id, (upper_race_id + 1)) if r not in self._excluded_ids)
 
     @override
-    def get_last_weekend_race_ids(self, **kwargs) -> Generator[str]:
-        today = datetime.today()
-        last_saturday = today - timedelta(days=(today.weekday() + 1) % 7 + 1)
-        last_sunday = today - timedelta(days=(today.weekday()) % 7 + 1)
-
-        yield from self._html_parser.parse_race_ids_by_days(
-            selector=self.get_calendar_selector(),
-            is_female=self.is_female,
-            days=[
-                datetime.combine(last_saturday.date(), datetime.min.time()),
-                datetime.combine(last_sunday.date(), datetime.min.time()),
-            ],
-            **kwargs,
-        )
+    def get_race_ids_by_date_range(self, start: date, end: date, **kwargs) -> Generator[str]:
+        """
+        The calendar only lists the current season, the races of the previous ones are found by their details pages.
+        """
+        if start > end:
+            raise ValueError(f"invalid range, {start=} is after {end=}")
+
+        season_start = date(date.today().year, 1, 1)
+        if start < season_start:
+            last_day = min(end, season_start - timedelta(days=1))
+            for year in range(start.year, last_day.year + 1):
+                yield from (
+                    s.race_id
+                    for s in self.get_race_summaries_by_year(year)
+                    if s.parsed_date and start <= s.parsed_date <= last_day
+                )
+        if end >= season_start:
+            yield from super().get_race_ids_by_date_range(max(start, season_start), end, **kwargs)
+
+    @override
+    def _fetch_listing(self, year: int) -> list[Selector]:
+        return [self.get_calendar_selector()]
 
     ####################################################
     #                      UTILS                       #
     ####################################################
 
+    # shared by every client instance, the lock keeps it consistent when clients are used from several threads
     _RACE_YEARS: dict[str, int | None] = {}
+    _RACE_YEARS_LOCK = threading.Lock()
 
     def _get_race_year(self, race_id: str) -> int | None:
-        if race_id in self._RACE_YEARS:
-            return self._RACE_YEARS[race_id]
+        with self._RACE_YEARS_LOCK:
+            if race_id in self._RACE_YEARS:
+                return self._RACE_YEARS[race_id]
 
         url = self.get_race_details_url(race_id)
-        selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).text)
-        if not self._html_parser.is_valid_race(selector):
-            self._RACE_YEARS[race_id] = None
-            return None
-        race_year = self._html_parser.get_date(selector).year
+        selector = Selector(self._fetch(url).text)
+        race_year = self._html_parser.get_date(selector).year if self._html_parser.is_valid_race(selector) else None
 
-        self._RACE_YEARS[race_id] = race_year
+        with self._RACE_YEARS_LOCK:
+            self._RACE_YEARS[race_id] = race_year
         return race_year
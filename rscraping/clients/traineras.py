@@ -3,7 +3,6 @@ import re
 from collections.abc import Generator
 from typing import override
 
-import requests
 from parsel.selector import Selector
 
 from rscraping.data.constants import (
@@ -17,9 +16,8 @@ from rscraping.data.constants import (
     GENDER_MALE,
     GENDER_MIX,
     GENDERS,
-    HTTP_HEADERS,
 )
-from rscraping.data.models import Club, Datasource, Race, RaceName
+from rscraping.data.models import Club, Datasource, Race, RaceName, RaceSummary, RaceView
 from rscraping.parsers.html import TrainerasHtmlParser
 
 from ._client import Client
@@ -51,7 +49,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
     @property
     @override
     def _html_parser(self) -> TrainerasHtmlParser:
-        return TrainerasHtmlParser()
+        return TrainerasHtmlParser.instance()
 
     @override
     def _is_valid_gender(self, gender: str) -> bool:
@@ -107,7 +105,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         categories = CATEGORIES if self._category == CATEGORY_ALL else [self._category]
 
         url = self.get_flag_url(flag_id)
-        content = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+        content = Selector(self._fetch(url).content.decode("utf-8"))
 
         for gender, category in itertools.product(genders, categories):
             yield from self._html_parser.parse_flag_race_ids(content, gender=gender, category=category)
@@ -125,12 +123,20 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         Returns: Race | None: The parsed race details or None if the race is not found.
         """
         race = super().get_race_by_id(race_id, **kwargs)
-        if not race:
-            return None
+        return self._set_flag_edition(race) if race else None
 
+    @override
+    def get_race_view_by_id(self, race_id: str, **kwargs) -> RaceView | None:
+        view = super().get_race_view_by_id(race_id, **kwargs)
+        if view:
+            load = view.loader
+            view.loader = lambda: self._set_flag_edition(load())
+        return view
+
+    def _set_flag_edition(self, race: Race) -> Race:
         # search the race name in the flags seach page
         url = self.get_search_races_url(race.name)
-        content = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+        content = Selector(self._fetch(url).content.decode("utf-8"))
         flag_urls = self._html_parser.parse_searched_flag_urls(content)
 
         if len(flag_urls) < 1:
@@ -141,7 +147,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
             raise ValueError("GENDER_ALL not supported in get_race_by_id method")
 
         # the first flag should be an exact match of the given one, so we can use it to get the editions
-        content = Selector(requests.get(url=flag_urls[0], headers=HTTP_HEADERS()).content.decode("utf-8"))
+        content = Selector(self._fetch(flag_urls[0]).content.decode("utf-8"))
         editions = self._html_parser.parse_flag_editions(content, gender=gender, category=self._category)
         edition = next((e for (y, e) in editions if y == race.year), None)
         if edition:
@@ -155,6 +161,12 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
         for page in self._get_pages(year):
             yield from self._html_parser.parse_race_names(page)
 
+    @override
+    def get_race_summaries_by_year(self, year: int, **_) -> Generator[RaceSummary]:
+        self.validate_year(year)
+        for page in self._get_pages(year):
+            yield from self._html_parser.parse_race_summaries(page)
+
     @override
     def get_race_ids_by_year(self, year: int, **_) -> Generator[str]:
         self.validate_year(year)
@@ -163,7 +175,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
 
     @override
     def get_race_ids_by_club(self, club_id: str, year: int, **kwargs) -> Generator[str]:
-        response = requests.get(url=self.get_club_races_url(club_id, year), headers=HTTP_HEADERS())
+        response = self._fetch(self.get_club_races_url(club_id, year))
         response.raise_for_status()
         yield from self._html_parser.parse_club_race_ids(Selector(response.content.decode("utf-8")))
 
@@ -177,13 +189,17 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
 
         Yields: str: Race IDs associated with the rower.
         """
-        content = requests.get(url=self.get_rower_url(rower_id), headers=HTTP_HEADERS()).content.decode("utf-8")
+        content = self._fetch(self.get_rower_url(rower_id)).content.decode("utf-8")
         yield from self._html_parser.parse_rower_race_ids(Selector(content), year=year)
 
     def get_club_details_by_url(self, url: str, **kwargs) -> Club | None:
-        selector = Selector(requests.get(url=url, headers=HTTP_HEADERS()).content.decode("utf-8"))
+        selector = Selector(self._fetch(url).content.decode("utf-8"))
         return self._html_parser.parse_club_details(selector, **kwargs)
 
+    @override
+    def _fetch_listing(self, year: int) -> list[Selector]:
+        return list(self._get_pages(year))
+
     def _get_pages(self, year: int) -> Generator[Selector]:
         """
         Generate Selector objects for each page of races in a specific year.
@@ -196,7 +212,7 @@ class TrainerasClient(Client, source=Datasource.TRAINERAS):
 
         def get_page_selector(page: int) -> Selector:
             url = self.get_races_url(year, page=page)
-            content = requests.get(url, headers=HTTP_HEADERS()).content.decode("utf-8")
+            content = self._fetch(url).content.decode("utf-8")
             return Selector(content)
 
         first_page = get_page_selector(1)
@@ -0,0 +1,276 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from enum import StrEnum, auto
+from queue import Empty, PriorityQueue, Queue
+
+from rscraping.clients import Client, TrainerasClient
+from rscraping.data.constants import GENDER_MALE
+from rscraping.data.models import Datasource, Race
+from rscraping.parsers.html import MultiRaceException
+
+logger = logging.getLogger(__name__)
+
+
+class JobType(StrEnum):
+    SEASON = auto()
+    RACE = auto()
+    FLAG = auto()
+    CLUB = auto()
+
+
+@dataclass
+class CrawlJob:
+    """
+    Unit of work of the crawler, 'target' is the year for SEASON jobs and the race, flag or club ID for the others.
+    """
+
+    type: str
+    datasource: str
+    target: str
+    year: int | None = None
+    gender: str = GENDER_MALE
+
+    @property
+    def key(self) -> str:
+        return f"{self.type}:{self.datasource}:{self.gender}:{self.target}:{self.year or ''}"
+
+
+@dataclass
+class SourceLimits:
+    concurrency: int = 1
+    delay: float = 1.0  # minimum seconds between the start of two jobs of the same datasource
+
+
+@dataclass
+class CrawlReport:
+    done: int = 0
+    races: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+type JobHandler = Callable[[CrawlJob], tuple[list[Race], list[CrawlJob]]]
+
+
+def run_job(job: CrawlJob) -> tuple[list[Race], list[CrawlJob]]:
+    """
+    Default job handler, returns the retrieved races and the follow-up jobs.
+
+    1. SEASON: race jobs for every race of the year
+    2. RACE: the race details
+    3. FLAG: race jobs for every edition of a traineras.es flag
+    4. CLUB: race jobs for every race of the club in the year
+    """
+    client = Client(source=Datasource(job.datasource), gender=job.gender)
+
+    def race_jobs(race_ids: Iterable[str], year: int | None) -> list[CrawlJob]:
+        return [CrawlJob(JobType.RACE, job.datasource, r, year=year, gender=job.gender) for r in race_ids]
+
+    match job.type:
+        case JobType.SEASON:
+            return [], race_jobs(client.get_race_ids_by_year(int(job.target)), year=int(job.target))
+        case JobType.RACE:
+            try:
+                race = client.get_race_by_id(job.target)
+            except MultiRaceException:
+                logger.warning(f"{job.datasource}: skipping multi race {job.target}")
+                race = None
+            return ([race] if race else []), []
+        case JobType.FLAG:
+            if not isinstance(client, TrainerasClient):
+                raise ValueError(f"{job.datasource}: flags are only available in traineras")
+            return [], race_jobs(client.get_race_ids_by_flag(job.target), year=None)
+        case JobType.CLUB:
+            if job.year is None:
+                raise ValueError(f"{job.datasource}: 'year' is required for club jobs")
+            return [], race_jobs(client.get_race_ids_by_club(job.target, job.year), year=job.year)
+        case _:
+            raise ValueError(f"invalid job type {job.type}")
+
+
+class _RateLimiter:
+    def __init__(self, delay: float):
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._delay
+        if wait > 0:
+            time.sleep(wait)
+
+
+class CrawlScheduler:
+    """
+    Run crawl jobs for several datasources at the same time. Each datasource has its own priority queue, worker
+    threads and rate limit, so a slow site doesn't hold up the others.
+
+    Jobs of the current season run first, and listing jobs (season, flag, club) before the race jobs they generate.
+    Races are delivered to 'on_race' from the thread calling 'run', so it can safely write to a 'RaceStore'.
+
+    When 'checkpoint_file' is given every queued and completed job is appended to it as a JSON line, and a new
+    scheduler with the same file resumes the crawl skipping the completed jobs. Failed jobs are kept as pending. The
+    file is compacted to the pending jobs and done keys when it's loaded.
+
+    Usage:
+        scheduler = CrawlScheduler(limits={Datasource.LGT: SourceLimits(concurrency=2, delay=0.5)})
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024"))
+        scheduler.run(on_race=lambda race: store.save([race]))
+    """
+
+    def __init__(
+        self,
+        handler: JobHandler = run_job,
+        limits: dict[Datasource, SourceLimits] | None = None,
+        checkpoint_file: str | None = None,
+        current_year: int | None = None,
+    ):
+        self._handler = handler
+        self._limits = limits or {}
+        self._checkpoint_file = checkpoint_file
+        self._current_year = current_year or date.today().year
+
+        self._queues: dict[str, PriorityQueue[tuple[int, int, int, CrawlJob]]] = {}
+        self._pending: dict[str, CrawlJob] = {}
+        self._failed: dict[str, CrawlJob] = {}
+        self._done: set[str] = set()
+        self._sequence = 0
+
+        if checkpoint_file and os.path.isfile(checkpoint_file):
+            self._load_checkpoint(checkpoint_file)
+
+    @property
+    def pending(self) -> list[CrawlJob]:
+        return list(self._pending.values())
+
+    @property
+    def failed(self) -> list[CrawlJob]:
+        return list(self._failed.values())
+
+    def add(self, job: CrawlJob) -> bool:
+        """
+        Queue a job, returns False if it's already done or queued. Failed jobs can be queued again.
+        """
+        if job.key in self._done or job.key in self._pending:
+            return False
+        self._failed.pop(job.key, None)
+
+        self._sequence += 1
+        priority = 0 if job.year == self._current_year or job.target == str(self._current_year) else 1
+        queue = self._queues.setdefault(job.datasource, PriorityQueue())
+        queue.put((priority, job.type == JobType.RACE, self._sequence, job))
+        self._pending[job.key] = job
+        self._save_checkpoint({"job": asdict(job)})
+        return True
+
+    def run(self, on_race: Callable[[Race], None] | None = None) -> CrawlReport:
+        """
+        Run every queued job, and the ones they generate, until there is nothing left to do.
+
+        Parameters:
+        - on_race (Callable[[Race], None] | None): Called with each retrieved race.
+
+        Returns: CrawlReport: Number of completed jobs and retrieved races and the keys of the failed jobs.
+        """
+        report = CrawlReport()
+        results: Queue[tuple[CrawlJob, list[Race], list[CrawlJob], Exception | None]] = Queue()
+        stop = threading.Event()
+        running = set(self._pending.keys())
+
+        threads: dict[str, list[threading.Thread]] = {}
+
+        def start_workers(datasource: str) -> None:
+            if datasource in threads:
+                return
+            limits = self._limits.get(Datasource(datasource), SourceLimits())
+            limiter = _RateLimiter(limits.delay)
+            threads[datasource] = [
+                threading.Thread(
+                    target=self._work, args=(self._queues[datasource], limiter, results, stop), daemon=True
+                )
+                for _ in range(limits.concurrency)
+            ]
+            for thread in threads[datasource]:
+                thread.start()
+
+        for datasource in self._queues.keys():
+            start_workers(datasource)
+
+        try:
+            while running:
+                job, races, jobs, error = results.get()
+                running.discard(job.key)
+                if error:
+                    logger.error(f"{job.datasource}: job {job.key} failed: {error}")
+                    report.failed.append(job.key)
+                    self._failed[job.key] = self._pending.pop(job.key)
+                    continue
+
+                for race in races:
+                    if on_race:
+                        on_race(race)
+                    report.races += 1
+                for new_job in jobs:
+                    if self.add(new_job):
+                        running.add(new_job.key)
+                        start_workers(new_job.datasource)
+
+                self._pending.pop(job.key, None)
+                self._done.add(job.key)
+                report.done += 1
+                self._save_checkpoint({"done": job.key})
+        finally:
+            stop.set()
+            for thread in (t for ts in threads.values() for t in ts):
+                thread.join()
+        return report
+
+    def _work(self, queue: PriorityQueue, limiter: _RateLimiter, results: Queue, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                *_, job = queue.get(timeout=0.1)
+            except Empty:
+                continue
+
+            limiter.wait()
+            try:
+                races, jobs = self._handler(job)
+            except Exception as e:
+                results.put((job, [], [], e))
+            else:
+                results.put((job, races, jobs, None))
+
+    def _save_checkpoint(self, line: dict) -> None:
+        if not self._checkpoint_file:
+            return
+        with open(self._checkpoint_file, "a") as file:
+            file.write(f"{json.dumps(line)}\n")
+            file.flush()
+
+    def _load_checkpoint(self, file_name: str) -> None:
+        jobs: dict[str, CrawlJob] = {}
+        with open(file_name) as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break  # partial line of an interrupted write
+                item = json.loads(line)
+                if "done" in item:
+                    self._done.add(item["done"])
+                else:
+                    job = CrawlJob(**item["job"])
+                    jobs[job.key] = job
+
+        tmp_file_name = f"{file_name}.tmp"
+        with open(tmp_file_name, "w") as file:
+            file.writelines(f"{json.dumps({'done': key})}\n" for key in sorted(self._done))
+        os.replace(tmp_file_name, file_name)
+        for job in jobs.values():
+            self.add(job)
@@ -1,60 +1,99 @@
+from dataclasses import dataclass
 from datetime import date
+from functools import cached_property
 
 from pyutils.strings import remove_symbols
 from rscraping.data.constants import SYNONYM_FEMALE, SYNONYM_MEMORIAL, SYNONYMS
 
 
-def should_be_time_trial(name: str, date: date) -> bool:
+@dataclass(eq=False)
+class TokenizedName:
+    """
+    A name split into words once, so running several checks on it doesn't split it again in each of them.
+
+    Usage:
+        name = tokenize("LIGA GALEGA DE TRAIÑAS A")
+        is_lgt(name, "A") or is_female(name)
+    """
+
+    value: str
+
+    @cached_property
+    def tokens(self) -> frozenset[str]:
+        return frozenset(self.value.split())
+
+    @cached_property
+    def clean_tokens(self) -> frozenset[str]:
+        """
+        Upper case words once the symbols are removed.
+        """
+        return frozenset(remove_symbols(self.value).upper().split())
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.value
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def tokenize(name: str | TokenizedName) -> TokenizedName:
+    return name if isinstance(name, TokenizedName) else TokenizedName(name)
+
+
+def should_be_time_trial(name: str | TokenizedName, date: date) -> bool:
+    name = tokenize(name)
     return (
         is_play_off(name)
-        or (all(w in name.split() for w in ["TERESA", "HERRERA"]) and date.isoweekday() == 6)
-        or (all(w in name.split() for w in ["VILLA", "BILBAO"]))
+        or ({"TERESA", "HERRERA"} <= name.tokens and date.isoweekday() == 6)
+        or ({"VILLA", "BILBAO"} <= name.tokens)
     )
 
 
-def is_play_off(name: str) -> bool:
+def is_play_off(name: str | TokenizedName) -> bool:
     return "PLAY" in name and "OFF" in name
 
 
-def is_memorial(name: str) -> bool:
-    return any(w in name.split() for w in SYNONYMS[SYNONYM_MEMORIAL])
+def is_memorial(name: str | TokenizedName) -> bool:
+    return not tokenize(name).tokens.isdisjoint(SYNONYMS[SYNONYM_MEMORIAL])
 
 
-def is_female(name: str) -> bool:
-    return any(w in name.split() for w in SYNONYMS[SYNONYM_FEMALE])
+def is_female(name: str | TokenizedName) -> bool:
+    return not tokenize(name).tokens.isdisjoint(SYNONYMS[SYNONYM_FEMALE])
 
 
-def is_branch_club(name: str, letter: str = "B") -> bool:
-    clean_name = remove_symbols(name)
-    return any(e == letter for e in clean_name.upper().split())
+def is_branch_club(name: str | TokenizedName, letter: str = "B") -> bool:
+    return letter in tokenize(name).clean_tokens
 
 
-def is_act(name: str, is_female: bool = False) -> bool:
+def is_act(name: str | TokenizedName, is_female: bool = False) -> bool:
+    name = tokenize(name)
     if is_female:
         return "EUSKOTREN" in name
-    return all(w in name.split() for w in ["EUSKO", "LABEL"]) or "ACT" in name.split() or "EUSKOLABEL" in name
+    return {"EUSKO", "LABEL"} <= name.tokens or "ACT" in name.tokens or "EUSKOLABEL" in name
 
 
-def is_lgt(name: str, letter: str | None = None) -> bool:
+def is_lgt(name: str | TokenizedName, letter: str | None = None) -> bool:
+    name = tokenize(name)
     match letter:
         case "A":
-            return all(w in name.split() for w in ["LGT", "A"]) or "LGTA" in name
+            return {"LGT", "A"} <= name.tokens or "LGTA" in name
         case "B":
-            return all(w in name.split() for w in ["LGT", "B"]) or "LGTB" in name
+            return {"LGT", "B"} <= name.tokens or "LGTB" in name
         case "F":
-            return all(w in name.split() for w in ["LGT", "F"]) or "LGTF" in name
+            return {"LGT", "F"} <= name.tokens or "LGTF" in name
         case _:
-            return "LGT" in name.split()
+            return "LGT" in name.tokens
 
 
-def is_arc(name: str, category: int = 1) -> bool:
+def is_arc(name: str | TokenizedName, category: int = 1) -> bool:
+    name = tokenize(name)
     match category:
         case 1:
-            return "2" not in name and any(n in name.split() for n in {"ARC", "ASOCIACIÓN DE REMO DEL CANTÁBRICO"})
+            return "2" not in name and not name.tokens.isdisjoint({"ARC", "ASOCIACIÓN DE REMO DEL CANTÁBRICO"})
         case 2:
-            return any(n in name.split() for n in {"ARC2", "ASOCIACIÓN DE REMO DEL CANTÁBRICO 2"})
+            return not name.tokens.isdisjoint({"ARC2", "ASOCIACIÓN DE REMO DEL CANTÁBRICO 2"})
     raise ValueError(f"Invalid category: {category}")
 
 
-def is_ete(name: str) -> bool:
-    return "ETE" in name.split()
+def is_ete(name: str | TokenizedName) -> bool:
+    return "ETE" in tokenize(name).tokens
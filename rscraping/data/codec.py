@@ -0,0 +1,251 @@
+"""
+Binary race format:
+    header: magic, version, number of strings, size of the strings blob, number of integers
+    string lengths: int32 * number of strings
+    strings blob: utf-8 concatenation of every distinct string
+    integers: int32 stream with the race fields, strings are referenced by their index in the table
+
+Laps that can be represented as centiseconds are stored as them (positive values), the rest as negative string refs.
+"""
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from rscraping.data.laps import centiseconds_to_lap
+from rscraping.data.models import Participant, Penalty, Race
+
+MAGIC = b"RSC"
+VERSION = 1
+
+_HEADER = struct.Struct("<3sBIII")
+_NONE = -(2**31)
+_NO_STR = -1
+
+# LAP_FORMAT laps are split in their 'MM:SS.' and '%f' parts, anything else doesn't round trip through centiseconds
+_LAP_PREFIXES = {centiseconds_to_lap(s * 100)[:6]: s * 100 for s in range(3600)}
+_LAP_SUFFIXES = {centiseconds_to_lap(c)[6:]: c for c in range(100)}
+
+
+class _StringTable(dict[str | None, int]):
+    """
+    Index of each distinct string in order of appearance, None maps to _NO_STR. Lookups of known strings run
+    entirely in C through 'dict.__getitem__'.
+    """
+
+    def __init__(self) -> None:
+        super().__init__({None: _NO_STR})
+
+    def __missing__(self, value: str) -> int:
+        idx = self[value] = len(self) - 1
+        return idx
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings = _StringTable()
+        self.ints = array("i")
+
+    def lap(self, value: str) -> int:
+        prefix, suffix = _LAP_PREFIXES.get(value[:6]), _LAP_SUFFIXES.get(value[6:])
+        if prefix is None or suffix is None:
+            return -(self.strings[value] + 2)
+        return prefix + suffix
+
+    def race(self, race: Race) -> None:
+        ref, lap, ints = self.strings.__getitem__, self.lap, self.ints
+        ints.extend(
+            (
+                ref(race.name),
+                ref(race.date),
+                race.day,
+                ref(race.modality),
+                ref(race.type),
+                ref(race.league),
+                ref(race.town),
+                ref(race.organizer),
+                ref(race.sponsor),
+                ref(race.url),
+                ref(race.datasource),
+                ref(race.gender),
+                ref(race.category),
+                ref(race.race_notes),
+                _optional(race.race_laps),
+                _optional(race.race_lanes),
+                race.cancelled,
+                len(race.normalized_names),
+            )
+        )
+        for name, edition in race.normalized_names:
+            ints.extend((ref(name), _optional(edition)))
+        ints.append(len(race.race_ids))
+        ints.extend(ref(i) for i in race.race_ids)
+
+        ints.append(len(race.participants))
+        for p in race.participants:
+            ints.extend(
+                (
+                    ref(p.gender),
+                    ref(p.category),
+                    ref(p.club_name),
+                    ref(p.participant),
+                    _optional(p.lane),
+                    _optional(p.series),
+                    _optional(p.distance),
+                    ref(p.handicap),
+                    p.retired,
+                    p.absent,
+                    p.guest,
+                    len(p.laps),
+                )
+            )
+            ints.extend(map(lap, p.laps))
+            if p.penalty is None:
+                ints.append(0)
+            else:
+                ints.extend((1, p.penalty.disqualification, ref(p.penalty.reason), p.penalty.penalty))
+
+    def dump(self, count: int) -> bytes:
+        strings = list(self.strings.keys())[1:]  # skip the None entry
+        lengths = array("i", (len(s) for s in strings))
+        ints = array("i", [count]) + self.ints
+        if sys.byteorder == "big":
+            lengths.byteswap()
+            ints.byteswap()
+
+        blob = "".join(strings).encode("utf-8")
+        return b"".join(
+            [_HEADER.pack(MAGIC, VERSION, len(strings), len(blob), len(ints)), lengths.tobytes(), blob, ints.tobytes()]
+        )
+
+
+def _optional(value: int | None) -> int:
+    return _NONE if value is None else value
+
+
+def encode_races(races: Iterable[Race]) -> bytes:
+    """
+    Encode the races into the compact binary format, every distinct string is only stored once for the whole batch.
+
+    Parameters:
+    - races (Iterable[Race]): The races to encode.
+
+    Returns: bytes: The encoded payload.
+    """
+    encoder = _Encoder()
+    count = 0
+    for race in races:
+        encoder.race(race)
+        count += 1
+    return encoder.dump(count)
+
+
+def encode_race(race: Race) -> bytes:
+    return encode_races([race])
+
+
+def decode_races(data: bytes) -> list[Race]:
+    """
+    Decode a payload created with 'encode_races'.
+
+    Parameters:
+    - data (bytes): The encoded payload.
+
+    Returns: list[Race]: The decoded races.
+
+    Raises: ValueError: If the payload is not a known version of the format.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated payload")
+    magic, version, strings_count, blob_size, ints_count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("invalid race payload")
+    if version != VERSION:
+        raise ValueError(f"unsupported race payload {version=}")
+
+    offset = _HEADER.size
+    lengths = array("i")
+    lengths.frombytes(data[offset : offset + strings_count * lengths.itemsize])
+    offset += strings_count * lengths.itemsize
+    text = data[offset : offset + blob_size].decode("utf-8")
+    offset += blob_size
+    ints = array("i")
+    ints.frombytes(data[offset : offset + ints_count * ints.itemsize])
+    if sys.byteorder == "big":
+        lengths.byteswap()
+        ints.byteswap()
+
+    # typed as Any as the trailing None is only reachable from optional fields
+    strings: list[Any] = []
+    position = 0
+    for length in lengths:
+        strings.append(text[position : position + length])
+        position += length
+    strings.append(None)  # _NO_STR refs (-1) point to the last element
+
+    read = iter(ints).__next__
+
+    def optional() -> int | None:
+        value = read()
+        return None if value == _NONE else value
+
+    def lap(value: int) -> str:
+        return centiseconds_to_lap(value) if value >= 0 else strings[-value - 2]
+
+    races = []
+    try:
+        for _ in range(read()):
+            race = Race(
+                name=strings[read()],
+                date=strings[read()],
+                day=read(),
+                modality=strings[read()],
+                type=strings[read()],
+                league=strings[read()],
+                town=strings[read()],
+                organizer=strings[read()],
+                sponsor=strings[read()],
+                url=strings[read()],
+                datasource=strings[read()],
+                gender=strings[read()],
+                category=strings[read()],
+                race_notes=strings[read()],
+                race_laps=optional(),
+                race_lanes=optional(),
+                cancelled=bool(read()),
+                normalized_names=[(strings[read()], optional()) for _ in range(read())],
+                race_ids=[strings[read()] for _ in range(read())],
+                participants=[],
+            )
+            for _ in range(read()):
+                participant = Participant(
+                    gender=strings[read()],
+                    category=strings[read()],
+                    club_name=strings[read()],
+                    participant=strings[read()],
+                    lane=optional(),
+                    series=optional(),
+                    distance=optional(),
+                    handicap=strings[read()],
+                    retired=bool(read()),
+                    absent=bool(read()),
+                    guest=bool(read()),
+                    laps=[lap(read()) for _ in range(read())],
+                    race=race,
+                )
+                if read():
+                    participant.penalty = Penalty(disqualification=bool(read()), reason=strings[read()], penalty=read())
+                race.participants.append(participant)
+            races.append(race)
+    except StopIteration:
+        raise ValueError("truncated payload") from None
+    return races
+
+
+def decode_race(data: bytes) -> Race:
+    races = decode_races(data)
+    if len(races) != 1:
+        raise ValueError(f"expected one race but found {len(races)}")
+    return races[0]
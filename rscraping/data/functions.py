@@ -1,10 +1,59 @@
 import csv
+import json
 import os
 import sys
-from typing import Any
+from collections.abc import Generator, Iterable
+from dataclasses import fields
+from datetime import date
+from typing import Any, TextIO
 
+from rscraping.data.laps import NO_TIME, LapMatrix
 from rscraping.data.models import Race
 
+# column types of the tables written by 'save_tables', every column is nullable
+RACES_TABLE_SCHEMA = {
+    "race_key": "string",
+    "datasource": "string",
+    "race_id": "string",
+    "day": "int",
+    "date": "date",
+    "year": "int",
+    "name": "string",
+    "normalized_name": "string",
+    "edition": "int",
+    "type": "string",
+    "modality": "string",
+    "league": "string",
+    "town": "string",
+    "organizer": "string",
+    "sponsor": "string",
+    "gender": "string",
+    "category": "string",
+    "race_laps": "int",
+    "race_lanes": "int",
+    "cancelled": "bool",
+    "url": "string",
+}
+PARTICIPANTS_TABLE_SCHEMA = {
+    "race_key": "string",
+    "participant": "string",
+    "club_name": "string",
+    "gender": "string",
+    "category": "string",
+    "lane": "int",
+    "series": "int",
+    "distance": "int",
+    "handicap": "string",
+    "retired": "bool",
+    "absent": "bool",
+    "guest": "bool",
+    "disqualified": "bool",
+    "penalty_reason": "string",
+    "penalty": "int",
+    "laps": "list[int]",
+    "final_time": "int",
+}
+
 
 def expand_path(
     path: str, valid_files: list[str]
@@ -23,9 +72,134 @@ def save_csv(items: list[Race], file_name: str) -> None:  # pragma: no cover - u
     file_name = file_name if ".csv" in file_name else f"{file_name}.csv"
     with open(file_name, "w") as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(items[0].__dict__.keys())  # write headers
+        headers = [f.name for f in fields(items[0]) if f.init]
+        writer.writerow(headers)
         for item in items:
-            writer.writerow(item.__dict__.values())
+            writer.writerow(getattr(item, h) for h in headers)
+
+
+def save_tables(items: Iterable[Race | None], file_name: str, batch_size: int = 500) -> int:
+    """
+    Export the races as two columnar tables, '<file_name>_races.columns.ndjson' and
+    '<file_name>_participants.columns.ndjson', joined by the 'race_key' column. The first line of each table is its
+    schema (see RACES_TABLE_SCHEMA and PARTICIPANTS_TABLE_SCHEMA) and every following line is a row group: an object
+    with one typed array per column. Laps are stored as a list of centiseconds plus a 'final_time' column.
+
+    Row groups of 'batch_size' races are written while consuming the given iterable.
+
+    Parameters:
+    - items (Iterable[Race | None]): The races to save, None values are skipped.
+    - file_name (str): The base name of the tables.
+    - batch_size (int): Number of races in each row group (default: 500).
+
+    Returns: int: The number of saved races.
+    """
+    saved = 0
+    with (
+        open(_table_file_name(file_name, "races"), "w") as races_file,
+        open(_table_file_name(file_name, "participants"), "w") as participants_file,
+    ):
+        races_file.write(f"{json.dumps({'schema': RACES_TABLE_SCHEMA})}\n")
+        participants_file.write(f"{json.dumps({'schema': PARTICIPANTS_TABLE_SCHEMA})}\n")
+
+        races: list[tuple[Any, ...]] = []
+        participants: list[tuple[Any, ...]] = []
+        for race in items:
+            if race is None:
+                continue
+            races.append(_race_row(race))
+            participants.extend(_participant_rows(race))
+            saved += 1
+
+            if len(races) >= batch_size:
+                _write_row_group(races_file, RACES_TABLE_SCHEMA, races)
+                _write_row_group(participants_file, PARTICIPANTS_TABLE_SCHEMA, participants)
+                races, participants = [], []
+
+        _write_row_group(races_file, RACES_TABLE_SCHEMA, races)
+        _write_row_group(participants_file, PARTICIPANTS_TABLE_SCHEMA, participants)
+    return saved
+
+
+def load_table(file_name: str, table: str) -> Generator[dict[str, list[Any]]]:
+    """
+    Lazily read the row groups of a table written by 'save_tables', with the 'date' columns parsed.
+
+    Parameters:
+    - file_name (str): The base name of the tables.
+    - table (str): The table to read, 'races' or 'participants'.
+
+    Yields: dict[str, list[Any]]: The columns of each row group.
+    """
+    with open(_table_file_name(file_name, table)) as file:
+        schema: dict[str, str] = json.loads(next(file))["schema"]
+        dates = [name for name, kind in schema.items() if kind == "date"]
+        for line in file:
+            columns = json.loads(line)
+            for name in dates:
+                columns[name] = [date.fromisoformat(v) if v else None for v in columns[name]]
+            yield columns
+
+
+def _write_row_group(file: TextIO, schema: dict[str, str], rows: list[tuple[Any, ...]]) -> None:
+    if rows:
+        file.write(f"{json.dumps(dict(zip(schema, map(list, zip(*rows, strict=True)), strict=True)))}\n")
+
+
+def _table_file_name(file_name: str, table: str) -> str:
+    return f"{file_name}_{table}.columns.ndjson"
+
+
+def _race_row(race: Race) -> tuple[Any, ...]:
+    name, edition = race.normalized_names[0] if race.normalized_names else (None, None)
+    return (
+        race.key,
+        race.datasource,
+        race.race_ids[0],
+        race.day,
+        race.parsed_date.isoformat(),
+        race.year,
+        race.name,
+        name,
+        edition,
+        race.type,
+        race.modality,
+        race.league,
+        race.town,
+        race.organizer,
+        race.sponsor,
+        race.gender,
+        race.category,
+        race.race_laps,
+        race.race_lanes,
+        race.cancelled,
+        race.url,
+    )
+
+
+def _participant_rows(race: Race) -> Generator[tuple[Any, ...]]:
+    laps = LapMatrix.from_race(race)
+    final_times = laps.final_times()
+    for i, p in enumerate(race.participants):
+        yield (
+            race.key,
+            p.participant,
+            p.club_name,
+            p.gender,
+            p.category,
+            p.lane,
+            p.series,
+            p.distance,
+            p.handicap,
+            p.retired,
+            p.absent,
+            p.guest,
+            p.penalty.disqualification if p.penalty else False,
+            p.penalty.reason if p.penalty else None,
+            p.penalty.penalty if p.penalty else 0,
+            [t for t in laps.row(i) if t != NO_TIME],
+            final_times[i] if final_times[i] != NO_TIME else None,
+        )
 
 
 def sys_print_items(items: list[Any]) -> None:  # pragma: no cover - util functions not needing testing
@@ -37,3 +211,83 @@ def sys_print_items(items: list[Any]) -> None:  # pragma: no cover - util functi
             sys.stdout.write(",")
     sys.stdout.write("]\n")
     sys.stdout.flush()
+
+
+def save_ndjson(items: Iterable[Race | None], file_name: str, append: bool = True) -> int:
+    """
+    Stream the races into a NDJSON file, one race (with its participants) per line. Each line is flushed as soon as it
+    is written so an interrupted export keeps every completed race and can be resumed appending to the same file.
+
+    Parameters:
+    - items (Iterable[Race | None]): The races to save, None values are skipped.
+    - file_name (str): The file to write.
+    - append (bool): Whether to append to an existing file (default: True).
+
+    Returns: int: The number of saved races.
+    """
+    file_name = _ndjson_file_name(file_name)
+    if append:
+        _truncate_partial_line(file_name)
+
+    saved = 0
+    with open(file_name, "a" if append else "w") as file:
+        for race in items:
+            if race is None:
+                continue
+            file.write(f"{race.to_json()}\n")
+            file.flush()
+            saved += 1
+    return saved
+
+
+def load_ndjson(file_name: str) -> Generator[Race]:
+    """
+    Lazily read the races of a NDJSON file, keeping only one line in memory. A truncated last line, left by an
+    interrupted export, is ignored.
+
+    Parameters:
+    - file_name (str): The file to read.
+
+    Yields: Race: The saved races.
+    """
+    with open(_ndjson_file_name(file_name)) as file:
+        for line in file:
+            if line.endswith("\n") and line.strip():
+                yield Race.from_json(line)
+
+
+def load_ndjson_race_ids(file_name: str) -> set[str]:
+    """
+    Find the IDs of the races already saved in a NDJSON file, used to skip them when resuming an export.
+    """
+    file_name = _ndjson_file_name(file_name)
+    if not os.path.exists(file_name):
+        return set()
+    with open(file_name) as file:
+        return {i for line in file if line.endswith("\n") and line.strip() for i in json.loads(line)["race_ids"]}
+
+
+def _ndjson_file_name(file_name: str) -> str:
+    return file_name if file_name.endswith(".ndjson") else f"{file_name}.ndjson"
+
+
+def _truncate_partial_line(file_name: str, chunk_size: int = 4096) -> None:
+    if not os.path.exists(file_name):
+        return
+    with open(file_name, "rb+") as file:
+        position = file.seek(0, os.SEEK_END)
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            file.seek(position)
+            idx = file.read(step).rfind(b"\n")
+            if idx >= 0:
+                file.truncate(position + idx + 1)
+                return
+        file.truncate(0)
+
+
+def sys_print_ndjson(items: Iterable[Any]) -> None:  # pragma: no cover - util functions not needing testing
+    for item in items:
+        sys.stdout.write(f"{item}\n")
+        sys.stdout.flush()
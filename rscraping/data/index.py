@@ -0,0 +1,293 @@
+import json
+import os
+from bisect import insort
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Self
+
+from pyutils.strings import remove_symbols, unaccent, whitespaces_clean
+from rscraping.data.constants import GENDER_FEMALE, GENDER_MALE
+from rscraping.data.models import Race, RaceName
+
+if TYPE_CHECKING:
+    from rscraping.clients import Client
+
+
+@dataclass
+class ParticipantEntry:
+    race: str  # Race.key
+    date: str  # ISO date, so entries sort by date
+    gender: str
+    category: str
+    lane: int | None
+    series: int | None
+    time: str | None  # last lap
+
+
+class ParticipantIndex:
+    """
+    Inverted index from the normalized participant name to its results, grouped by year.
+
+    Races can be added as they are parsed ('add' replaces the entries of a race added before), so it can be filled
+    while crawling and persisted between runs.
+
+    Usage:
+        index = ParticipantIndex.load("participants.json")
+        scheduler.run(on_race=index.add)
+        index.get_entries("ORIO", year=2024)
+        index.save("participants.json")
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[int, list[ParticipantEntry]]] = {}
+        self._races: dict[str, set[str]] = {}  # race key -> participants, to replace re-added races
+
+    def __len__(self) -> int:
+        return len(self._races)
+
+    def __contains__(self, race_key: str) -> bool:
+        return race_key in self._races
+
+    @property
+    def participants(self) -> list[str]:
+        return sorted(self._entries.keys())
+
+    def add(self, race: Race) -> None:
+        self.remove(race.key)
+        iso_date = race.parsed_date.isoformat()
+        for participant in race.participants:
+            entry = ParticipantEntry(
+                race=race.key,
+                date=iso_date,
+                gender=participant.gender,
+                category=participant.category,
+                lane=participant.lane,
+                series=participant.series,
+                time=participant.laps[-1] if participant.laps else None,
+            )
+            self._insert(participant.participant, race.year, entry)
+        self._races[race.key] = {p.participant for p in race.participants}
+
+    def add_all(self, races: Iterable[Race | None]) -> None:
+        for race in races:
+            if race is not None:
+                self.add(race)
+
+    def remove(self, race_key: str) -> None:
+        for participant in self._races.pop(race_key, set()):
+            years = self._entries[participant]
+            for year in list(years.keys()):
+                years[year] = [e for e in years[year] if e.race != race_key]
+                if not years[year]:
+                    del years[year]
+            if not years:
+                del self._entries[participant]
+
+    def get_entries(self, participant: str, year: int | None = None) -> list[ParticipantEntry]:
+        """
+        Results of the participant sorted by date, all of them or only the ones of the given year.
+        """
+        years = self._entries.get(participant, {})
+        if year is not None:
+            return list(years.get(year, []))
+        return [e for y in sorted(years.keys()) for e in years[y]]
+
+    def get_race_keys(self, participant: str, year: int | None = None) -> list[str]:
+        return list(dict.fromkeys(e.race for e in self.get_entries(participant, year)))
+
+    def get_years(self, participant: str) -> list[int]:
+        return sorted(self._entries.get(participant, {}).keys())
+
+    def save(self, file_name: str) -> None:
+        tmp_file_name = f"{file_name}.tmp"
+        with open(tmp_file_name, "w") as file:
+            entries = {
+                participant: {str(year): [asdict(e) for e in entries] for year, entries in sorted(years.items())}
+                for participant, years in sorted(self._entries.items())
+            }
+            json.dump(entries, file, ensure_ascii=False)
+        os.replace(tmp_file_name, file_name)
+
+    @classmethod
+    def load(cls, file_name: str) -> Self:
+        """
+        Load a saved index, an empty one if the file doesn't exist.
+        """
+        index = cls()
+        if not os.path.isfile(file_name):
+            return index
+        with open(file_name) as file:
+            for participant, years in json.load(file).items():
+                for year, entries in years.items():
+                    for entry in entries:
+                        index._insert(participant, int(year), ParticipantEntry(**entry))
+                        index._races.setdefault(entry["race"], set()).add(participant)
+        return index
+
+    def _insert(self, participant: str, year: int, entry: ParticipantEntry) -> None:
+        insort(self._entries.setdefault(participant, {}).setdefault(year, []), entry, key=lambda e: e.date)
+
+
+@dataclass
+class RaceNameEntry:
+    datasource: str
+    gender: str
+    race_id: str
+    name: str
+    year: int | None = None
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.datasource, self.gender, self.race_id
+
+
+class RaceNameIndex:
+    """
+    Local fuzzy search over the race names listed by the datasources, so a race can be found by its name without
+    asking the datasources' search pages.
+
+    Names are unaccented, cleaned of symbols and split into trigrams, a search scores the indexed names sharing a
+    trigram with the query using the Dice coefficient. Trigrams present in too many names ("BAN", "DER", " DE") are not
+    used to find the candidates, unless the query has nothing else, so a search doesn't scan the whole index.
+
+    Usage:
+        index = RaceNameIndex.load("race_names.json")
+        index.update(Client(source=Datasource.ACT), 2024)
+        index.search("BANDERA DE ORIO", limit=5)
+        index.save("race_names.json")
+    """
+
+    def __init__(self, max_gram_entries: int = 256) -> None:
+        """
+        Parameters:
+        - max_gram_entries (int): Trigrams in more names are too common to find the search candidates (default: 256).
+        """
+        self._max_gram_entries = max_gram_entries
+
+        self._entries: list[RaceNameEntry | None] = []  # removed entries are left as None
+        self._entry_grams: list[frozenset[str]] = []
+        self._keys: dict[tuple[str, str, str], int] = {}
+        self._grams: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, entry: RaceNameEntry) -> None:
+        """
+        Index the entry, replacing the one with the same (datasource, gender, race_id) if any.
+        """
+        idx = self._keys.get(entry.key)
+        if idx is None:
+            idx = self._keys[entry.key] = len(self._entries)
+            self._entries.append(None)
+            self._entry_grams.append(frozenset())
+        else:
+            self._unindex(idx)
+
+        grams = frozenset(_trigrams(entry.name))
+        self._entries[idx], self._entry_grams[idx] = entry, grams
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(idx)
+
+    def remove(self, key: tuple[str, str, str]) -> None:
+        idx = self._keys.pop(key, None)
+        if idx is not None:
+            self._unindex(idx)
+            self._entries[idx] = None
+
+    def update(self, client: "Client", year: int) -> int:
+        """
+        Re-index the race names listed by the client for the given year, names no longer listed are removed.
+
+        Returns: int: The number of indexed names.
+        """
+        datasource, gender = str(client.DATASOURCE), GENDER_FEMALE if client.is_female else GENDER_MALE
+        race_names: list[RaceName] = list(client.get_race_names_by_year(year))
+
+        listed = {r.race_id for r in race_names}
+        for entry in self.get_entries(datasource=datasource, year=year):
+            if entry.gender == gender and entry.race_id not in listed:
+                self.remove(entry.key)
+        for race_name in race_names:
+            self.add(RaceNameEntry(datasource, gender, race_name.race_id, race_name.name, year))
+        return len(race_names)
+
+    def get_entries(self, datasource: str | None = None, year: int | None = None) -> list[RaceNameEntry]:
+        return [
+            e
+            for e in self._entries
+            if e is not None and (not datasource or e.datasource == datasource) and (not year or e.year == year)
+        ]
+
+    def search(
+        self,
+        name: str,
+        limit: int = 10,
+        threshold: float = 0.3,
+        datasource: str | None = None,
+    ) -> list[tuple[RaceNameEntry, float]]:
+        """
+        Find the indexed names most similar to the given one.
+
+        Parameters:
+        - name (str): The name to search.
+        - limit (int): Maximum number of results (default: 10).
+        - threshold (float): Minimum similarity, between 0 and 1, of the results (default: 0.3).
+        - datasource (str | None): Only search the names of this datasource.
+
+        Returns: list[tuple[RaceNameEntry, float]]: The matching entries with their similarity, best first.
+        """
+        grams = _trigrams(name)
+        if not grams:
+            return []
+
+        results = []
+        for idx in self._candidates(grams):
+            entry, entry_grams = self._entries[idx], self._entry_grams[idx]
+            score = 2 * len(grams & entry_grams) / (len(grams) + len(entry_grams))
+            if entry and score >= threshold and (not datasource or entry.datasource == datasource):
+                results.append((entry, score))
+        results.sort(key=lambda r: (-r[1], r[0].name, r[0].key))
+        return results[:limit]
+
+    def save(self, file_name: str) -> None:
+        tmp_file_name = f"{file_name}.tmp"
+        with open(tmp_file_name, "w") as file:
+            json.dump([asdict(e) for e in self._entries if e is not None], file, ensure_ascii=False)
+        os.replace(tmp_file_name, file_name)
+
+    @classmethod
+    def load(cls, file_name: str) -> Self:
+        """
+        Load a saved index, an empty one if the file doesn't exist.
+        """
+        index = cls()
+        if os.path.isfile(file_name):
+            with open(file_name) as file:
+                for entry in json.load(file):
+                    index.add(RaceNameEntry(**entry))
+        return index
+
+    def _candidates(self, grams: set[str]) -> set[int]:
+        """
+        Entries sharing a trigram with the query, skipping the too common ones unless all of them are.
+        """
+        postings = [self._grams[g] for g in grams if self._grams.get(g)]
+        rare = [p for p in postings if len(p) <= self._max_gram_entries]
+        return set().union(*(rare or postings))
+
+    def _unindex(self, idx: int) -> None:
+        for gram in self._entry_grams[idx]:
+            self._grams[gram].discard(idx)
+        self._entry_grams[idx] = frozenset()
+
+
+def _trigrams(name: str) -> set[str]:
+    """
+    Trigrams of each word of the unaccented name, padded with spaces so short words and word boundaries count.
+    """
+    grams = set()
+    for word in whitespaces_clean(remove_symbols(unaccent(name.upper()))).split():
+        word = f" {word} "
+        grams.update(word[i : i + 3] for i in range(len(word) - 2))
+    return grams
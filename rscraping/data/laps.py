@@ -0,0 +1,139 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import compress, repeat
+from operator import add, and_, mul, ne, sub
+from statistics import median
+
+from rscraping.data.models import Race
+
+NO_TIME = -1
+
+# precomputed 'MM:SS.' prefixes for the first hour and '%f' suffixes for each centisecond
+_LAP_PREFIXES = [f"{m:02d}:{s:02d}." for m in range(60) for s in range(60)]
+_LAP_SUFFIXES = [f"{c * 10000:06d}" for c in range(100)]
+
+
+def lap_to_centiseconds(lap: str) -> int:
+    """
+    Convert a lap formatted with LAP_FORMAT ('%M:%S.%f') into centiseconds.
+    """
+    minutes, seconds = lap.split(":")
+    seconds, _, fraction = seconds.partition(".")
+    return int(minutes) * 6000 + int(seconds) * 100 + int(fraction[:2].ljust(2, "0"))
+
+
+def centiseconds_to_lap(value: int) -> str:
+    """
+    Convert centiseconds into a lap formatted with LAP_FORMAT ('%M:%S.%f').
+    """
+    if 0 <= value < 360000:
+        return _LAP_PREFIXES[value // 100] + _LAP_SUFFIXES[value % 100]
+    minutes, value = divmod(value, 6000)
+    seconds, centiseconds = divmod(value, 100)
+    return f"{minutes:02d}:{seconds:02d}.{centiseconds * 10000:06d}"
+
+
+@dataclass
+class LapMatrix:
+    """
+    Compact (participants x laps) matrix of cumulative lap times in centiseconds, stored row-major in a single int32
+    array. Missing laps are filled with NO_TIME.
+
+    The 'values' array supports the buffer protocol so it can be wrapped without copying, e.g.
+    'numpy.frombuffer(matrix.values, dtype=numpy.int32).reshape(matrix.participants, matrix.laps)'.
+    """
+
+    participants: int
+    laps: int
+    values: array[int]
+
+    @staticmethod
+    def from_laps(laps: Sequence[Sequence[str]]) -> "LapMatrix":
+        width = max((len(row) for row in laps), default=0)
+        values = array("i", [NO_TIME]) * (len(laps) * width)
+        for i, row in enumerate(laps):
+            values[i * width : i * width + len(row)] = array("i", (lap_to_centiseconds(lap) for lap in row))
+        return LapMatrix(participants=len(laps), laps=width, values=values)
+
+    @staticmethod
+    def from_race(race: Race) -> "LapMatrix":
+        return LapMatrix.from_laps([p.laps for p in race.participants])
+
+    def row(self, participant: int) -> array[int]:
+        return self.values[participant * self.laps : (participant + 1) * self.laps]
+
+    def columns(self) -> list[array[int]]:
+        """
+        Times of each lap for every participant, built with strided slices of 'values'.
+        """
+        return [self.values[j :: self.laps] for j in range(self.laps)]
+
+    def final_times(self) -> array[int]:
+        """
+        Last recorded time of each participant, NO_TIME if they don't have any. Times are cumulative (and NO_TIME is
+        negative) so it's the maximum of each row, computed column-wise with the 'max' builtin.
+        """
+        if self.laps < 2:
+            return array("i", self.values) if self.laps else array("i", [NO_TIME]) * self.participants
+        return array("i", map(max, *self.columns()))
+
+    def finished_times(self) -> array[int]:
+        """
+        Final time of each participant, NO_TIME if they didn't finish.
+
+        Rows are shorter when a datasource misses an intermediate split, so the last time of a shorter row can be a
+        final time or the split where the participant stopped. It's taken as final when it's closer to the median of
+        the last lap than to the median of any other lap, medians computed only with the complete rows (the shorter ones
+        are left-aligned so they would mix finals into the split columns). With a single complete row its times are the
+        reference, without any the shorter rows are never finished.
+        """
+        columns = self.columns()
+        finals = self.final_times()
+        if not columns:
+            return finals
+
+        complete = [t != NO_TIME for t in columns[-1]]
+        if not any(complete):
+            return array("i", [NO_TIME]) * self.participants
+        medians = [median(compress(column, complete)) for column in columns]
+
+        for i in compress(range(self.participants), (not c for c in complete)):
+            value = finals[i]
+            if value != NO_TIME and min(range(self.laps), key=lambda j: abs(medians[j] - value)) != self.laps - 1:
+                finals[i] = NO_TIME
+        return finals
+
+    def split_deltas(self) -> "LapMatrix":
+        """
+        Time spent in each lap, computed from the cumulative times column by column. Laps after a missing one are also
+        missing.
+        """
+        deltas = array("i", [NO_TIME]) * len(self.values)
+        previous = array("i", [0]) * self.participants
+        recorded = [True] * self.participants  # every lap so far has a time
+        for j, column in enumerate(self.columns()):
+            recorded = list(map(and_, recorded, map(ne, column, repeat(NO_TIME))))
+            # NO_TIME where a lap is missing: (delta - NO_TIME) * recorded + NO_TIME
+            differences = map(sub, map(sub, column, previous), repeat(NO_TIME))
+            deltas[j :: self.laps] = array("i", map(add, map(mul, differences, recorded), repeat(NO_TIME)))
+            previous = column
+        return LapMatrix(participants=self.participants, laps=self.laps, values=deltas)
+
+    def ranking(self, partial: bool = False) -> array[int]:
+        """
+        1-based position of each participant by final time, tied times share the position. Participants that didn't
+        complete every lap are ranked with 0, unless 'partial' is set and their last time is a final one (see
+        'finished_times').
+        """
+        if partial:
+            finals = self.finished_times()
+        else:
+            finals = self.values[self.laps - 1 :: self.laps] if self.laps else array("i")
+        ordered = sorted((t, i) for i, t in enumerate(finals) if t != NO_TIME)
+
+        positions = array("i", [0]) * self.participants
+        for idx, (value, i) in enumerate(ordered):
+            tied = idx > 0 and ordered[idx - 1][0] == value
+            positions[i] = positions[ordered[idx - 1][1]] if tied else idx + 1
+        return positions
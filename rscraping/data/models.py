@@ -1,6 +1,7 @@
 import json
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
 from enum import StrEnum, auto
 from typing import Any
 
@@ -13,6 +14,40 @@ class RaceName:
     name: str
 
 
+@dataclass
+class RaceSummary:
+    """
+    Race metadata listed in the season pages, enough for calendar level queries without fetching the race details.
+    """
+
+    datasource: str
+    race_id: str
+    name: str
+    date: str | None  # DATE_FORMAT, None when the listing doesn't show it
+    gender: str | None
+    type: str | None = None  # only known when the listing tells it (play-offs, time trials)
+    category: str | None = None
+
+    @property
+    def parsed_date(self) -> date | None:
+        return datetime.strptime(self.date, DATE_FORMAT).date() if self.date else None
+
+
+@dataclass
+class RacePage:
+    """
+    Raw content of a race details page, everything a parser needs to build the race without network access.
+    """
+
+    datasource: str
+    race_id: str
+    url: str
+    content: bytes
+    is_female: bool
+    results: bytes | None = None  # results page, only needed by some datasources (LGT)
+    options: dict[str, Any] = field(default_factory=dict)  # extra 'parse_race' arguments (e.g. 'table')
+
+
 class Datasource(StrEnum):
     ACT = auto()
     LGT = auto()
@@ -41,7 +76,7 @@ class Datasource(StrEnum):
         return self.__str__()
 
 
-@dataclass
+@dataclass(slots=True)
 class Penalty:
     disqualification: bool
     reason: str | None
@@ -56,13 +91,13 @@ class Penalty:
         return Penalty(**values)
 
     def to_dict(self) -> dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items()}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class Race:
     name: str
     date: str
@@ -92,9 +127,22 @@ class Race:
     race_lanes: int | None = None
     cancelled: bool = False
 
+    # (date, parsed date) pair, re-parsed only when 'date' changes
+    _parsed_date: tuple[str, date] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def parsed_date(self) -> date:
+        if self._parsed_date is None or self._parsed_date[0] != self.date:
+            self._parsed_date = (self.date, datetime.strptime(self.date, DATE_FORMAT).date())
+        return self._parsed_date[1]
+
     @property
     def year(self) -> int:
-        return datetime.strptime(self.date, DATE_FORMAT).date().year
+        return self.parsed_date.year
+
+    @property
+    def key(self) -> str:
+        return f"{self.datasource}:{self.race_ids[0]}:{self.day}"
 
     def __str__(self) -> str:
         return self.to_json()
@@ -104,14 +152,15 @@ class Race:
         values = json.loads(json_str)
         participants = values["participants"]
         values["participants"] = []
+        values["normalized_names"] = [tuple(n) for n in values["normalized_names"]]
 
         race = Race(**values)
         if participants:
-            race.participants = [Participant(**p, race=race) for p in participants]
+            race.participants = [Participant.from_dict(p, race=race) for p in participants]
         return race
 
     def to_dict(self) -> dict[str, Any]:
-        d = {k: v for k, v in self.__dict__.items()}
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
         d["participants"] = [p.to_dict() for p in d["participants"]]
         return d
 
@@ -119,7 +168,7 @@ class Race:
         return json.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     gender: str
     category: str
@@ -147,12 +196,15 @@ class Participant:
     @staticmethod
     def from_json(json_str: str) -> "Participant":
         values = json.loads(json_str)
-        if "race" not in values:
-            values["race"] = None
-        return Participant(**values)
+        return Participant.from_dict(values, race=values.pop("race", None))
+
+    @staticmethod
+    def from_dict(values: dict[str, Any], race: Race) -> "Participant":
+        penalty = values.get("penalty")
+        return Participant(**{**values, "penalty": Penalty(**penalty) if penalty else None}, race=race)
 
     def to_dict(self) -> dict[str, Any]:
-        d = {k: v for k, v in self.__dict__.items() if k not in ["race"]}
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.name not in ["race"]}
         d["penalty"] = self.penalty.to_dict() if self.penalty else None
         return d
 
@@ -160,6 +212,72 @@ class Participant:
         return json.dumps(self.to_dict())
 
 
+_RACE_ATTRIBUTES = frozenset({f.name for f in fields(Race)} | {n for n in vars(Race) if not n.startswith("_")})
+
+
+class RaceView:
+    """
+    Lazy 'Race' for metadata-only scans: the datasource, ID, name, date and gender are parsed right away while the
+    full race (participants, penalties and normalized names) is only built, and cached, when any other field is
+    accessed.
+
+    Usage:
+        view = client.get_race_view_by_id("1234")
+        view.name, view.date  # cheap
+        view.participants  # parses the whole race
+    """
+
+    race: Race
+    participants_count: int
+
+    def __init__(
+        self,
+        *,
+        datasource: str,
+        race_id: str,
+        name: str,
+        date: str,
+        gender: str | None,
+        loader: Callable[[], Race],
+        participants_count: int | None = None,
+        url: str | None = None,
+    ):
+        self.datasource = datasource
+        self.race_id = race_id
+        self.name = name
+        self.date = date
+        self.gender = gender
+        self.url = url
+        self.loader = loader
+        if participants_count is not None:
+            self.participants_count = participants_count
+        self._parsed_date: tuple[str, date] | None = None  # same (date, parsed date) cache as 'Race'
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the attributes not set in the view. The race is loaded here instead of in a property so an
+        # AttributeError raised by the loader propagates instead of being taken as a missing attribute of the view.
+        if name == "race":
+            race = self.loader()
+            race.url = self.url or race.url
+            self.race = race
+            return race
+        if name == "participants_count":
+            return len(self.race.participants)
+        if name not in _RACE_ATTRIBUTES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr(self.race, name)
+
+    def __repr__(self) -> str:
+        loaded = "race" in self.__dict__
+        return f"RaceView({self.datasource}:{self.race_id}, {self.name!r}, {self.date}, {loaded=})"
+
+    @property
+    def parsed_date(self) -> date:
+        if self._parsed_date is None or self._parsed_date[0] != self.date:
+            self._parsed_date = (self.date, datetime.strptime(self.date, DATE_FORMAT).date())
+        return self._parsed_date[1]
+
+
 @dataclass
 class Club:
     name: str
@@ -1,5 +1,6 @@
 from .clubs import (
     normalize_club_name as normalize_club_name,
+    normalize_club_names as normalize_club_names,
     deacronym_club_name as deacronym_club_name,
     remove_club_title as remove_club_title,
     remove_club_sponsor as remove_club_sponsor,
@@ -7,7 +8,9 @@ from .clubs import (
 )
 from .races import (
     normalize_race_name as normalize_race_name,
+    normalize_race_names as normalize_race_names,
     normalize_name_parts as normalize_name_parts,
+    normalize_names_parts as normalize_names_parts,
     normalize_known_race_names as normalize_known_race_names,
     normalize_ko_race_names as normalize_ko_race_names,
     amend_race_name as amend_race_name,
@@ -26,11 +29,16 @@ from .times import (
 )
 from .towns import (
     normalize_town as normalize_town,
+    normalize_towns as normalize_towns,
     amend_town as amend_town,
     remove_province as remove_province,
     extract_town as extract_town,
 )
-from .leagues import normalize_league_name as normalize_league_name, find_league as find_league
+from .leagues import (
+    normalize_league_name as normalize_league_name,
+    normalize_league_names as normalize_league_names,
+    find_league as find_league,
+)
 from .penalty import (
     is_guest as is_guest,
     is_absent as is_absent,
@@ -0,0 +1,25 @@
+from collections.abc import Callable, Iterable
+
+
+def map_unique[T](values: Iterable[str], func: Callable[[str], T], *stages: Callable[[str], str]) -> list[T]:
+    """
+    Apply a normalization pipeline to a batch of values, computing each stage only once per unique value.
+
+    Values that collapse into the same intermediate result after a stage (e.g. only differing in casing or spacing)
+    are also merged before running the next one, so the work scales with the number of distinct names.
+
+    Parameters:
+    - values (Iterable[str]): The values to normalize.
+    - func (Callable[[str], T]): The last stage of the pipeline.
+    - *stages (Callable[[str], str]): Intermediate stages applied, in order, before 'func'.
+
+    Returns: list[T]: The normalized values in the same order as the input ones.
+    """
+    keys = list(values)
+    current = {v: v for v in keys}
+    for stage in stages:
+        results = {v: stage(v) for v in set(current.values())}
+        current = {k: results[v] for k, v in current.items()}
+
+    final = {v: func(v) for v in set(current.values())}
+    return [final[current[k]] for k in keys]
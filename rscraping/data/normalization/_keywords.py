@@ -0,0 +1,63 @@
+from collections import Counter
+
+from pyutils.strings import match_normalization
+
+_GRAM = 3
+
+
+class KeywordIndex:
+    """
+    Inverted index over a 'match_normalization' dictionary ({normalized: [[keyword, ...], ...]}) so each lookup only
+    tests the entries that can match instead of scanning all of them.
+
+    Every keyword list is anchored by its rarest keyword, as a list can only match when all its keywords are in the
+    value. Anchors are bucketed by their least common trigram, so finding the candidates costs a dict lookup per
+    trigram of the value. The candidates are then given, in their original order, to 'match_normalization' so the
+    results are the same as with the full dictionary.
+    """
+
+    def __init__(self, normalizations: dict[str, list[list[str]]]):
+        self._normalizations = normalizations
+        self._positions = {k: i for i, k in enumerate(normalizations)}
+        self._always: set[str] = set()  # entries with an empty keyword list
+        self._short: list[tuple[str, str]] = []  # anchors too short to have a trigram
+        self._index: dict[str, list[tuple[str, str]]] = {}
+
+        keyword_lists = [(key, keywords) for key, lists in normalizations.items() for keywords in lists]
+        frequencies = Counter(w for _, keywords in keyword_lists for w in {k.upper() for k in keywords})
+        anchors: list[tuple[str, str]] = []
+        for key, keywords in keyword_lists:
+            if not keywords:
+                self._always.add(key)
+                continue
+            anchor = min((w.upper() for w in keywords), key=lambda w: (len(w) < _GRAM, frequencies[w], -len(w)))
+            anchors.append((anchor, key))
+
+        grams = Counter(g for anchor, _ in anchors for g in set(_grams(anchor)))
+        for anchor, key in anchors:
+            if len(anchor) < _GRAM:
+                self._short.append((anchor, key))
+                continue
+            gram = min(_grams(anchor), key=grams.__getitem__)
+            self._index.setdefault(gram, []).append((anchor, key))
+
+    def candidates(self, value: str) -> dict[str, list[list[str]]]:
+        """
+        Subset of the normalizations, in the original order, with the entries that can match the given value.
+        """
+        value = value.upper()
+        keys = set(self._always)
+        keys.update(key for anchor, key in self._short if anchor in value)
+        for gram in set(_grams(value)):
+            keys.update(key for anchor, key in self._index.get(gram, ()) if anchor in value)
+        return {k: self._normalizations[k] for k in sorted(keys, key=self._positions.__getitem__)}
+
+    def match(self, value: str) -> str:
+        """
+        Same as 'match_normalization(value, normalizations)'.
+        """
+        return match_normalization(value, self.candidates(value))
+
+
+def _grams(value: str) -> list[str]:
+    return [value[i : i + _GRAM] for i in range(len(value) - _GRAM + 1)]
@@ -1,14 +1,17 @@
 import re
+from collections.abc import Iterable
 
 from pyutils.strings import (
     CONJUNCTIONS,
-    match_normalization,
     remove_parenthesis,
     whitespaces_clean,
 )
-from rscraping.data.checks import is_branch_club
+from rscraping.data.checks import is_branch_club, tokenize
 from rscraping.data.models import Race
 
+from ._batch import map_unique
+from ._keywords import KeywordIndex
+
 _ENTITY_TITLES_SHORT = [
     "AD",
     "AE",
@@ -96,6 +99,7 @@ _NORMALIZED_ENTITIES = {
     "UR KIROLAK": [["UR", "KIROLAK"]],
     "URDAIBAI": [["BERMEO", "URDAIBAI"]],
 }
+_NORMALIZED_ENTITIES_INDEX = KeywordIndex(_NORMALIZED_ENTITIES)
 
 _KNOWN_SPONSORS = [
     "AMENABAR",
@@ -159,6 +163,17 @@ def normalize_club_name(name: str) -> str:
     7. Remove remaining conjunctions at the beginning
     8. Specific known club normalizations
     """
+    return _normalize_clean_club_name(_clean_club_name(name))
+
+
+def normalize_club_names(names: Iterable[str]) -> list[str]:
+    """
+    Batch version of 'normalize_club_name', each normalization stage runs only once for every unique name.
+    """
+    return map_unique(names, _normalize_clean_club_name, _clean_club_name)
+
+
+def _clean_club_name(name: str) -> str:
     name = whitespaces_clean(remove_parenthesis(name.upper()))
     name = deacronym_club_name(name)
 
@@ -166,12 +181,15 @@ def normalize_club_name(name: str) -> str:
     name = remove_club_title(name)
     name = remove_club_sponsor(name)
 
-    name = " ".join(name.split()[1:]) if name.split() and name.split()[0] in CONJUNCTIONS else name
+    return " ".join(name.split()[1:]) if name.split() and name.split()[0] in CONJUNCTIONS else name
+
 
-    is_B_team, is_C_team = is_branch_club(name), is_branch_club(name, letter="C")  # never saw more than a C
+def _normalize_clean_club_name(name: str) -> str:
+    tokens = tokenize(name)
+    is_B_team, is_C_team = is_branch_club(tokens), is_branch_club(tokens, letter="C")  # never saw more than a C
     if not ("KOXTAPE" in name and " - " in name):
         # HACK: edge case for KOXTAPE - XXX merge
-        name = match_normalization(name, _NORMALIZED_ENTITIES)
+        name = _NORMALIZED_ENTITIES_INDEX.match(name)
     name = f"{name} C" if is_C_team and not is_branch_club(name, letter="C") else name
     name = f"{name} B" if is_B_team and not is_branch_club(name) else name
 
@@ -212,7 +230,8 @@ def ensure_b_teams_have_the_main_team_racing(race: Race) -> None:
     Ensure that if a B team is racing, the main team is also racing
     """
     for i, p in enumerate(race.participants):
-        if is_branch_club(p.participant) or is_branch_club(p.participant, letter="C"):
+        participant = tokenize(p.participant)
+        if is_branch_club(participant) or is_branch_club(participant, letter="C"):
             main_team = p.participant.rstrip(" B").rstrip(" C")
             if not any(p2.participant == main_team for p2 in race.participants):
                 race.participants[i].participant = main_team
@@ -1,5 +1,10 @@
-from pyutils.strings import match_normalization
-from rscraping.data.checks import is_act, is_arc, is_ete, is_lgt, is_play_off
+from collections.abc import Iterable
+from functools import partial
+
+from rscraping.data.checks import TokenizedName, is_act, is_arc, is_ete, is_lgt, is_play_off, tokenize
+
+from ._batch import map_unique
+from ._keywords import KeywordIndex
 
 __LEAGUES_MAP = {
     "LIGA GALEGA DE TRAIÑAS": [["LGT"]],
@@ -8,12 +13,14 @@ __LEAGUES_MAP = {
     "LIGA GALEGA DE TRAIÑAS FEMENINA": [["LIGA", "FEM"], ["LIGA", "F"]],  # sometimes we don't have the gender
     "EUSKO LABEL LIGA": [["ACT"]],
 }
+__LEAGUES_INDEX = KeywordIndex(__LEAGUES_MAP)
 
 __FEMALE_LEAGUES_MAP = {
     "LIGA GALEGA DE TRAIÑAS": [["LGT"]],
     "LIGA GALEGA DE TRAIÑAS FEMENINA": [["LIGA", "FEM"], ["LIGA", "F"]],
     "LIGA EUSKOTREN": [["ACT"]],
 }
+__FEMALE_LEAGUES_INDEX = KeywordIndex(__FEMALE_LEAGUES_MAP)
 
 LEAGUE_KEYWORDS = {
     "LGT": [
@@ -43,17 +50,25 @@ def normalize_league_name(name: str, is_female: bool = False) -> str:
 
     1. Specific known league normalizations
     """
-    leagues = __FEMALE_LEAGUES_MAP if is_female else __LEAGUES_MAP
-    return match_normalization(name, leagues)
+    leagues = __FEMALE_LEAGUES_INDEX if is_female else __LEAGUES_INDEX
+    return leagues.match(name)
+
+
+def normalize_league_names(names: Iterable[str], is_female: bool = False) -> list[str]:
+    """
+    Batch version of 'normalize_league_name', each unique name is only normalized once.
+    """
+    return map_unique(names, partial(normalize_league_name, is_female=is_female))
 
 
-def find_league(name: str) -> str | None:
+def find_league(name: str | TokenizedName) -> str | None:
     """
-    Find the league of a competition by its name.
+    Find the league of a competition by its name, which is only tokenized once for all the checks.
 
     1. Play-offs
     2. Leagues
     """
+    name = tokenize(name)
     if is_play_off(name):
         if is_act(name) or is_act(name, is_female=True) or ("ARC" in name and "LGT" in name):
             return "ACT"
@@ -17,6 +17,7 @@ from rscraping.data.constants import (
     WRONG_ROUTE,
 )
 from rscraping.data.models import Penalty
+from rscraping.instrumentation import measured
 
 from .clubs import normalize_club_name
 from .lemmatize import lemmatize
@@ -246,6 +247,7 @@ _UNKNOWN_PENALTY_TEMPLATES = [
 ]
 
 
+@measured("normalize.penalty")
 def normalize_penalty(text: str | None, participants: list[str]) -> dict[str, Penalty]:
     """
     Normalize a penalty note
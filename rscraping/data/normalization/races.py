@@ -1,11 +1,11 @@
 import re
+from collections.abc import Iterable
 
 from pyutils.shortcuts import none
 from pyutils.strings import (
     apply_replaces,
     find_roman,
     int_to_roman,
-    match_normalization,
     remove_parenthesis,
     remove_roman,
     roman_to_int,
@@ -14,6 +14,9 @@ from pyutils.strings import (
 from rscraping.data.checks import is_play_off
 from rscraping.data.normalization.leagues import LEAGUE_KEYWORDS
 
+from ._batch import map_unique
+from ._keywords import KeywordIndex
+
 _MISSPELLINGS = {
     "": ["RECICLAMOS LA LUZ", " AE ", "EXCMO", "ILTMO"],
     "IKURRIÑA": ["IKURIÑA", "IKURINA", "IÑURRIÑA"],
@@ -73,6 +76,7 @@ _NORMALIZED_RACES = {
     "BANDERA EUSKADI BASQUE COUNTRY": [["EUSKADI", "BASQUE", "COUNTRY"]],
     "BANDERA DE UR-KIROLAK": [["UR-KIROLAK"], ["UR", "KIROLAK"]],
 }
+_NORMALIZED_RACES_INDEX = KeywordIndex(_NORMALIZED_RACES)
 
 
 def normalize_name_parts(name: str) -> list[tuple[str, int | None]]:
@@ -125,11 +129,31 @@ def normalize_race_name(name: str) -> str:
     7. Specific known race normalizations
     8. Specific known error names
     """
+    return _normalize_clean_race_name(_clean_race_name(name))
+
+
+def normalize_race_names(names: Iterable[str]) -> list[str]:
+    """
+    Batch version of 'normalize_race_name', each normalization stage runs only once for every unique name.
+    """
+    return map_unique(names, _normalize_clean_race_name, _clean_race_name)
+
+
+def normalize_names_parts(names: Iterable[str]) -> list[list[tuple[str, int | None]]]:
+    """
+    Batch version of 'normalize_name_parts', each unique name is only split once.
+    """
+    return [list(p) for p in map_unique(names, normalize_name_parts)]
+
+
+def _clean_race_name(name: str) -> str:
     name = whitespaces_clean(name).upper()
     name = deacronym_race_name(name)  # need to be executed before "." removal
 
-    name = re.sub(r"[\'\".:ª]", " ", name)
+    return re.sub(r"[\'\".:ª]", " ", name)
+
 
+def _normalize_clean_race_name(name: str) -> str:
     if name == "CLASIFICATORIA ARC":
         # this is a special case that we want to keep as is
         return "CLASIFICATORIA ARC"
@@ -239,7 +263,7 @@ def amend_race_name(name: str) -> str:
 
 def normalize_known_race_names(name: str) -> str:
     edition = find_edition(name)
-    normalized = match_normalization(name, _NORMALIZED_RACES)
+    normalized = _NORMALIZED_RACES_INDEX.match(name)
     if edition and int_to_roman(edition) not in normalized.split():
         normalized = f"{int_to_roman(edition)} {normalized}"
     return normalized
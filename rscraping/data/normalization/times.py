@@ -1,8 +1,10 @@
 import re
-from datetime import datetime, time
+from datetime import time
 
 from pyutils.strings import apply_replaces
 
+_DIGITS_RE = re.compile(r"\d+")
+
 
 def normalize_lap_time(value: str) -> time | None:
     """
@@ -17,7 +19,7 @@ def normalize_lap_time(value: str) -> time | None:
     if value.startswith(":"):
         # try to fix ':18,62' | ':45'
         value = "00" + value
-    parts = re.findall(r"\d+", value)
+    parts = _DIGITS_RE.findall(value)
     if all(p == "00" for p in parts):
         return None
     if len(parts) == 2:
@@ -29,16 +31,26 @@ def normalize_lap_time(value: str) -> time | None:
             parts[1] = parts[1][:-1]
         if len(parts[0]) == 4:
             # try to fix '2102:48'
-            return time_or_none(datetime.strptime(f"{parts[0][0:2]}:{parts[0][2:]},{parts[1]}", "%M:%S,%f").time())
+            return _lap_time(parts[0][0:2], parts[0][2:], parts[1])
         if len(parts[1]) == 4:
             # try to fix '25:2257'
-            return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1][0:2]},{parts[1][2:]}", "%M:%S,%f").time())
-        return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1]}", "%M:%S").time())
+            return _lap_time(parts[0], parts[1][0:2], parts[1][2:])
+        return _lap_time(parts[0], parts[1])
     if len(parts) == 3:
-        return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1]},{parts[2]}", "%M:%S,%f").time())
+        return _lap_time(parts[0], parts[1], parts[2])
     return None
 
 
+def _lap_time(minutes: str, seconds: str, fraction: str = "0") -> time | None:
+    """
+    Build the lap time from its digit groups, same as parsing them with the '%M:%S,%f' format but without the overhead
+    of 'datetime.strptime'. Raises ValueError for the values strptime would reject.
+    """
+    if not (0 < len(minutes) <= 2 and 0 < len(seconds) <= 2 and 0 < len(fraction) <= 6):
+        raise ValueError(f"unconverted lap time {minutes}:{seconds},{fraction}")
+    return time_or_none(time(0, int(minutes), int(seconds), int(fraction.ljust(6, "0"))))
+
+
 def time_or_none(value: time | None) -> time | None:
     if value is None or value == time(0, 0, 0):
         return None
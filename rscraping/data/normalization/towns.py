@@ -1,16 +1,20 @@
 import re
+from collections.abc import Iterable
 
 from pyutils.strings import (
-    match_normalization,
     remove_parenthesis,
     whitespaces_clean,
 )
 from rscraping.data.constants import SYNONYM_BAY, SYNONYM_BEACH, SYNONYM_PORT, SYNONYMS
 
+from ._batch import map_unique
+from ._keywords import KeywordIndex
+
 _NORMALIZED_TOWNS = {
     "A POBRA DO CARAMIÑAL": [["POBRA"], ["PUEBLA"]],
     "RIVEIRA": [["RIVEIRA"], ["RIBEIRA"]],
 }
+_NORMALIZED_TOWNS_INDEX = KeywordIndex(_NORMALIZED_TOWNS)
 
 _PROVINCES = [
     "A CORUÑA",
@@ -21,6 +25,7 @@ _PROVINCES = [
     "CANTABRIA",
 ]
 
+
 def normalize_town(town: str) -> str:
     """
     Normalize a town name to a standard format
@@ -30,11 +35,19 @@ def normalize_town(town: str) -> str:
     2. Remove province
     3. Specific known town normalizations
     """
-    town = whitespaces_clean(town.upper())
-    town = remove_province(town)
-    town = amend_town(town)
+    return amend_town(_clean_town(town))
 
-    return town
+
+def normalize_towns(towns: Iterable[str]) -> list[str]:
+    """
+    Batch version of 'normalize_town', each normalization stage runs only once for every unique town.
+    """
+    return map_unique(towns, amend_town, _clean_town)
+
+
+def _clean_town(town: str) -> str:
+    town = whitespaces_clean(town.upper())
+    return remove_province(town)
 
 
 def remove_province(town: str) -> str:
@@ -52,7 +65,7 @@ def amend_town(town: str) -> str:
     for w in SYNONYMS[SYNONYM_PORT] + SYNONYMS[SYNONYM_BAY] + SYNONYMS[SYNONYM_BEACH]:
         town = town.replace(f"{w} DE", "").replace(f"{w} DA", "").replace(w, "")
 
-    town = match_normalization(town, _NORMALIZED_TOWNS)
+    town = _NORMALIZED_TOWNS_INDEX.match(town)
     return whitespaces_clean(town)
 
 
@@ -0,0 +1,165 @@
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from rscraping.data.constants import RACE_TIME_TRIAL
+from rscraping.data.laps import NO_TIME, LapMatrix
+from rscraping.data.models import Race
+
+type PointsSystem = Callable[[int, int], int]
+
+
+def descending_points(position: int, participants: int) -> int:
+    """
+    League default: the winner gets as many points as ranked participants, and each position one less.
+    """
+    return max(participants - position + 1, 0)
+
+
+def table_points(table: Sequence[int]) -> PointsSystem:
+    """
+    Points system giving 'table[position - 1]' points, positions out of the table get none.
+    """
+    return lambda position, _: table[position - 1] if position <= len(table) else 0
+
+
+@dataclass
+class RaceResult:
+    """
+    Ranking of a race, each array is aligned with 'participants'. Positions are 0 for unranked participants (guests,
+    absent, retired, disqualified or without a final time).
+    """
+
+    race: str  # Race.key
+    participants: list[str]
+    times: array[int]  # final time in centiseconds, NO_TIME if unranked
+    positions: array[int]
+    series_positions: array[int]  # position within its series, same as 'positions' for time trials
+    points: array[int]
+
+
+@dataclass
+class StandingsRow:
+    participant: str
+    points: int = 0
+    races: int = 0
+    wins: int = 0
+    best_position: int = 0
+    time: int = 0  # sum of the final times in centiseconds
+
+
+def rank_race(race: Race, points: PointsSystem = descending_points) -> RaceResult:
+    """
+    Rank the race participants by final time.
+
+    1. Participants that can't score (guests, absent, retired, disqualified) are left out.
+    2. Everyone else is ranked by their last lap, the final time even when the datasource missed an intermediate split.
+    3. Conventional races are also ranked within each series.
+    4. Points are given by the overall position, minus the penalty points.
+    """
+    ranked = [
+        i
+        for i, p in enumerate(race.participants)
+        if not (p.guest or p.absent or p.retired or (p.penalty and p.penalty.disqualification))
+    ]
+    matrix = LapMatrix.from_laps([race.participants[i].laps for i in ranked])
+    ranking, finals = matrix.ranking(partial=True), matrix.finished_times()
+
+    size = len(race.participants)
+    times, positions = array("i", [NO_TIME]) * size, array("i", [0]) * size
+    for j, i in enumerate(ranked):
+        if ranking[j]:
+            times[i], positions[i] = finals[j], ranking[j]
+
+    series_positions = positions
+    if race.type != RACE_TIME_TRIAL:
+        series_positions = array("i", [0]) * size
+        series: dict[int | None, list[int]] = {}
+        for i in (i for i in ranked if positions[i]):
+            series.setdefault(race.participants[i].series, []).append(i)
+        for heat in series.values():
+            for position, i in enumerate(sorted(heat, key=positions.__getitem__), start=1):
+                series_positions[i] = position
+
+    total = sum(1 for p in positions if p)
+    race_points = array("i", [0]) * size
+    for i, p in enumerate(race.participants):
+        if positions[i]:
+            race_points[i] = points(positions[i], total) - (p.penalty.penalty if p.penalty else 0)
+
+    return RaceResult(
+        race=race.key,
+        participants=[p.participant for p in race.participants],
+        times=times,
+        positions=positions,
+        series_positions=series_positions,
+        points=race_points,
+    )
+
+
+class Standings:
+    """
+    League table built from the races of a season, updated incrementally: adding a race only ranks that race and
+    applies its difference to the totals, so a live table costs O(changed races) to keep up to date.
+
+    Usage:
+        standings = Standings(points=table_points([12, 10, 8, 6, 4, 2]))
+        for race in store.get_races_by_year(2024, datasource=Datasource.ACT):
+            standings.add(race)
+        standings.table()
+    """
+
+    def __init__(self, points: PointsSystem = descending_points):
+        self._points = points
+        self._results: dict[str, RaceResult] = {}
+        self._rows: dict[str, StandingsRow] = {}
+        self._positions: dict[str, Counter[int]] = {}  # how many times each participant got each position
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def results(self) -> list[RaceResult]:
+        return list(self._results.values())
+
+    def add(self, race: Race) -> RaceResult:
+        """
+        Rank the race and add it to the table, replacing its previous result if it was already added.
+        """
+        self.remove(race.key)
+        result = rank_race(race, self._points)
+        self._results[race.key] = result
+        self._apply(result, sign=1)
+        return result
+
+    def add_all(self, races: Iterable[Race | None]) -> None:
+        for race in races:
+            if race is not None:
+                self.add(race)
+
+    def remove(self, race_key: str) -> None:
+        result = self._results.pop(race_key, None)
+        if result:
+            self._apply(result, sign=-1)
+
+    def table(self) -> list[StandingsRow]:
+        """
+        Rows sorted by points, then wins and total time.
+        """
+        rows = (r for r in self._rows.values() if r.races)
+        return sorted(rows, key=lambda r: (-r.points, -r.wins, r.time, r.participant))
+
+    def _apply(self, result: RaceResult, sign: int) -> None:
+        for i, participant in enumerate(result.participants):
+            if not result.positions[i]:
+                continue
+            row = self._rows.setdefault(participant, StandingsRow(participant))
+            row.points += sign * result.points[i]
+            row.races += sign
+            row.wins += sign * (result.positions[i] == 1)
+            row.time += sign * result.times[i]
+
+            positions = self._positions.setdefault(participant, Counter())
+            positions[result.positions[i]] += sign
+            row.best_position = min((p for p, count in positions.items() if count > 0), default=0)
@@ -0,0 +1,297 @@
+import json
+import sqlite3
+from collections.abc import Iterable
+from itertools import batched
+from typing import Any, Self
+
+from rscraping.data.models import Participant, Penalty, Race
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY,
+    datasource TEXT NOT NULL,
+    race_id TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    race_ids TEXT NOT NULL,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    iso_date TEXT NOT NULL,
+    modality TEXT NOT NULL,
+    type TEXT NOT NULL,
+    league TEXT,
+    town TEXT,
+    organizer TEXT,
+    sponsor TEXT,
+    url TEXT,
+    gender TEXT,
+    category TEXT,
+    race_notes TEXT,
+    race_laps INTEGER,
+    race_lanes INTEGER,
+    cancelled INTEGER NOT NULL,
+    UNIQUE (datasource, race_id, day)
+);
+CREATE INDEX IF NOT EXISTS races_iso_date_idx ON races (iso_date);
+
+CREATE TABLE IF NOT EXISTS race_names (
+    race INTEGER NOT NULL REFERENCES races (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    edition INTEGER
+);
+CREATE INDEX IF NOT EXISTS race_names_race_idx ON race_names (race);
+CREATE INDEX IF NOT EXISTS race_names_name_idx ON race_names (name);
+
+CREATE TABLE IF NOT EXISTS participants (
+    race INTEGER NOT NULL REFERENCES races (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    gender TEXT NOT NULL,
+    category TEXT NOT NULL,
+    club_name TEXT NOT NULL,
+    participant TEXT NOT NULL,
+    lane INTEGER,
+    series INTEGER,
+    laps TEXT NOT NULL,
+    distance INTEGER,
+    handicap TEXT,
+    retired INTEGER NOT NULL,
+    absent INTEGER NOT NULL,
+    guest INTEGER NOT NULL,
+    disqualification INTEGER,
+    penalty_reason TEXT,
+    penalty INTEGER
+);
+CREATE INDEX IF NOT EXISTS participants_race_idx ON participants (race);
+CREATE INDEX IF NOT EXISTS participants_participant_idx ON participants (participant);
+CREATE INDEX IF NOT EXISTS participants_club_name_idx ON participants (club_name);
+"""
+
+_UPSERT_RACE = """
+INSERT INTO races (
+    datasource, race_id, day, race_ids, name, date, iso_date, modality, type, league, town, organizer, sponsor, url,
+    gender, category, race_notes, race_laps, race_lanes, cancelled
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (datasource, race_id, day) DO UPDATE SET
+    race_ids = excluded.race_ids, name = excluded.name, date = excluded.date, iso_date = excluded.iso_date,
+    modality = excluded.modality, type = excluded.type, league = excluded.league, town = excluded.town,
+    organizer = excluded.organizer, sponsor = excluded.sponsor, url = excluded.url, gender = excluded.gender,
+    category = excluded.category, race_notes = excluded.race_notes, race_laps = excluded.race_laps,
+    race_lanes = excluded.race_lanes, cancelled = excluded.cancelled
+RETURNING id
+"""
+
+_INSERT_NAME = "INSERT INTO race_names (race, position, name, edition) VALUES (?, ?, ?, ?)"
+
+_INSERT_PARTICIPANT = """
+INSERT INTO participants (
+    race, position, gender, category, club_name, participant, lane, series, laps, distance, handicap, retired, absent,
+    guest, disqualification, penalty_reason, penalty
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class RaceStore:
+    """
+    SQLite persistence for parsed races, every race is identified by its (datasource, race_id, day) triple, where
+    'race_id' is the first of the race 'race_ids' (see 'Race.key').
+
+    Saving a race already stored replaces it, so incremental crawls can store everything they find and use 'has_race'
+    or 'get_race_ids' to skip the races they already have.
+
+    Usage:
+        with RaceStore("races.db") as store:
+            store.save(races)
+            store.get_races_by_year(2024, datasource=Datasource.ACT)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def save(self, races: Iterable[Race | None], batch_size: int = 500) -> int:
+        """
+        Insert or replace the given races, each batch of 'batch_size' races is written in a single transaction.
+
+        Parameters:
+        - races (Iterable[Race | None]): The races to save, None values are skipped.
+        - batch_size (int): Number of races saved in each transaction (default: 500).
+
+        Returns: int: The number of saved races.
+        """
+        saved = 0
+        for batch in batched((r for r in races if r is not None), batch_size):
+            with self._conn:
+                for race in batch:
+                    self._save_race(race)
+            saved += len(batch)
+        return saved
+
+    def has_race(self, datasource: str, race_id: str, day: int = 1) -> bool:
+        query = "SELECT 1 FROM races WHERE datasource = ? AND race_id = ? AND day = ?"
+        return self._conn.execute(query, (datasource, race_id, day)).fetchone() is not None
+
+    def get_race(self, datasource: str, race_id: str, day: int = 1) -> Race | None:
+        races = self._get_races("datasource = ? AND race_id = ? AND day = ?", (datasource, race_id, day))
+        return races[0] if races else None
+
+    def get_race_ids(self, datasource: str) -> set[str]:
+        rows = self._conn.execute("SELECT race_id FROM races WHERE datasource = ?", (datasource,))
+        return {row["race_id"] for row in rows}
+
+    def get_races_by_year(self, year: int, datasource: str | None = None) -> list[Race]:
+        where, params = "iso_date BETWEEN ? AND ?", [f"{year}-01-01", f"{year}-12-31"]
+        if datasource:
+            where, params = f"{where} AND datasource = ?", [*params, datasource]
+        return self._get_races(where, params)
+
+    def get_races_by_club(self, club: str) -> list[Race]:
+        """
+        Races where the club participated, matching both the normalized 'participant' and the raw 'club_name'.
+        """
+        return self._get_races(
+            "id IN (SELECT race FROM participants WHERE participant = ? OR club_name = ?)",
+            (club, club),
+        )
+
+    def get_races_by_name(self, name: str) -> list[Race]:
+        """
+        Races with the given normalized name (flag), any edition.
+        """
+        return self._get_races("id IN (SELECT race FROM race_names WHERE name = ?)", (name,))
+
+    def _save_race(self, race: Race) -> None:
+        (pk,) = self._conn.execute(_UPSERT_RACE, _race_row(race)).fetchone()
+        self._conn.execute("DELETE FROM race_names WHERE race = ?", (pk,))
+        self._conn.execute("DELETE FROM participants WHERE race = ?", (pk,))
+        self._conn.executemany(_INSERT_NAME, ((pk, i, n, e) for i, (n, e) in enumerate(race.normalized_names)))
+        self._conn.executemany(
+            _INSERT_PARTICIPANT, ((pk, i, *_participant_row(p)) for i, p in enumerate(race.participants))
+        )
+
+    def _get_races(self, where: str, params: Iterable[Any]) -> list[Race]:
+        params = list(params)
+        races = {
+            row["id"]: _race_from_row(row)
+            for row in self._conn.execute(
+                f"SELECT * FROM races WHERE {where} ORDER BY iso_date, datasource, race_id, day", params
+            )
+        }
+
+        subquery = f"SELECT id FROM races WHERE {where}"
+        for row in self._conn.execute(
+            f"SELECT * FROM race_names WHERE race IN ({subquery}) ORDER BY race, position", params
+        ):
+            races[row["race"]].normalized_names.append((row["name"], row["edition"]))
+        for row in self._conn.execute(
+            f"SELECT * FROM participants WHERE race IN ({subquery}) ORDER BY race, position", params
+        ):
+            race = races[row["race"]]
+            race.participants.append(_participant_from_row(row, race))
+        return list(races.values())
+
+
+def _race_row(race: Race) -> tuple[Any, ...]:
+    return (
+        race.datasource,
+        race.race_ids[0],
+        race.day,
+        json.dumps(race.race_ids),
+        race.name,
+        race.date,
+        race.parsed_date.isoformat(),
+        race.modality,
+        race.type,
+        race.league,
+        race.town,
+        race.organizer,
+        race.sponsor,
+        race.url,
+        race.gender,
+        race.category,
+        race.race_notes,
+        race.race_laps,
+        race.race_lanes,
+        race.cancelled,
+    )
+
+
+def _participant_row(participant: Participant) -> tuple[Any, ...]:
+    penalty = participant.penalty
+    return (
+        participant.gender,
+        participant.category,
+        participant.club_name,
+        participant.participant,
+        participant.lane,
+        participant.series,
+        json.dumps(participant.laps),
+        participant.distance,
+        participant.handicap,
+        participant.retired,
+        participant.absent,
+        participant.guest,
+        penalty.disqualification if penalty else None,
+        penalty.reason if penalty else None,
+        penalty.penalty if penalty else None,
+    )
+
+
+def _race_from_row(row: sqlite3.Row) -> Race:
+    return Race(
+        name=row["name"],
+        date=row["date"],
+        day=row["day"],
+        modality=row["modality"],
+        type=row["type"],
+        league=row["league"],
+        town=row["town"],
+        organizer=row["organizer"],
+        sponsor=row["sponsor"],
+        normalized_names=[],
+        race_ids=json.loads(row["race_ids"]),
+        url=row["url"],
+        datasource=row["datasource"],
+        gender=row["gender"],
+        category=row["category"],
+        participants=[],
+        race_notes=row["race_notes"],
+        race_laps=row["race_laps"],
+        race_lanes=row["race_lanes"],
+        cancelled=bool(row["cancelled"]),
+    )
+
+
+def _participant_from_row(row: sqlite3.Row, race: Race) -> Participant:
+    penalty = None
+    if row["disqualification"] is not None:
+        penalty = Penalty(bool(row["disqualification"]), reason=row["penalty_reason"], penalty=row["penalty"])
+    return Participant(
+        gender=row["gender"],
+        category=row["category"],
+        club_name=row["club_name"],
+        lane=row["lane"],
+        series=row["series"],
+        laps=json.loads(row["laps"]),
+        distance=row["distance"],
+        handicap=row["handicap"],
+        retired=bool(row["retired"]),
+        absent=bool(row["absent"]),
+        guest=bool(row["guest"]),
+        participant=row["participant"],
+        race=race,
+        penalty=penalty,
+    )
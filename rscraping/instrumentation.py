@@ -0,0 +1,157 @@
+"""
+Instrumentation hooks for the hot paths of the library: 'fetch' (Client requests), 'parse' (HtmlParser.parse_race)
+and 'normalize.*' (race level normalizations, e.g. penalties).
+
+Nothing is measured until an instrumentation is installed, the disabled cost is a global lookup per call. That is why
+per lap or per name functions (normalize_lap_time, normalize_club_name...) are not decorated with 'measured', their
+time is part of the 'parse' stage of the race.
+
+Usage:
+    with instrument(StageAggregator()) as aggregator:
+        client.get_race_by_id("1234")
+    print(aggregator.report())
+"""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Protocol
+
+
+class Instrumentation(Protocol):
+    def record(self, stage: str, datasource: str | None, seconds: float, size: int = 0) -> None:
+        """
+        Called after each measured operation.
+
+        Args:
+            stage (str): The measured stage ('fetch', 'parse', 'normalize.<function>').
+            datasource (str | None): The datasource being processed, if known.
+            seconds (float): The elapsed time.
+            size (int): Number of bytes processed (only for 'fetch').
+        """
+        ...
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    size: int = 0
+
+
+class StageAggregator:
+    """
+    In-memory thread-safe instrumentation, aggregates the records by (stage, datasource).
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str], StageStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, datasource: str | None, seconds: float, size: int = 0) -> None:
+        with self._lock:
+            stats = self.stats.setdefault((stage, datasource or "-"), StageStats())
+            stats.count += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.size += size
+
+    def report(self) -> str:
+        """
+        Per stage latency breakdown, sorted by total time.
+        """
+        total = sum(s.seconds for (stage, _), s in self.stats.items() if "." not in stage) or 1.0
+        lines = [
+            f"{'stage':<32} {'source':<10} {'count':>8} {'total':>10} {'mean':>10} {'max':>10} {'%':>6} {'KB':>10}"
+        ]
+        for (stage, datasource), s in sorted(self.stats.items(), key=lambda i: -i[1].seconds):
+            lines.append(
+                f"{stage:<32} {datasource:<10} {s.count:>8} {s.seconds * 1000:>8.1f}ms "
+                f"{s.seconds / s.count * 1000:>8.2f}ms {s.max_seconds * 1000:>8.1f}ms "
+                f"{s.seconds / total * 100:>6.1f} {s.size / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+_instrumentation: Instrumentation | None = None
+_datasource: ContextVar[str | None] = ContextVar("datasource", default=None)
+
+
+def get_instrumentation() -> Instrumentation | None:
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation | None) -> Instrumentation | None:
+    """
+    Install the given instrumentation (None disables it), returns the previous one.
+    """
+    global _instrumentation
+    previous, _instrumentation = _instrumentation, instrumentation
+    return previous
+
+
+@contextmanager
+def instrument[T: Instrumentation](instrumentation: T) -> Generator[T]:
+    previous = set_instrumentation(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        set_instrumentation(previous)
+
+
+@contextmanager
+def measure(stage: str, datasource: str | None = None) -> Generator[Callable[[int], None]]:
+    """
+    Measure the wrapped block as 'stage', normalizations run inside it are attributed to the same datasource.
+    Yields a callback to set the number of processed bytes.
+    """
+    if _instrumentation is None:
+        yield _ignore_size
+        return
+
+    size = 0
+
+    def set_size(value: int) -> None:
+        nonlocal size
+        size = value
+
+    token = _datasource.set(datasource or _datasource.get())
+    start = time.perf_counter()
+    try:
+        yield set_size
+    finally:
+        elapsed = time.perf_counter() - start
+        _datasource.reset(token)
+        if _instrumentation is not None:
+            _instrumentation.record(stage, datasource or _datasource.get(), elapsed, size)
+
+
+def measured[**P, R](stage: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator measuring each call of the function as 'stage'.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _instrumentation is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _instrumentation is not None:
+                    _instrumentation.record(stage, _datasource.get(), time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _ignore_size(_: int) -> None:
+    pass
@@ -1,15 +1,29 @@
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from datetime import datetime
-from typing import Protocol
+from typing import Any, Protocol, Self
 
 from parsel.selector import Selector
 
-from rscraping.data.models import Datasource, Race, RaceName
+from rscraping.data.models import Datasource, Race, RaceName, RaceSummary, RaceView
 
 
 class HtmlParser(Protocol):
+    # parsers keep no per-race state, so a single instance of each one is shared by every client, thread and pipeline
+    _instances: dict[type, Any] = {}
+
     DATASOURCE: Datasource
 
+    @classmethod
+    def instance(cls) -> Self:
+        """
+        Shared instance of the parser, created on first use.
+
+        Returns: Self: The parser instance.
+        """
+        if cls not in cls._instances:
+            cls._instances.setdefault(cls, cls())
+        return cls._instances[cls]
+
     def parse_race(self, selector: Selector, *, race_id: str, **kwargs) -> Race:
         """
         Parse the given Selector to retrieve the race object.
@@ -23,6 +37,19 @@ class HtmlParser(Protocol):
         """
         ...
 
+    def parse_race_view(self, selector: Selector, *, race_id: str, **kwargs) -> RaceView:
+        """
+        Parse only the metadata of the race, the rest of it is parsed with 'parse_race' when first needed.
+
+        Args:
+            selector (Selector): The Selector to parse.
+            race_id (str): The ID of the race to parse.
+            **kwargs: Additional keyword arguments, the same ones 'parse_race' accepts.
+
+        Returns: RaceView: The lazy race.
+        """
+        ...
+
     def parse_race_ids(self, selector: Selector, **kwargs) -> Generator[str]:
         """
         Parse the given Selector to retrieve the IDs of the races.
@@ -35,13 +62,13 @@ class HtmlParser(Protocol):
         """
         ...
 
-    def parse_race_ids_by_days(self, selector: Selector, days: list[datetime], **kwargs) -> Generator[str]:
+    def parse_race_ids_by_days(self, selector: Selector, days: Collection[datetime], **kwargs) -> Generator[str]:
         """
         Parse the given Selector to retrieve the IDs of the races that took place on the given days.
 
         Args:
             selector (Selector): The Selector to parse.
-            days (list[datetime]): The days to filter
+            days (Collection[datetime]): The days to filter, better a set as it is checked for every listed race.
             **kwargs: Additional keyword arguments.
 
         Yields: str: The IDs of the races.
@@ -59,3 +86,15 @@ class HtmlParser(Protocol):
         Yields: RaceName: The names of the races.
         """
         ...
+
+    def parse_race_summaries(self, selector: Selector, **kwargs) -> Generator[RaceSummary]:
+        """
+        Parse the given races listing to retrieve the metadata of each race without fetching its details page.
+
+        Args:
+            selector (Selector): The Selector to parse.
+            **kwargs: Additional keyword arguments.
+
+        Yields: RaceSummary: The summaries of the races.
+        """
+        ...
@@ -1,8 +1,9 @@
 import logging
 import os
 import re
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from datetime import datetime
+from functools import partial
 from typing import override
 
 from parsel.selector import Selector
@@ -19,7 +20,7 @@ from rscraping.data.constants import (
     RACE_TIME_TRIAL,
     RACE_TRAINERA,
 )
-from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName
+from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName, RaceSummary, RaceView
 from rscraping.data.normalization import (
     ensure_b_teams_have_the_main_team_racing,
     find_race_sponsor,
@@ -111,15 +112,34 @@ class ACTHtmlParser(HtmlParser):
 
         return race
 
+    @override
+    def parse_race_view(self, selector: Selector, *, race_id: str, is_female: bool = False, **kwargs) -> RaceView:
+        name = self.get_name(selector)
+        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+
+        t_date = find_date(name)
+        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+        return RaceView(
+            datasource=self.DATASOURCE.value,
+            race_id=race_id,
+            name=name,
+            date=t_date.strftime(DATE_FORMAT),
+            gender=GENDER_FEMALE if is_female else GENDER_MALE,
+            participants_count=len(self.get_participants(selector)),
+            loader=partial(self.parse_race, selector, race_id=race_id, is_female=is_female, **kwargs),
+        )
+
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
         urls = selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]/td[*]/a/@href').getall()
         return (url_parts[-1] for url_parts in (url.split("r=") for url in urls))
 
     @override
-    def parse_race_ids_by_days(self, selector: Selector, days: list[datetime], **kwargs) -> Generator[str]:
+    def parse_race_ids_by_days(self, selector: Selector, days: Collection[datetime], **kwargs) -> Generator[str]:
         assert len(days) > 0, "days must have at least one element"
-        assert all(d.year == days[0].year for d in days), "all days must be from the same year"
+        year = next(iter(days)).year
+        assert all(d.year == year for d in days), "all days must be from the same year"
 
         rows = selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]').getall()
         selectors = [Selector(r) for r in rows]
@@ -141,6 +161,21 @@ class ACTHtmlParser(HtmlParser):
             for s in selectors
         )
 
+    @override
+    def parse_race_summaries(self, selector: Selector, *, is_female: bool = False, **_) -> Generator[RaceSummary]:
+        rows = [Selector(r) for r in selector.xpath('//*[@id="col-a"]/div/section/div[5]/table/tbody/tr[*]').getall()]
+        for row in rows:
+            name = whitespaces_clean(row.xpath("//*/td[2]/a/text()").get("")).upper()
+            t_date = datetime.strptime(row.xpath("//*/td[4]/text()").get(""), "%d-%m-%Y")
+            yield RaceSummary(
+                datasource=self.DATASOURCE.value,
+                race_id=row.xpath("//*/td[2]/a/@href").get("").split("r=")[-1],
+                name=name,
+                date=t_date.strftime(DATE_FORMAT),
+                gender=GENDER_FEMALE if is_female else GENDER_MALE,
+                type=RACE_TIME_TRIAL if is_play_off(name) else None,
+            )
+
     ####################################################
     #                     GETTERS                      #
     ####################################################
@@ -1,8 +1,9 @@
 import logging
 import os
 import re
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from datetime import date, datetime
+from functools import partial
 from typing import override
 
 from parsel.selector import Selector
@@ -19,7 +20,7 @@ from rscraping.data.constants import (
     RACE_TIME_TRIAL,
     RACE_TRAINERA,
 )
-from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName
+from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName, RaceSummary, RaceView
 from rscraping.data.normalization import (
     ensure_b_teams_have_the_main_team_racing,
     find_race_sponsor,
@@ -113,6 +114,24 @@ class ARCHtmlParser(HtmlParser):
 
         return race
 
+    @override
+    def parse_race_view(self, selector: Selector, *, race_id: str, is_female: bool = False, **kwargs) -> RaceView:
+        name = self.get_name(selector)
+        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+
+        t_date = self.get_date(selector)
+        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+        return RaceView(
+            datasource=self.DATASOURCE.value,
+            race_id=race_id,
+            name=name,
+            date=t_date.strftime(DATE_FORMAT),
+            gender=GENDER_FEMALE if is_female else GENDER_MALE,
+            participants_count=len(self.get_participants(selector)),
+            loader=partial(self.parse_race, selector, race_id=race_id, is_female=is_female, **kwargs),
+        )
+
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
         urls = (
@@ -123,12 +142,13 @@ class ARCHtmlParser(HtmlParser):
         return (url_parts[-2] for url_parts in (url.split("/") for url in urls))
 
     @override
-    def parse_race_ids_by_days(self, selector: Selector, days: list[datetime], **kwargs) -> Generator[str]:
+    def parse_race_ids_by_days(self, selector: Selector, days: Collection[datetime], **kwargs) -> Generator[str]:
         assert len(days) > 0, "days must have at least one element"
-        assert all(d.year == days[0].year for d in days), "all days must be from the same year"
+        year = next(iter(days)).year
+        assert all(d.year == year for d in days), "all days must be from the same year"
 
         def _find_date(s: Selector) -> datetime | None:
-            maybe_date = f"{whitespaces_clean(s.xpath('//*/td[1]/span/text()').get('')).upper()} {days[0].year}"
+            maybe_date = f"{whitespaces_clean(s.xpath('//*/td[1]/span/text()').get('')).upper()} {year}"
             found_date = find_date(maybe_date, day_first=True)
             return datetime.combine(found_date, datetime.min.time()) if found_date else None
 
@@ -156,6 +176,36 @@ class ARCHtmlParser(HtmlParser):
             for s in selectors
         )
 
+    @override
+    def parse_race_summaries(
+        self,
+        selector: Selector,
+        *,
+        year: int | None = None,
+        is_female: bool = False,
+        **_,
+    ) -> Generator[RaceSummary]:
+        """
+        The listing only shows the day and month of each race, 'year' is needed to get their dates.
+        """
+        rows = (
+            selector.xpath('//*[@id="main"]/div[6]/table/tbody/tr[*]').getall()
+            if selector.xpath('//*[@id="proximas-regatas"]').get()
+            else selector.xpath('//*[@id="main"]/div[4]/table/tbody/tr[*]').getall()
+        )
+        for row in (Selector(r) for r in rows):
+            name = whitespaces_clean(row.xpath("//*/td[2]/span/a/text()").get("")).upper()
+            day = whitespaces_clean(row.xpath("//*/td[1]/span/text()").get("")).upper()
+            t_date = find_date(f"{day} {year}", day_first=True) if year else None
+            yield RaceSummary(
+                datasource=self.DATASOURCE.value,
+                race_id=row.xpath("//*/td[2]/span/a/@href").get("").split("/")[-2],
+                name=name,
+                date=t_date.strftime(DATE_FORMAT) if t_date else None,
+                gender=GENDER_FEMALE if is_female else GENDER_MALE,
+                type=RACE_TIME_TRIAL if is_play_off(name) else None,
+            )
+
     ####################################################
     #                     GETTERS                      #
     ####################################################
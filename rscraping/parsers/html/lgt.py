@@ -1,8 +1,9 @@
 import logging
 import os
 import re
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from datetime import date, datetime
+from functools import partial
 from typing import override
 
 from parsel.selector import Selector
@@ -22,7 +23,7 @@ from rscraping.data.constants import (
     SYNONYM_FEMALE,
     SYNONYMS,
 )
-from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName
+from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceName, RaceSummary, RaceView
 from rscraping.data.normalization import (
     ensure_b_teams_have_the_main_team_racing,
     find_edition,
@@ -48,9 +49,7 @@ class LGTHtmlParser(HtmlParser):
         assert results_selector is not None, f"{self.DATASOURCE}: 'results_selector' is required to parse a race"
 
         name = self.get_name(selector)
-        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
-        if name.upper() == "EREWEWEWERW" or name.upper() == "REGATA" or "?" in name:  # wtf
-            raise AssertionError(f"{self.DATASOURCE}: invalid {name=} found for {race_id=}")
+        self._validate_name(name, race_id)
 
         t_date = self.get_date(selector)
         assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
@@ -68,7 +67,7 @@ class LGTHtmlParser(HtmlParser):
             normalized_names = [(n, edition) for (n, _) in normalized_names]
         assert len(normalized_names) > 0, f"{self.DATASOURCE}: unable to normalize {name=}"
 
-        gender = GENDER_FEMALE if is_female(name) or (league is not None and "F" in league.split()) else GENDER_MALE
+        gender = self.get_gender(name, league)
         participants = self.get_participants(results_selector)
         race_laps = self.get_race_laps(results_selector)
         assert race_laps >= 0, f"{self.DATASOURCE}: unable to parse laps for {race_id=}"
@@ -121,17 +120,43 @@ class LGTHtmlParser(HtmlParser):
 
         return race
 
+    @override
+    def parse_race_view(
+        self,
+        selector: Selector,
+        *,
+        race_id: str,
+        results_selector: Selector | None = None,
+        **kwargs,
+    ) -> RaceView:
+        name = self.get_name(selector)
+        self._validate_name(name, race_id)
+
+        t_date = self.get_date(selector)
+        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+        return RaceView(
+            datasource=self.DATASOURCE.value,
+            race_id=race_id,
+            name=name,
+            date=t_date.strftime(DATE_FORMAT),
+            gender=self.get_gender(name, self.get_league(selector)),
+            participants_count=len(self.get_participants(results_selector)) if results_selector else None,
+            loader=partial(self.parse_race, selector, race_id=race_id, results_selector=results_selector, **kwargs),
+        )
+
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
         urls = selector.xpath("//*/div/div/div[*]/div/a/@href").getall()
         return (u.split("/")[-1].split("-")[0] for u in urls[0:])
 
     @override
-    def parse_race_ids_by_days(self, selector: Selector, days: list[datetime], **kwargs) -> Generator[str]:
+    def parse_race_ids_by_days(self, selector: Selector, days: Collection[datetime], **kwargs) -> Generator[str]:
         assert len(days) > 0, "days must have at least one element"
-        assert all(d.year == days[0].year for d in days), "all days must be from the same year"
+        year = next(iter(days)).year
+        assert all(d.year == year for d in days), "all days must be from the same year"
 
-        year, month, day = days[0].year, None, None
+        month, day = None, None
         divs = [Selector(s) for s in selector.xpath("/html/body/div/div/div[*]").getall()]
 
         for div in divs:
@@ -164,6 +189,40 @@ class LGTHtmlParser(HtmlParser):
             if u.xpath("//*/a/@href").get(None)
         )
 
+    @override
+    def parse_race_summaries(self, selector: Selector, *, year: int | None = None, **_) -> Generator[RaceSummary]:
+        """
+        Parse the calendar page, races listed before any month header (or without 'year') have no date.
+        """
+        month = None
+        divs = [Selector(s) for s in selector.xpath("/html/body/div/div/div[*]").getall()]
+
+        for div in divs:
+            maybe_month = whitespaces_clean(div.xpath("//*/div/div/text()").get(""))
+            if maybe_month:
+                month = whitespaces_clean(maybe_month.upper())
+                continue
+
+            url = div.xpath("//*/div/a/@href").get(None)
+            if not url:
+                continue
+
+            t_date = None
+            maybe_day = whitespaces_clean(div.xpath("//*/div/div/table/tr[1]/td[1]/text()").get(""))
+            if maybe_day and month and year:
+                day = int(maybe_day.upper().replace("D", "").replace("S", ""))
+                t_date = find_date(f"{day} {month} {year}", day_first=True)
+
+            name = whitespaces_clean(div.xpath("//*/div/div/table/tr[1]/td[2]/text()").get("")).upper()
+            yield RaceSummary(
+                datasource=self.DATASOURCE.value,
+                race_id=url.split("/")[-1].split("-")[0],
+                name=name,
+                date=t_date.strftime(DATE_FORMAT) if t_date else None,
+                gender=self.get_gender(name, None),
+                type=RACE_TIME_TRIAL if is_play_off(name) else None,
+            )
+
     ####################################################
     #                     GETTERS                      #
     ####################################################
@@ -174,6 +233,9 @@ class LGTHtmlParser(HtmlParser):
     def get_name(self, selector: Selector) -> str:
         return whitespaces_clean(selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/h1/text()').get("")).upper()
 
+    def get_gender(self, name: str, league: str | None) -> str:
+        return GENDER_FEMALE if is_female(name) or (league is not None and "F" in league.split()) else GENDER_MALE
+
     def get_date(self, selector: Selector) -> date:
         value = whitespaces_clean(selector.xpath('//*[@id="regata"]/div/div/div[3]/div[2]/p[2]/text()').get(""))
         return datetime.strptime(value, "%d/%m/%Y").date()
@@ -271,6 +333,11 @@ class LGTHtmlParser(HtmlParser):
                 series += 1
         return 0
 
+    def _validate_name(self, name: str, race_id: str) -> None:
+        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+        if name.upper() == "EREWEWEWERW" or name.upper() == "REGATA" or "?" in name:  # wtf
+            raise AssertionError(f"{self.DATASOURCE}: invalid {name=} found for {race_id=}")
+
     ####################################################
     #                  NORMALIZATION                   #
     ####################################################
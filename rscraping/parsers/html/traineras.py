@@ -1,14 +1,15 @@
 import logging
 import os
 from collections import Counter
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from datetime import date, datetime
+from functools import partial
 from typing import override
 
 from parsel.selector import Selector
 
 from pyutils.strings import find_date, whitespaces_clean
-from rscraping.data.checks import is_branch_club, should_be_time_trial
+from rscraping.data.checks import is_branch_club, should_be_time_trial, tokenize
 from rscraping.data.constants import (
     CATEGORY_ABSOLUT,
     CATEGORY_SCHOOL,
@@ -22,7 +23,7 @@ from rscraping.data.constants import (
     RACE_TIME_TRIAL,
     RACE_TRAINERA,
 )
-from rscraping.data.models import Club, Datasource, Participant, Penalty, Race, RaceName
+from rscraping.data.models import Club, Datasource, Participant, Penalty, Race, RaceName, RaceSummary, RaceView
 from rscraping.data.normalization import (
     ensure_b_teams_have_the_main_team_racing,
     find_league,
@@ -63,6 +64,16 @@ class TrainerasHtmlParser(HtmlParser):
     _VETERAN = ["VF", "VM"]
     _SCHOOL = ["JM", "JF", "CM", "CF"]
 
+    # words of the flag page table titles of each (gender, category), mixed tables have no category
+    _FLAG_TABLES = {
+        (GENDER_MALE, CATEGORY_ABSOLUT): ["SÉNIOR", "MASCULINO"],
+        (GENDER_MALE, CATEGORY_VETERAN): ["VETERANO", "MASCULINO"],
+        (GENDER_MALE, CATEGORY_SCHOOL): ["JUVENIL", "MASCULINO"],
+        (GENDER_FEMALE, CATEGORY_ABSOLUT): ["SÉNIOR", "FEMENINO"],
+        (GENDER_FEMALE, CATEGORY_VETERAN): ["VETERANO", "FEMENINO"],
+        (GENDER_FEMALE, CATEGORY_SCHOOL): ["JUVENIL", "FEMENINO"],
+    }
+
     @override
     def parse_race(self, selector: Selector, *, race_id: str | None = None, table: int | None = None, **_) -> Race:
         assert race_id is not None, f"{self.DATASOURCE}: 'race_id' is required to parse a race"
@@ -90,7 +101,8 @@ class TrainerasHtmlParser(HtmlParser):
         participants = self.get_participants(selector, table)
         race_lanes = self.get_race_lanes(participants)
         race_notes = self.get_race_notes(selector)
-        ttype = self.get_type(participants) if not should_be_time_trial(name, t_date) else RACE_TIME_TRIAL
+        tokenized_name = tokenize(name)
+        ttype = self.get_type(participants) if not should_be_time_trial(tokenized_name, t_date) else RACE_TIME_TRIAL
 
         race = Race(
             name=name,
@@ -99,7 +111,7 @@ class TrainerasHtmlParser(HtmlParser):
             type=ttype,
             day=self._clean_day(table, name),
             modality=RACE_TRAINERA,
-            league=find_league(name),
+            league=find_league(tokenized_name),
             town=self.get_town(selector, table=table),
             organizer=None,
             sponsor=find_race_sponsor(self.get_name(selector)),
@@ -172,20 +184,47 @@ class TrainerasHtmlParser(HtmlParser):
 
         return race
 
+    @override
+    def parse_race_view(
+        self,
+        selector: Selector,
+        *,
+        race_id: str,
+        table: int | None = None,
+        **kwargs,
+    ) -> RaceView:
+        if self._races_count(selector) > 1 and not table:
+            logger.error(f"{self.DATASOURCE}: multiple races found for {race_id=} without specifying a table")
+            raise MultiRaceException("no table specified")
+
+        name = self.get_name(selector)
+        assert name, f"{self.DATASOURCE}: no name found for {race_id=}"
+
+        t_date = self.get_date(selector, table or 1)
+        assert t_date is not None, f"{self.DATASOURCE}: no date found for {race_id=}"
+
+        return RaceView(
+            datasource=self.DATASOURCE.value,
+            race_id=race_id,
+            name=name,
+            date=t_date.strftime(DATE_FORMAT),
+            gender=self.get_gender(selector),
+            participants_count=len(self.get_participants(selector, table or 1)),
+            loader=partial(self.parse_race, selector, race_id=race_id, table=table, **kwargs),
+        )
+
     @override
     def parse_race_ids(self, selector: Selector, **_) -> Generator[str]:
         return (race.race_id for race in self.parse_race_names(selector))
 
     @override
-    def parse_race_ids_by_days(self, selector: Selector, days: list[datetime], **kwargs) -> Generator[str]:
+    def parse_race_ids_by_days(self, selector: Selector, days: Collection[datetime], **kwargs) -> Generator[str]:
         assert len(days) > 0, "days must have at least one element"
-        assert all(d.year == days[0].year for d in days), "all days must be from the same year"
+        year = next(iter(days)).year
+        assert all(d.year == year for d in days), "all days must be from the same year"
 
         rows = [Selector(r) for r in selector.xpath("/html/body/div[1]/div[2]/table/tbody/tr").getall()]
         for row in rows:
-            ttype = row.xpath("//*/td[2]/text()").get("")
-            name = whitespaces_clean(row.xpath("//*/td[1]/a/text()").get("").upper())
-            name = " ".join(n for n in name.split() if n != ttype)
             if datetime.strptime(row.xpath("//*/td[5]/text()").get(""), "%d-%m-%Y") in days:
                 yield row.xpath("//*/td[1]/a/@href").get("").split("/")[-1]
 
@@ -198,6 +237,24 @@ class TrainerasHtmlParser(HtmlParser):
             name = " ".join(n for n in name.split() if n != ttype)
             yield RaceName(race_id=row.xpath("//*/td[1]/a/@href").get("").split("/")[-1], name=name)
 
+    @override
+    def parse_race_summaries(self, selector: Selector, **_) -> Generator[RaceSummary]:
+        rows = [Selector(r) for r in selector.xpath("/html/body/div[1]/div[2]/table/tbody/tr").getall()]
+        for row in rows:
+            ttype = whitespaces_clean(row.xpath("//*/td[2]/text()").get(""))
+            name = whitespaces_clean(row.xpath("//*/td[1]/a/text()").get("").upper())
+            name = " ".join(n for n in name.split() if n != ttype)
+            t_date = datetime.strptime(row.xpath("//*/td[5]/text()").get(""), "%d-%m-%Y").date()
+            yield RaceSummary(
+                datasource=self.DATASOURCE.value,
+                race_id=row.xpath("//*/td[1]/a/@href").get("").split("/")[-1],
+                name=name,
+                date=t_date.strftime(DATE_FORMAT),
+                gender=self._get_tag_gender(ttype),
+                type=RACE_TIME_TRIAL if should_be_time_trial(name, t_date) else None,
+                category=self._get_tag_category(ttype),
+            )
+
     def parse_flag_race_ids(self, selector: Selector, gender: str, category: str, **_) -> Generator[str]:
         table = self._get_matching_flag_table(gender, category, selector)
         if table:
@@ -266,12 +323,7 @@ class TrainerasHtmlParser(HtmlParser):
 
     def get_gender(self, selector: Selector) -> str:
         parts = selector.xpath("/html/body/div[1]/main/div/div/div/div[1]/h2/text()").get("")
-        part = whitespaces_clean(parts.split(" - ")[-1])
-        if part in self._MIX:
-            return GENDER_MIX
-        if part in self._FEMALE:
-            return GENDER_FEMALE
-        return GENDER_MALE
+        return self._get_tag_gender(whitespaces_clean(parts.split(" - ")[-1]))
 
     def get_type(self, participants: list[Selector]) -> str:
         series = [self.get_series(p) for p in participants]
@@ -290,12 +342,7 @@ class TrainerasHtmlParser(HtmlParser):
 
     def get_category(self, selector: Selector) -> str:
         subtitle = selector.xpath("/html/body/div[1]/main/div/div/div/div[1]/h2/text()").get("").upper()
-        category = whitespaces_clean(subtitle.split("-")[-1])
-        if category in self._VETERAN:
-            return CATEGORY_VETERAN
-        if category in self._SCHOOL:
-            return CATEGORY_SCHOOL
-        return CATEGORY_ABSOLUT
+        return self._get_tag_category(whitespaces_clean(subtitle.split("-")[-1]))
 
     def get_town(self, selector: Selector, table: int) -> str:
         parts = self._get_race_title(selector, table)
@@ -402,6 +449,20 @@ class TrainerasHtmlParser(HtmlParser):
             return value in self._SCHOOL
         return False
 
+    def _get_tag_gender(self, tag: str) -> str:
+        if tag in self._MIX:
+            return GENDER_MIX
+        if tag in self._FEMALE:
+            return GENDER_FEMALE
+        return GENDER_MALE
+
+    def _get_tag_category(self, tag: str) -> str:
+        if tag in self._VETERAN:
+            return CATEGORY_VETERAN
+        if tag in self._SCHOOL:
+            return CATEGORY_SCHOOL
+        return CATEGORY_ABSOLUT
+
     def _clean_day(self, table: int, name: str) -> int:
         if "TERESA" in name and "HERRERA" in name:
             return 1
@@ -411,21 +472,8 @@ class TrainerasHtmlParser(HtmlParser):
         """
         Returns the table that matches the gender|category combination we want.
         """
-        words = []
-        if gender == GENDER_MALE:
-            if category == CATEGORY_ABSOLUT:
-                words = ["SÉNIOR", "MASCULINO"]
-            elif category == CATEGORY_VETERAN:
-                words = ["VETERANO", "MASCULINO"]
-            elif category == CATEGORY_SCHOOL:
-                words = ["JUVENIL", "MASCULINO"]
-        elif gender == GENDER_FEMALE:
-            if category == CATEGORY_ABSOLUT:
-                words = ["SÉNIOR", "FEMENINO"]
-            elif category == CATEGORY_VETERAN:
-                words = ["VETERANO", "FEMENINO"]
-            elif category == CATEGORY_SCHOOL:
-                words = ["JUVENIL", "FEMENINO"]
+        if gender in (GENDER_MALE, GENDER_FEMALE):
+            words = self._FLAG_TABLES.get((gender, category), [])
         else:
             words = ["MIXTO"]
 
@@ -451,10 +499,10 @@ class TrainerasHtmlParser(HtmlParser):
     def _fix_castro_mess(participant_name: str, club_name: str, t_date: date) -> str:
         # HACK: CASTRO URDIALES, CASTRO and CASTREÑA differentiation
         if "CASTRO " in participant_name or "CASTREÑA" in participant_name:
-            branch = ""
-            if is_branch_club(participant_name):
+            branch, tokenized_name = "", tokenize(participant_name)
+            if is_branch_club(tokenized_name):
                 branch = " B"
-            if is_branch_club(participant_name, letter="C"):
+            if is_branch_club(tokenized_name, letter="C"):
                 branch = " C"
 
             if t_date.year < 2013:
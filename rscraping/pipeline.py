@@ -0,0 +1,129 @@
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import batched
+
+from parsel.selector import Selector
+
+from rscraping.data.codec import decode_race, encode_race
+from rscraping.data.models import Datasource, Race, RacePage
+from rscraping.instrumentation import measure
+from rscraping.parsers.html import (
+    ACTHtmlParser,
+    ARCHtmlParser,
+    ETEHtmlParser,
+    HtmlParser,
+    LGTHtmlParser,
+    MultiRaceException,
+    TrainerasHtmlParser,
+)
+
+logger = logging.getLogger(__name__)
+
+# shared parser getters, so each process only builds the parsers of the datasources it actually parses
+_PARSERS: dict[Datasource, Callable[[], HtmlParser]] = {
+    Datasource.ACT: ACTHtmlParser.instance,
+    Datasource.ARC: ARCHtmlParser.instance,
+    Datasource.ETE: ETEHtmlParser.instance,
+    Datasource.LGT: LGTHtmlParser.instance,
+    Datasource.TRAINERAS: TrainerasHtmlParser.instance,
+}
+
+
+def parse_race_page(page: RacePage) -> bytes | None:
+    """
+    Parse a downloaded race page, as 'Client.get_race_by_url' does, returning the race encoded with
+    'rscraping.data.codec' so it's cheap to send back from a worker process.
+
+    Parameters:
+    - page (RacePage): The downloaded page.
+
+    Returns: bytes | None: The encoded race or None if it can't be parsed.
+    """
+    race = _parse_race_page(page)
+    return encode_race(race) if race else None
+
+
+def parse_race_pages(
+    pages: Iterable[RacePage],
+    max_workers: int | None = None,
+    chunksize: int = 4,
+    threads: bool = False,
+) -> Generator[Race | None]:
+    """
+    Parse the downloaded pages in a pool of processes, so the CPU bound parsing and normalization of a backfill scales
+    with the available cores while the pages are fetched elsewhere (e.g. with 'Client.get_race_page').
+
+    With 'threads' the pages are parsed in a thread pool instead, sharing memory and skipping the serialization of the
+    races. It only scales on free-threaded builds ('python3.13t'), with the GIL enabled it runs about as fast as
+    parsing them serially. Installed instrumentation (see 'rscraping.instrumentation') only measures thread workers.
+
+    Pages are consumed as the workers need them, at most 2 * 'max_workers' tasks ahead of the last yielded race, so a
+    lazy iterable of pages is fetched while the previous ones are parsed and never held in memory all at once.
+
+    NOTE: steps of 'get_race_by_id' that need more requests after parsing (e.g. the traineras.es flag edition) are not
+    applied.
+
+    Parameters:
+    - pages (Iterable[RacePage]): The downloaded pages.
+    - max_workers (int | None): Number of workers (default: the executor default).
+    - chunksize (int): Number of pages sent to a worker process at once (default: 4), ignored for threads.
+    - threads (bool): Use a thread pool instead of a process pool (default: False).
+
+    Yields: Race | None: The parsed races in the same order as the pages, None for the ones that can't be parsed.
+    """
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    if threads:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from _bounded_map(executor, _parse_race_page, pages, window)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for chunk in _bounded_map(executor, _parse_race_page_chunk, batched(pages, chunksize), window):
+            yield from (decode_race(data) if data else None for data in chunk)
+
+
+def _bounded_map[T, R](executor: Executor, func: Callable[[T], R], items: Iterable[T], window: int) -> Generator[R]:
+    """
+    Ordered 'executor.map' that only submits a new item when less than 'window' are in flight.
+    """
+    pending: deque[Future[R]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _parse_race_page_chunk(pages: tuple[RacePage, ...]) -> list[bytes | None]:
+    return [parse_race_page(page) for page in pages]
+
+
+def _parse_race_page(page: RacePage) -> Race | None:
+    parser = _PARSERS[Datasource(page.datasource)]()
+    kwargs = dict(page.options)
+    if page.results is not None:
+        kwargs["results_selector"] = Selector(page.results.decode("utf-8"))
+
+    try:
+        with measure("parse", page.datasource):
+            race = parser.parse_race(
+                selector=Selector(page.content.decode("utf-8")),
+                race_id=page.race_id,
+                is_female=page.is_female,
+                **kwargs,
+            )
+    except (AssertionError, MultiRaceException) as e:
+        logger.warning(f"{page.datasource}: unable to parse race {page.race_id}: {e}")
+        return None
+
+    if race:
+        race.url = page.url
+    return race
@@ -0,0 +1,218 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from rscraping.data.constants import (
+    SYNONYM_CITY_HALL,
+    SYNONYM_FLAG,
+    SYNONYM_GRAND_PRIX,
+    SYNONYM_MEMORIAL,
+    SYNONYM_RACE,
+    SYNONYM_TRAINERA,
+    SYNONYMS,
+)
+from rscraping.data.models import Race
+
+# words shared by too many races to tell them apart
+_STOPWORDS = {
+    "TROFEO",
+    "COPA",
+    "GP",
+    *(
+        w
+        for s in [SYNONYM_FLAG, SYNONYM_GRAND_PRIX, SYNONYM_RACE, SYNONYM_TRAINERA]
+        for n in SYNONYMS[s]
+        for w in n.split()
+    ),
+    *SYNONYMS[SYNONYM_CITY_HALL],
+    *SYNONYMS[SYNONYM_MEMORIAL],
+}
+_ROMAN = re.compile(r"^[IVXLCDM]+$")
+
+# score weights, they add up to 1
+_NAME_WEIGHT = 0.6
+_EDITION_WEIGHT = 0.15
+_DATE_WEIGHT = 0.15
+_TOWN_WEIGHT = 0.1
+
+
+@dataclass
+class RaceMatch:
+    left: str  # Race.key
+    right: str  # Race.key
+    score: float
+
+
+@dataclass
+class RaceCluster:
+    races: list[Race]
+    matches: list[RaceMatch] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        """
+        Score of the weakest match holding the cluster together, 1.0 for single races.
+        """
+        return min((m.score for m in self.matches), default=1.0)
+
+    @property
+    def datasources(self) -> list[str]:
+        return [r.datasource for r in self.races]
+
+
+@dataclass
+class _Features:
+    ordinal: int  # date ordinal
+    tokens: frozenset[str]
+    editions: frozenset[int]
+    town: str | None
+
+
+class RaceResolver:
+    """
+    Find the races of different datasources that are the same regatta.
+
+    Races are indexed by blocking keys (date, name token) so each race is only scored against the ones held on the
+    same days sharing a meaningful word of their normalized names. A candidate pair is scored by its names overlap,
+    editions, dates and towns, and pairs over 'threshold' are merged into clusters (union-find). Races of the same
+    datasource, day number, gender or category are never merged.
+
+    Usage:
+        resolver = RaceResolver()
+        resolver.add_all(act_races + lgt_races + traineras_races)
+        clusters = resolver.clusters()
+    """
+
+    def __init__(self, threshold: float = 0.6, date_tolerance: int = 1, max_block_size: int = 64):
+        """
+        Parameters:
+        - threshold (float): Minimum score to consider two races the same one (default: 0.6).
+        - date_tolerance (int): Days of difference allowed between the dates of the same race (default: 1).
+        - max_block_size (int): Blocks with more races are ignored as their token is too common (default: 64).
+        """
+        self._threshold = threshold
+        self._date_tolerance = date_tolerance
+        self._max_block_size = max_block_size
+
+        self._races: list[Race] = []
+        self._features: list[_Features] = []
+        self._blocks: dict[tuple[int, str], list[int]] = {}
+        self._parents: list[int] = []
+        self._datasources: dict[int, set[str]] = {}  # datasources of each cluster root
+        self._matches: list[tuple[int, int, float]] = []
+        self._comparisons = 0
+
+    @property
+    def comparisons(self) -> int:
+        """
+        Number of candidate pairs scored so far, it grows linearly with the races when the blocking works.
+        """
+        return self._comparisons
+
+    def add_all(self, races: Iterable[Race]) -> None:
+        for race in races:
+            self.add(race)
+
+    def add(self, race: Race) -> list[RaceMatch]:
+        """
+        Index the race and merge it with its matches, returns the accepted ones sorted by score.
+        """
+        idx = len(self._races)
+        features = _features(race)
+        self._races.append(race)
+        self._features.append(features)
+        self._parents.append(idx)
+        self._datasources[idx] = {race.datasource}
+
+        candidates: set[int] = set()
+        for day in range(features.ordinal - self._date_tolerance, features.ordinal + self._date_tolerance + 1):
+            for token in features.tokens:
+                block = self._blocks.get((day, token), [])
+                if len(block) <= self._max_block_size:
+                    candidates.update(block)
+
+        scores = [(self._score(idx, c), c) for c in candidates if self._can_match(idx, c)]
+        self._comparisons += len(scores)
+        matches = []
+        for score, other in sorted(scores, key=lambda s: (-s[0], s[1])):  # ties go to the earliest race
+            if score < self._threshold:
+                break
+            if self._union(idx, other):
+                self._matches.append((other, idx, score))
+                matches.append(RaceMatch(self._races[other].key, race.key, score))
+
+        for token in features.tokens:
+            self._blocks.setdefault((features.ordinal, token), []).append(idx)
+        return matches
+
+    def clusters(self) -> list[RaceCluster]:
+        """
+        Every added race grouped with its matches, in the order they were added.
+        """
+        clusters: dict[int, RaceCluster] = {}
+        for idx, race in enumerate(self._races):
+            clusters.setdefault(self._find(idx), RaceCluster(races=[])).races.append(race)
+        for left, right, score in self._matches:
+            match = RaceMatch(self._races[left].key, self._races[right].key, score)
+            clusters[self._find(left)].matches.append(match)
+        return list(clusters.values())
+
+    def _can_match(self, idx: int, other: int) -> bool:
+        race, other_race = self._races[idx], self._races[other]
+        return (
+            race.datasource != other_race.datasource
+            and race.day == other_race.day
+            and (not race.gender or not other_race.gender or race.gender == other_race.gender)
+            and (not race.category or not other_race.category or race.category == other_race.category)
+        )
+
+    def _score(self, idx: int, other: int) -> float:
+        a, b = self._features[idx], self._features[other]
+        names = len(a.tokens & b.tokens) / min(len(a.tokens), len(b.tokens))
+        editions = 0.5 if not a.editions or not b.editions else float(not a.editions.isdisjoint(b.editions))
+        dates = 1.0 if a.ordinal == b.ordinal else 0.5
+        towns = 0.5 if not a.town or not b.town else float(a.town == b.town)
+        return _NAME_WEIGHT * names + _EDITION_WEIGHT * editions + _DATE_WEIGHT * dates + _TOWN_WEIGHT * towns
+
+    def _find(self, idx: int) -> int:
+        root = idx
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[idx] != root:
+            self._parents[idx], idx = root, self._parents[idx]
+        return root
+
+    def _union(self, idx: int, other: int) -> bool:
+        """
+        Merge both clusters unless they are already the same or share a datasource.
+        """
+        root, other_root = self._find(idx), self._find(other)
+        if root == other_root or not self._datasources[root].isdisjoint(self._datasources[other_root]):
+            return False
+        self._parents[root] = other_root
+        self._datasources[other_root] |= self._datasources.pop(root)
+        return True
+
+
+def resolve_races(races: Iterable[Race], **kwargs) -> list[RaceCluster]:
+    """
+    Group the races of several datasources referring to the same regatta, see 'RaceResolver' for the arguments.
+    """
+    resolver = RaceResolver(**kwargs)
+    resolver.add_all(races)
+    return resolver.clusters()
+
+
+def _features(race: Race) -> _Features:
+    tokens = {
+        w
+        for name, _ in race.normalized_names or [(race.name, None)]
+        for w in name.replace("-", " ").split()
+        if len(w) > 2 and w not in _STOPWORDS and not _ROMAN.match(w)
+    }
+    return _Features(
+        ordinal=race.parsed_date.toordinal(),
+        tokens=frozenset(tokens),
+        editions=frozenset(e for _, e in race.normalized_names if e is not None),
+        town=race.town,
+    )
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+
+import requests
+
+from rscraping.clients import Client
+from rscraping.data.constants import DATE_FORMAT, GENDER_FEMALE, GENDER_MALE
+from rscraping.data.models import Race
+from rscraping.parsers.html import MultiRaceException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    name: str
+    date: str | None
+    hash: str | None
+    failure: str | None = None  # why the race can't be retrieved, only set for the failures that won't go away
+
+
+@dataclass
+class SyncReport:
+    new: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    rechecked: list[str] = field(default_factory=list)  # recent races fetched again without changes
+    unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)  # failures of this sync, permanent and transient ones
+    skipped: list[str] = field(default_factory=list)  # races that failed permanently in a previous sync
+
+    # races added or changed since the last sync
+    races: list[Race] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return len(self.new) + len(self.changed) + len(self.rechecked) + len(self.failed)
+
+
+def load_manifest(file_name: str) -> dict[str, ManifestEntry]:
+    if not os.path.isfile(file_name):
+        return {}
+    with open(file_name) as file:
+        return {k: ManifestEntry(**v) for k, v in json.load(file).items()}
+
+
+def save_manifest(manifest: dict[str, ManifestEntry], file_name: str) -> None:
+    tmp_file_name = f"{file_name}.tmp"
+    with open(tmp_file_name, "w") as file:
+        json.dump({k: asdict(v) for k, v in sorted(manifest.items())}, file, indent=2, ensure_ascii=False)
+    os.replace(tmp_file_name, file_name)
+
+
+def race_hash(race: Race) -> str:
+    return hashlib.sha256(race.to_json().encode("utf-8")).hexdigest()
+
+
+def sync_season(
+    client: Client,
+    year: int,
+    manifest_file: str,
+    recent_days: int = 14,
+    today: date | None = None,
+    **kwargs,
+) -> SyncReport:
+    """
+    Incrementally sync a season comparing the datasource listing with a local manifest, so only the races that can
+    have changed are downloaded.
+
+    1. Retrieve the (race_id, name) listing of the season
+    2. Fetch the details of the new races, of the ones renamed in the listing and of the ones that hit a network error
+    3. Re-fetch the races that took place in the last 'recent_days' as their results can still be amended
+    4. Compare the content hash with the one in the manifest to know if they changed
+    5. Save the updated manifest, also when the sync is interrupted by an error
+
+    Races whose request fails (requests.RequestException) are recorded without hash and retried in the next sync. The
+    ones fetched but without a race (excluded IDs, empty or multi-race pages) are recorded with their 'failure' reason
+    and not requested again until their name changes in the listing. Manifest entries are keyed by
+    '<datasource>:<gender>:<race_id>' so a single file can hold every client.
+
+    Parameters:
+    - client (Client): The client of the datasource to sync.
+    - year (int): The season to sync.
+    - manifest_file (str): JSON file with the state of the previous syncs, created if it doesn't exist.
+    - recent_days (int): Number of days after a race during which it's still re-fetched (default: 14).
+    - today (date | None): Reference day for 'recent_days' (default: today).
+    - **kwargs: Additional keyword arguments forwarded to 'get_race_by_id'.
+
+    Returns: SyncReport: The race IDs classified by what the sync did, and the new/changed races.
+    """
+    today = today or date.today()
+    manifest = load_manifest(manifest_file)
+    report = SyncReport()
+    gender = GENDER_FEMALE if client.is_female else GENDER_MALE
+
+    try:
+        for race_name in client.get_race_names_by_year(year):
+            key = f"{client.DATASOURCE}:{gender}:{race_name.race_id}"
+            entry = manifest.get(key)
+            if entry and entry.name == race_name.name:
+                if entry.failure:
+                    report.skipped.append(race_name.race_id)
+                    continue
+                if entry.hash and not _is_recent(entry, today, recent_days):
+                    report.unchanged.append(race_name.race_id)
+                    continue
+
+            try:
+                race = client.get_race_by_id(race_name.race_id, **kwargs)
+                failure = None if race else "not found"
+            except requests.RequestException as e:
+                race, failure = None, None
+                logger.warning(f"{client.DATASOURCE}: request of race {race_name.race_id} failed, will retry: {e}")
+            except MultiRaceException:
+                race, failure = None, "multi race"
+            if not race:
+                if failure:
+                    logger.warning(f"{client.DATASOURCE}: unable to retrieve race {race_name.race_id}: {failure}")
+                manifest[key] = ManifestEntry(name=race_name.name, date=None, hash=None, failure=failure)
+                report.failed.append(race_name.race_id)
+                continue
+
+            content_hash = race_hash(race)
+            manifest[key] = ManifestEntry(name=race_name.name, date=race.date, hash=content_hash)
+            if not entry or not entry.hash:
+                report.new.append(race_name.race_id)
+            elif entry.hash != content_hash:
+                report.changed.append(race_name.race_id)
+            else:
+                report.rechecked.append(race_name.race_id)
+                continue
+            report.races.append(race)
+    finally:
+        # keep the progress of the races already fetched even if the sync is interrupted
+        save_manifest(manifest, manifest_file)
+    return report
+
+
+def _is_recent(entry: ManifestEntry, today: date, recent_days: int) -> bool:
+    if not entry.date:
+        return False
+    return datetime.strptime(entry.date, DATE_FORMAT).date() >= today - timedelta(days=recent_days)
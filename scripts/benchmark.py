@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import MISSING, field, fields, make_dataclass
+from datetime import datetime, time
+
+sys.path[0] = os.path.join(os.path.dirname(__file__), "..")
+logger = logging.getLogger(__name__)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "html")
+
+
+def _parse_arguments():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmark", type=str, choices=sorted(BENCHMARKS.keys()), help="Benchmark to run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best one is reported.")
+    parser.add_argument("--items", type=int, default=100_000, help="Number of items for the memory/codec benchmarks.")
+    parser.add_argument("--pages", type=int, default=200, help="Number of pages for the parse benchmark.")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="Number of workers for the parse benchmark."
+    )
+    return parser.parse_args()
+
+
+def _timeit(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _report(name: str, seconds: float, items: int) -> None:
+    print(f"{name:<24} {seconds * 1000:>10.2f}ms {seconds / items * 1e6:>10.3f}us/item")
+
+
+####################################################
+#                       LAPS                       #
+####################################################
+
+
+def _fixture_laps() -> list[str]:
+    laps = []
+    for file_name in sorted(os.listdir(FIXTURES)):
+        with open(os.path.join(FIXTURES, file_name)) as file:
+            cells = Selector(file.read()).xpath("//td/text()").getall()
+        laps.extend(c for c in cells if any(s in c for s in [":", ".", ","]) and any(d.isdigit() for d in c))
+    return laps
+
+
+def _strptime_lap_time(value: str) -> time | None:
+    # previous 'normalize_lap_time' implementation, kept as the benchmark baseline
+    if value.startswith(":"):
+        value = "00" + value
+    parts = re.findall(r"\d+", value)
+    if all(p == "00" for p in parts):
+        return None
+    if len(parts) == 2:
+        if len(parts[0]) == 3:
+            parts[0] = parts[0][1:]
+        if len(parts[1]) == 3:
+            parts[1] = parts[1][:-1]
+        if len(parts[0]) == 4:
+            return time_or_none(datetime.strptime(f"{parts[0][0:2]}:{parts[0][2:]},{parts[1]}", "%M:%S,%f").time())
+        if len(parts[1]) == 4:
+            return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1][0:2]},{parts[1][2:]}", "%M:%S,%f").time())
+        return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1]}", "%M:%S").time())
+    if len(parts) == 3:
+        return time_or_none(datetime.strptime(f"{parts[0]}:{parts[1]},{parts[2]}", "%M:%S,%f").time())
+    return None
+
+
+def benchmark_laps(repeat: int, **_):
+    def run(func: Callable[[str], time | None]) -> list[time | str | None]:
+        results: list[time | str | None] = []
+        for lap in laps:
+            try:
+                results.append(func(lap))
+            except ValueError:
+                results.append("ValueError")
+        return results
+
+    laps = _fixture_laps()
+    if run(_strptime_lap_time) != run(normalize_lap_time):
+        raise AssertionError("lap parsers results differ")
+
+    print(f"{len(laps)} laps found in fixtures")
+    _report("strptime", _timeit(lambda: run(_strptime_lap_time), repeat), len(laps))
+    _report("normalize_lap_time", _timeit(lambda: run(normalize_lap_time), repeat), len(laps))
+
+
+####################################################
+#                      MEMORY                      #
+####################################################
+
+
+def _unslotted(cls: type) -> type:
+    # same dataclass but keeping a per-instance __dict__, as the models were before using slots
+    return make_dataclass(
+        cls.__name__,
+        [(f.name, f.type) if f.default is MISSING else (f.name, f.type, field(default=f.default)) for f in fields(cls)],
+    )
+
+
+def _race(race_cls: type, participant_cls: type, penalty_cls: type, participants: int):
+    race = race_cls(
+        name="BANDEIRA VIRXE DO CARME",
+        date="07/07/2024",
+        day=1,
+        modality=RACE_TRAINERA,
+        type=RACE_CONVENTIONAL,
+        league="LIGA A",
+        town="RIVEIRA",
+        organizer=None,
+        sponsor=None,
+        normalized_names=[("BANDEIRA VIRXE DO CARME", 9)],
+        race_ids=["1234"],
+        url=None,
+        datasource=Datasource.LGT.value,
+        gender=GENDER_MALE,
+        category=CATEGORY_ABSOLUT,
+        participants=[],
+    )
+    for i in range(participants):
+        race.participants.append(
+            participant_cls(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name=f"CR CLUB {i}",
+                lane=i % 6 + 1,
+                series=i // 6 + 1,
+                laps=[f"{m:02d}:{i % 60:02d}.{i % 100:02d}0000" for m in (6, 11, 17, 22)],
+                distance=5556,
+                handicap=None,
+                participant=f"CLUB {i}",
+                race=race,
+                penalty=penalty_cls(disqualification=True, reason=None) if i % 10 == 0 else None,
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+        )
+    return race
+
+
+def _participants_memory(race_cls: type, participant_cls: type, penalty_cls: type, items: int) -> int:
+    tracemalloc.start()
+    _race(race_cls, participant_cls, penalty_cls, items)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+def benchmark_memory(items: int, **_):
+    before = _participants_memory(_unslotted(Race), _unslotted(Participant), _unslotted(Penalty), items)
+    after = _participants_memory(Race, Participant, Penalty, items)
+
+    print(f"{items} participants")
+    print(f"{'__dict__ models':<24} {before / items:>10.1f} bytes/participant")
+    print(f"{'slotted models':<24} {after / items:>10.1f} bytes/participant")
+
+
+####################################################
+#                      CODEC                       #
+####################################################
+
+
+def benchmark_codec(repeat: int, items: int, **_):
+    races = [_race(Race, Participant, Penalty, 12) for _ in range(max(items // 12, 1))]
+    # realistic times so the codec can't benefit from every race having the same laps
+    rng = random.Random(0)
+    for participant in (p for r in races for p in r.participants):
+        participant.laps = [
+            f"{cs // 6000:02d}:{cs // 100 % 60:02d}.{cs % 100:02d}0000"
+            for cs in sorted(rng.randrange(30_000, 150_000) for _ in participant.laps)
+        ]
+    payloads = [r.to_json() for r in races]
+    data = encode_races(races)
+    if [r.to_json() for r in decode_races(data)] != payloads:
+        raise AssertionError("codec round trip differs from JSON")
+
+    json_size = sum(len(p.encode("utf-8")) for p in payloads)
+    print(f"{len(races)} races, {len(races) * 12} participants")
+    print(f"{'json':<24} {json_size:>10} bytes")
+    print(f"{'codec (per race)':<24} {sum(len(encode_race(r)) for r in races):>10} bytes")
+    print(f"{'codec (batch)':<24} {len(data):>10} bytes")
+    _report("json encode", _timeit(lambda: [r.to_json() for r in races], repeat), len(races))
+    _report("codec encode", _timeit(lambda: encode_races(races), repeat), len(races))
+    _report("json decode", _timeit(lambda: [Race.from_json(p) for p in payloads], repeat), len(races))
+    _report("codec decode", _timeit(lambda: decode_races(data), repeat), len(races))
+
+
+####################################################
+#                     RESOLVER                     #
+####################################################
+
+
+def benchmark_resolver(repeat: int, items: int, **_):
+    races = []
+    for datasource in [Datasource.ACT, Datasource.ARC, Datasource.LGT, Datasource.TRAINERAS]:
+        for i in range(items // 4):
+            race = _race(Race, Participant, Penalty, 0)
+            race.name, race.date = f"BANDERA DE CLUB{i}", f"{i % 28 + 1:02d}/{i % 12 + 1:02d}/2023"
+            race.normalized_names, race.race_ids = [(race.name, i)], [f"{datasource}-{i}"]
+            race.datasource, race.town = datasource.value, None
+            races.append(race)
+
+    resolver = RaceResolver()
+    resolver.add_all(races)
+    print(f"{len(races)} races, {len(resolver.clusters())} clusters, {resolver.comparisons} comparisons")
+    _report("resolve_races", _timeit(lambda: resolve_races(races), repeat), len(races))
+
+
+####################################################
+#                      PARSE                       #
+####################################################
+
+
+def _fixture_pages():
+    def read(file_name: str) -> bytes:
+        with open(os.path.join(FIXTURES, file_name), "rb") as file:
+            return file.read()
+
+    return [
+        RacePage(Datasource.ACT, "1234", "", read("act_details.html"), is_female=False),
+        RacePage(Datasource.ARC, "1234", "", read("arc_details.html"), is_female=False),
+        RacePage(
+            Datasource.LGT, "1234", "", read("lgt_details.html"), is_female=False, results=read("lgt_results.html")
+        ),
+        RacePage(Datasource.TRAINERAS, "1234", "", read("traineras_race.html"), is_female=False),
+    ]
+
+
+def benchmark_parse(repeat: int, pages: int, workers: int, **_):
+    fixtures = _fixture_pages()
+    race_pages = (fixtures * (pages // len(fixtures) + 1))[:pages]
+
+    def run(**kwargs) -> list[Race | None]:
+        return list(parse_race_pages(race_pages, **kwargs))
+
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"{pages} pages, {workers} workers, GIL {'enabled' if gil else 'disabled'}")
+    _report("serial", _timeit(lambda: run(threads=True, max_workers=1), repeat), pages)
+    _report("threads", _timeit(lambda: run(threads=True, max_workers=workers), repeat), pages)
+    _report("processes", _timeit(lambda: run(max_workers=workers), repeat), pages)
+
+
+BENCHMARKS: dict[str, Callable[..., None]] = {
+    "codec": benchmark_codec,
+    "laps": benchmark_laps,
+    "memory": benchmark_memory,
+    "parse": benchmark_parse,
+    "resolver": benchmark_resolver,
+}
+
+
+def main(benchmark: str, repeat: int, items: int, pages: int, workers: int):
+    BENCHMARKS[benchmark](repeat=repeat, items=items, pages=pages, workers=workers)
+
+
+if __name__ == "__main__":
+    from parsel.selector import Selector
+
+    from rscraping.data.codec import decode_races, encode_race, encode_races
+    from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+    from rscraping.data.models import Datasource, Participant, Penalty, Race, RacePage
+    from rscraping.data.normalization import normalize_lap_time, time_or_none
+    from rscraping.pipeline import parse_race_pages
+    from rscraping.resolver import RaceResolver, resolve_races
+
+    args = _parse_arguments()
+    logger.info(f"{os.path.basename(__file__)}:: args -> {args.__dict__}")
+
+    main(args.benchmark, args.repeat, args.items, args.pages, args.workers)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import cProfile
 import logging
 import os
+import pstats
 import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
 
 sys.path[0] = os.path.join(os.path.dirname(__file__), "..")
 logger = logging.getLogger(__name__)
@@ -20,19 +26,116 @@ def _parse_arguments():
     )
     parser.add_argument("--table", type=int, help="Table we want (for multi races pages).")
     parser.add_argument("--save", action="store_true", default=False, help="Saves the output to a csv file.")
+    parser.add_argument("--profile", action="store_true", default=False, help="Profiles the race lookup.")
+    parser.add_argument("--stacks", type=str, help="Profiles the lookup saving the sampled stacks to the given file.")
     return parser.parse_args()
 
 
-def main(race_id: str, datasource: str, is_female: bool, save: bool, table: int | None):
+####################################################
+#                     PROFILE                      #
+####################################################
+
+# (category, substrings of the profiled '<file>:<function>'), first match wins
+_CATEGORIES = [
+    ("network", ["requests/", "urllib3/", "socket", "ssl", "http/"]),
+    ("selector", ["parsel/", "lxml", "cssselect/"]),
+    ("normalization", ["rscraping/data/normalization/", "pyutils/", "simplemma/"]),
+    ("parser", ["rscraping/parsers/"]),
+]
+
+
+class _StackSampler(threading.Thread):
+    """
+    Samples the stack of the given thread, collecting them in the collapsed format used by flamegraph tools.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        super().__init__(daemon=True)
+        self.stacks: Counter[str] = Counter()
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+            time.sleep(self._interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def save(self, file_name: str):
+        with open(file_name, "w") as file:
+            file.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _category(file_name: str, function: str) -> str:
+    location = f"{file_name.replace(os.sep, '/')}:{function}"
+    return next((c for c, keys in _CATEGORIES if any(k in location for k in keys)), "other")
+
+
+def _profile[T](func: Callable[[], T], stacks_file: str | None) -> T:
+    profiler = cProfile.Profile()
+    sampler = _StackSampler(threading.get_ident()) if stacks_file else None
+
+    with instrument(StageAggregator()) as aggregator:
+        if sampler:
+            sampler.start()
+        profiler.enable()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+            if sampler:
+                sampler.stop()
+
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            categories: Counter[str] = Counter()
+            for (file_name, _, function), (_, _, own_time, _, _) in stats.stats.items():
+                categories[_category(file_name, function)] += own_time
+            total = sum(categories.values()) or 1.0
+
+            print(f"{'category':<16} {'time':>10} {'%':>6}", file=sys.stderr)
+            for category, seconds in categories.most_common():
+                print(f"{category:<16} {seconds * 1000:>8.1f}ms {seconds / total * 100:>6.1f}", file=sys.stderr)
+            print(file=sys.stderr)
+            print(aggregator.report(), file=sys.stderr)
+            print(file=sys.stderr)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(20)
+
+            if sampler and stacks_file:
+                sampler.save(stacks_file)
+                print(f"sampled stacks saved to {stacks_file}", file=sys.stderr)
+
+
+def main(
+    race_id: str,
+    datasource: str,
+    is_female: bool,
+    save: bool,
+    table: int | None,
+    profile: bool = False,
+    stacks: str | None = None,
+):
     if not Datasource.has_value(datasource):
         raise ValueError(f"invalid datasource={datasource}")
 
-    race = find_race(
-        race_id=race_id,
-        datasource=Datasource(datasource),
-        is_female=is_female,
-        table=table,
-    )
+    def lookup():
+        return find_race(
+            race_id=race_id,
+            datasource=Datasource(datasource),
+            is_female=is_female,
+            table=table,
+        )
+
+    race = _profile(lookup, stacks) if profile or stacks else lookup()
     if not race:
         raise ValueError(f"not found race for race_id={race_id}")
 
@@ -46,8 +149,9 @@ if __name__ == "__main__":
     from rscraping import find_race
     from rscraping.data.functions import save_csv, sys_print_items
     from rscraping.data.models import Datasource
+    from rscraping.instrumentation import StageAggregator, instrument
 
     args = _parse_arguments()
     logger.info(f"{os.path.basename(__file__)}:: args -> {args.__dict__}")
 
-    main(args.race_id, args.datasource, args.female, args.save, args.table)
+    main(args.race_id, args.datasource, args.female, args.save, args.table, args.profile, args.stacks)
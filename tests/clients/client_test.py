@@ -1,11 +1,18 @@
+import os
 import unittest
+from datetime import date
+from unittest import mock
 
 from rscraping.clients import ACTClient, ARCClient, Client, ETEClient, LGTClient, TrainerasClient
 from rscraping.data.constants import CATEGORY_VETERAN, GENDER_FEMALE
 from rscraping.data.models import Datasource
+from rscraping.parsers.html import ACTHtmlParser, ETEHtmlParser
 
 
 class TestClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fixtures = os.path.join(os.getcwd(), "tests", "fixtures", "html")
+
     def test_client_initialization(self) -> None:
         self.assertTrue(isinstance(Client(source=Datasource.TRAINERAS), TrainerasClient))
         self.assertTrue(isinstance(Client(source=Datasource.ACT), ACTClient))
@@ -27,3 +34,43 @@ class TestClient(unittest.TestCase):
 
         client = Client(source=Datasource.TRAINERAS, gender=GENDER_FEMALE, category=CATEGORY_VETERAN)
         self.assertTrue(isinstance(client, TrainerasClient))
+
+    def test_get_race_ids_by_date_range(self) -> None:
+        with open(os.path.join(self.fixtures, "act_races.html")) as file:
+            response = mock.Mock(text=file.read())
+        client = Client(source=Datasource.ACT)
+
+        with mock.patch.object(ACTClient, "_fetch", return_value=response) as fetch:
+            self.assertEqual(
+                list(client.get_race_ids_by_date_range(date(2021, 7, 3), date(2021, 7, 4))),
+                ["1616789082", "1616789390"],
+            )
+            self.assertEqual(
+                list(client.get_race_ids_by_date_range(date(2021, 7, 10), date(2021, 7, 10))), ["1616789420"]
+            )
+            self.assertEqual(fetch.call_count, 1)
+
+            # each season of the range uses its own listing
+            self.assertEqual(len(list(client.get_race_ids_by_date_range(date(2020, 12, 31), date(2021, 7, 3)))), 1)
+            self.assertEqual(fetch.call_count, 2)
+
+        with self.assertRaises(ValueError):
+            list(client.get_race_ids_by_date_range(date(2021, 7, 4), date(2021, 7, 3)))
+
+    def test_current_season_listing_is_not_cached(self) -> None:
+        client, today = Client(source=Datasource.ACT), date.today()
+
+        with mock.patch.object(ACTClient, "_fetch", return_value=mock.Mock(text="<html></html>")) as fetch:
+            list(client.get_race_ids_by_date_range(today, today))
+            list(client.get_race_ids_by_date_range(today, today))
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_clients_share_the_parsers(self) -> None:
+        male, female = Client(source=Datasource.ACT), Client(source=Datasource.ACT, gender=GENDER_FEMALE)
+        self.assertIs(male._html_parser, female._html_parser)
+        self.assertIs(male._html_parser, ACTHtmlParser.instance())
+
+        # ETE extends the ARC parser but each datasource keeps its own instance
+        self.assertIsInstance(Client(source=Datasource.ETE, gender=GENDER_FEMALE)._html_parser, ETEHtmlParser)
+        self.assertNotIsInstance(Client(source=Datasource.ARC)._html_parser, ETEHtmlParser)
@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import unittest
+
+from rscraping.crawler import CrawlJob, CrawlScheduler, JobType, SourceLimits, run_job
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Race
+
+
+class TestCrawlScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.checkpoint_file = os.path.join(self.folder.name, "crawl.json")
+        self.limits = {d: SourceLimits(concurrency=1, delay=0) for d in Datasource}
+        self.executed: list[str] = []
+        self.failing: set[str] = set()
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_run_follows_generated_jobs(self) -> None:
+        scheduler = CrawlScheduler(self._handler, limits=self.limits, current_year=2024)
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024"))
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.LGT, "2024"))
+
+        races: list[Race] = []
+        report = scheduler.run(on_race=races.append)
+
+        self.assertEqual(report.done, 6)
+        self.assertEqual(report.races, 4)
+        self.assertEqual(sorted(r.race_ids[0] for r in races), ["act-1", "act-2", "lgt-1", "lgt-2"])
+        self.assertEqual(scheduler.pending, [])
+
+    def test_current_season_runs_first(self) -> None:
+        scheduler = CrawlScheduler(self._handler, limits=self.limits, current_year=2024)
+        scheduler.add(CrawlJob(JobType.RACE, Datasource.ACT, "old", year=2020))
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2023"))
+        scheduler.add(CrawlJob(JobType.RACE, Datasource.ACT, "current", year=2024))
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024"))
+        scheduler.run()
+
+        self.assertEqual(self.executed[:2], ["season:2024", "race:current"])
+
+    def test_resume_from_checkpoint(self) -> None:
+        self.failing = {"act-2"}
+        scheduler = CrawlScheduler(self._handler, limits=self.limits, checkpoint_file=self.checkpoint_file)
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024"))
+        report = scheduler.run()
+
+        self.assertEqual(report.done, 2)
+        self.assertEqual(len(report.failed), 1)
+        self.assertEqual([j.target for j in scheduler.failed], ["act-2"])
+
+        self.failing, self.executed = set(), []
+        scheduler = CrawlScheduler(self._handler, limits=self.limits, checkpoint_file=self.checkpoint_file)
+        self.assertFalse(scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024")))
+        report = scheduler.run()
+
+        self.assertEqual(self.executed, ["race:act-2"])
+        self.assertEqual((report.done, report.races, report.failed), (1, 1, []))
+
+    def test_checkpoint_appends_completed_jobs(self) -> None:
+        scheduler = CrawlScheduler(self._handler, limits=self.limits, checkpoint_file=self.checkpoint_file)
+        scheduler.add(CrawlJob(JobType.SEASON, Datasource.ACT, "2024"))
+        scheduler.run()
+
+        with open(self.checkpoint_file) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual(len(lines), 6)  # 3 queued and 3 done jobs
+        self.assertEqual(sum("done" in line for line in lines), 3)
+
+    def test_run_job_validates_the_job(self) -> None:
+        with self.assertRaises(ValueError):
+            run_job(CrawlJob(JobType.FLAG, Datasource.ACT, "1"))
+        with self.assertRaises(ValueError):
+            run_job(CrawlJob(JobType.CLUB, Datasource.ACT, "1"))
+
+    def _handler(self, job: CrawlJob) -> tuple[list[Race], list[CrawlJob]]:
+        self.executed.append(f"{job.type}:{job.target}")
+        if job.target in self.failing:
+            raise ValueError(f"unable to retrieve {job.target}")
+        if job.type == JobType.SEASON:
+            race_ids = [f"{job.datasource}-{i}" for i in (1, 2)]
+            return [], [CrawlJob(JobType.RACE, job.datasource, r, year=int(job.target)) for r in race_ids]
+        return [self._race(job.target, job.datasource)], []
+
+    @staticmethod
+    def _race(race_id: str, datasource: str) -> Race:
+        return Race(
+            name="BANDERA",
+            date="07/07/2024",
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league=None,
+            town=None,
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDERA", 1)],
+            race_ids=[race_id],
+            url=None,
+            datasource=datasource,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
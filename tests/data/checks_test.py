@@ -0,0 +1,61 @@
+import unittest
+from datetime import date
+
+from rscraping.data.checks import (
+    is_act,
+    is_arc,
+    is_branch_club,
+    is_ete,
+    is_female,
+    is_lgt,
+    is_memorial,
+    should_be_time_trial,
+    tokenize,
+)
+from rscraping.data.normalization import find_league
+
+
+class TestChecks(unittest.TestCase):
+    def test_tokenized_name_checks(self) -> None:
+        names = [
+            "LIGA GALEGA DE TRAIÑAS A LGT A",
+            "LGTF FEMENINA",
+            "EUSKO LABEL LIGA",
+            "LIGA EUSKOTREN",
+            "ARC2 BANDERA",
+            "MEMORIAL ETE",
+            "BANDERA VILLA DE BILBAO",
+            "PLAY OFF ACT",
+        ]
+
+        for name in names:
+            tokens = tokenize(name)
+            self.assertEqual(is_female(tokens), is_female(name))
+            self.assertEqual(is_memorial(tokens), is_memorial(name))
+            self.assertEqual(is_act(tokens), is_act(name))
+            self.assertEqual(is_act(tokens, is_female=True), is_act(name, is_female=True))
+            self.assertEqual(is_arc(tokens, category=2), is_arc(name, category=2))
+            self.assertEqual(is_ete(tokens), is_ete(name))
+            self.assertEqual(
+                should_be_time_trial(tokens, date(2024, 7, 6)), should_be_time_trial(name, date(2024, 7, 6))
+            )
+            for letter in [None, "A", "B", "F"]:
+                self.assertEqual(is_lgt(tokens, letter), is_lgt(name, letter))
+            self.assertEqual(find_league(tokens), find_league(name))
+
+    def test_checks(self) -> None:
+        self.assertTrue(is_lgt("LGT A", "A"))
+        self.assertTrue(is_lgt("LGTF", "F"))
+        self.assertFalse(is_lgt("LGTA"))
+        self.assertTrue(is_female("LIGA FEMENINA"))
+        self.assertTrue(is_memorial("MEMORIAL PEPE"))
+        self.assertTrue(is_arc("ARC"))
+        self.assertFalse(is_arc("ARC 2"))
+        self.assertTrue(should_be_time_trial("BANDERA VILLA DE BILBAO", date(2024, 7, 7)))
+        self.assertEqual(find_league("PLAY OFF ACT"), "ACT")
+        self.assertEqual(find_league("LIGA EUSKOTREN"), "LIGA EUSKOTREN")
+
+    def test_is_branch_club(self) -> None:
+        self.assertTrue(is_branch_club(tokenize("ORIO B")))
+        self.assertTrue(is_branch_club("HONDARRIBIA c", letter="C"))
+        self.assertFalse(is_branch_club("BILBAO"))
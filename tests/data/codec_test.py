@@ -0,0 +1,96 @@
+import unittest
+
+from rscraping.data.codec import decode_race, decode_races, encode_race, encode_races
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Participant, Penalty, Race
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.race = Race(
+            name="BANDEIRA VIRXE DO CARME",
+            date="07/07/2024",
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league="LIGA A",
+            town="RIVEIRA",
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDEIRA VIRXE DO CARME", 9), ("MEMORIAL ÑANDÚ", None)],
+            race_ids=["1234"],
+            url=None,
+            datasource=Datasource.LGT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+            race_lanes=4,
+        )
+        self.race.participants = [
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name="CR MUROS",
+                lane=4,
+                series=1,
+                laps=["06:35.000000", "24:24.970000", "24:24.975000"],
+                distance=5556,
+                handicap=None,
+                participant="MUROS",
+                race=self.race,
+                penalty=Penalty(disqualification=True, reason=None, penalty=-10),
+                absent=False,
+                retired=False,
+                guest=False,
+            ),
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name="CR CABO",
+                lane=None,
+                series=None,
+                laps=[],
+                distance=None,
+                handicap="00:30",
+                participant="CABO",
+                race=self.race,
+                absent=False,
+                retired=True,
+                guest=True,
+            ),
+        ]
+
+    def test_round_trip(self) -> None:
+        race = decode_race(encode_race(self.race))
+
+        self.assertEqual(race.to_json(), self.race.to_json())
+        self.assertEqual(race.participants[0].laps, self.race.participants[0].laps)
+        self.assertEqual(race.participants[0].penalty, self.race.participants[0].penalty)
+        self.assertIsNone(race.participants[1].lane)
+        self.assertIs(race.participants[1].race, race)
+
+    def test_batch_shares_strings(self) -> None:
+        single = encode_race(self.race)
+        batch = encode_races([self.race] * 10)
+
+        self.assertLess(len(batch), 10 * len(single))
+        self.assertEqual(len(decode_races(batch)), 10)
+        self.assertLess(len(single), len(self.race.to_json().encode("utf-8")))
+
+    def test_invalid_payload(self) -> None:
+        data = encode_race(self.race)
+        with self.assertRaises(ValueError):
+            decode_races(b"XXX" + data[3:])
+        with self.assertRaises(ValueError):
+            decode_races(data[:3] + b"\xff" + data[4:])
+
+    def test_truncated_payload(self) -> None:
+        data = encode_race(self.race)
+        with self.assertRaisesRegex(ValueError, "truncated payload"):
+            decode_races(data[:-8])
+        with self.assertRaisesRegex(ValueError, "truncated payload"):
+            decode_races(data[:5])
+
+    def test_decode_race_expects_one_race(self) -> None:
+        with self.assertRaises(ValueError):
+            decode_race(encode_races([self.race, self.race]))
@@ -0,0 +1,125 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.functions import (
+    PARTICIPANTS_TABLE_SCHEMA,
+    RACES_TABLE_SCHEMA,
+    load_ndjson,
+    load_ndjson_race_ids,
+    load_table,
+    save_csv,
+    save_ndjson,
+    save_tables,
+)
+from rscraping.data.models import Datasource, Participant, Race
+
+
+class TestFunctions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.folder.name, "races.ndjson")
+        self.races = [self._race(race_id) for race_id in ["1", "2", "3"]]
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_ndjson_round_trip(self) -> None:
+        self.assertEqual(save_ndjson(iter(self.races + [None]), self.file_name), 3)
+
+        races = list(load_ndjson(self.file_name))
+        self.assertEqual([r.to_json() for r in races], [r.to_json() for r in self.races])
+        self.assertIs(races[0].participants[0].race, races[0])
+
+    def test_ndjson_file_name_without_extension(self) -> None:
+        file_name = os.path.join(self.folder.name, "races")
+        save_ndjson(self.races, file_name)
+
+        self.assertTrue(os.path.exists(f"{file_name}.ndjson"))
+        self.assertEqual(len(list(load_ndjson(file_name))), 3)
+        self.assertEqual(load_ndjson_race_ids(file_name), {"1", "2", "3"})
+
+    def test_ndjson_resume_after_interrupted_export(self) -> None:
+        save_ndjson(self.races[:2], self.file_name)
+        with open(self.file_name, "a") as file:
+            file.write(self.races[2].to_json()[:20])  # interrupted while writing
+
+        self.assertEqual(load_ndjson_race_ids(self.file_name), {"1", "2"})
+        self.assertEqual([r.race_ids for r in load_ndjson(self.file_name)], [["1"], ["2"]])
+
+        save_ndjson(self.races[2:], self.file_name)
+        self.assertEqual([r.race_ids for r in load_ndjson(self.file_name)], [["1"], ["2"], ["3"]])
+
+    def test_save_csv_skips_private_fields(self) -> None:
+        file_name = os.path.join(self.folder.name, "races")
+        self.assertEqual(self.races[0].year, 2024)  # fills the parsed date cache
+        save_csv(self.races, file_name)
+
+        with open(f"{file_name}.csv") as file:
+            headers = next(csv.reader(file))
+        self.assertIn("date", headers)
+        self.assertNotIn("_parsed_date", headers)
+
+    def test_save_tables(self) -> None:
+        file_name = os.path.join(self.folder.name, "season")
+        self.assertEqual(save_tables(iter(self.races + [None]), file_name, batch_size=2), 3)
+
+        with open(f"{file_name}_participants.columns.ndjson") as file:
+            self.assertEqual(json.loads(next(file))["schema"], PARTICIPANTS_TABLE_SCHEMA)
+
+        races = list(load_table(file_name, "races"))
+        self.assertEqual([len(r["race_key"]) for r in races], [2, 1])  # row groups of 'batch_size' races
+        self.assertEqual(list(races[0]), list(RACES_TABLE_SCHEMA))
+        self.assertEqual(races[0]["race_key"], ["lgt:1:1", "lgt:2:1"])
+        self.assertEqual(races[0]["date"], [date(2024, 7, 7), date(2024, 7, 7)])
+        self.assertEqual(races[0]["edition"], [9, 9])
+        self.assertEqual(races[0]["race_laps"], [None, None])
+
+        participants = list(load_table(file_name, "participants"))
+        self.assertEqual(participants[0]["race_key"], ["lgt:1:1", "lgt:2:1"])
+        self.assertEqual(participants[0]["laps"], [[39500, 146497], [39500, 146497]])
+        self.assertEqual(participants[0]["final_time"], [146497, 146497])
+        self.assertEqual(participants[0]["disqualified"], [False, False])
+
+    @staticmethod
+    def _race(race_id: str) -> Race:
+        race = Race(
+            name="BANDEIRA VIRXE DO CARME",
+            date="07/07/2024",
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league="LIGA A",
+            town="RIVEIRA",
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDEIRA VIRXE DO CARME", 9)],
+            race_ids=[race_id],
+            url=None,
+            datasource=Datasource.LGT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
+        race.participants.append(
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name="CR MUROS",
+                lane=4,
+                series=1,
+                laps=["06:35.000000", "24:24.970000"],
+                distance=5556,
+                handicap=None,
+                participant="MUROS",
+                race=race,
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+        )
+        return race
@@ -0,0 +1,146 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.index import ParticipantIndex, RaceNameEntry, RaceNameIndex, _trigrams
+from rscraping.data.models import Datasource, Participant, Race, RaceName
+
+
+class TestParticipantIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = ParticipantIndex()
+        self.index.add_all(
+            [
+                self._race("2", "15/07/2023", ["ORIO", "HONDARRIBIA"]),
+                self._race("1", "08/07/2023", ["ORIO", "URDAIBAI"]),
+                self._race("3", "06/07/2024", ["ORIO"]),
+                None,
+            ]
+        )
+
+    def test_queries(self) -> None:
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.participants, ["HONDARRIBIA", "ORIO", "URDAIBAI"])
+        self.assertEqual(self.index.get_years("ORIO"), [2023, 2024])
+        self.assertEqual(self.index.get_race_keys("ORIO"), ["traineras:1:1", "traineras:2:1", "traineras:3:1"])
+        self.assertEqual(self.index.get_race_keys("ORIO", year=2024), ["traineras:3:1"])
+        self.assertEqual(self.index.get_entries("UNKNOWN"), [])
+
+        entry = self.index.get_entries("URDAIBAI")[0]
+        self.assertEqual((entry.date, entry.lane, entry.series, entry.time), ("2023-07-08", 2, 1, "20:00.000000"))
+
+    def test_readding_a_race_replaces_it(self) -> None:
+        self.index.add(self._race("1", "08/07/2023", ["ORIO"]))
+
+        self.assertEqual(self.index.get_entries("URDAIBAI"), [])
+        self.assertNotIn("URDAIBAI", self.index.participants)
+        self.assertEqual(len(self.index.get_entries("ORIO", year=2023)), 2)
+
+    def test_persistence(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, "participants.json")
+            self.assertEqual(len(ParticipantIndex.load(file_name)), 0)
+
+            self.index.save(file_name)
+            index = ParticipantIndex.load(file_name)
+
+        self.assertIn("traineras:1:1", index)
+        self.assertEqual(index.get_entries("ORIO"), self.index.get_entries("ORIO"))
+        index.add(self._race("1", "08/07/2023", ["ORIO"]))
+        self.assertEqual(index.get_entries("URDAIBAI"), [])
+
+    @staticmethod
+    def _race(race_id: str, date: str, participants: list[str]) -> Race:
+        race = Race(
+            name="BANDERA DE ORIO",
+            date=date,
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league=None,
+            town=None,
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDERA DE ORIO", None)],
+            race_ids=[race_id],
+            url=None,
+            datasource=Datasource.TRAINERAS.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
+        race.participants = [
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name=participant,
+                lane=lane,
+                series=1,
+                laps=["06:35.000000", "20:00.000000"],
+                distance=5556,
+                handicap=None,
+                participant=participant,
+                race=race,
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+            for lane, participant in enumerate(participants, start=1)
+        ]
+        return race
+
+
+class TestRaceNameIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = RaceNameIndex()
+        self.index.add(RaceNameEntry(Datasource.ACT, GENDER_MALE, "1", "BANDERA DE ORIO", 2023))
+        self.index.add(RaceNameEntry(Datasource.ACT, GENDER_MALE, "2", "BANDERA DE ZARAUTZ", 2023))
+        self.index.add(RaceNameEntry(Datasource.LGT, GENDER_MALE, "3", "BANDEIRA CONCELLO DE BUEU", 2023))
+        self.index.add(RaceNameEntry(Datasource.TRAINERAS, GENDER_MALE, "4", "Bandera de Orio (Orio Kaixa)", 2023))
+
+    def test_search(self) -> None:
+        results = self.index.search("BANDERA ORIO")
+        self.assertEqual([e.race_id for e, _ in results[:2]], ["1", "4"])
+        self.assertGreater(results[0][1], results[1][1])
+
+        self.assertEqual([e.race_id for e, _ in self.index.search("bandeira de bueu", limit=1)], ["3"])
+        self.assertEqual([e.race_id for e, _ in self.index.search("ORIO", datasource=Datasource.TRAINERAS)], ["4"])
+        self.assertEqual(self.index.search("SANTURTZI", threshold=0.5), [])
+        self.assertEqual(self.index.search(""), [])
+
+    def test_search_skips_common_trigrams(self) -> None:
+        for size in (1000, 4000):
+            index = RaceNameIndex()
+            for i in range(size):
+                index.add(RaceNameEntry(Datasource.ACT, GENDER_MALE, str(i), f"BANDERA DE CLUB{i}", 2023))
+            index.add(RaceNameEntry(Datasource.ACT, GENDER_MALE, "ORIO", "BANDERA DE ORIO", 2023))
+
+            self.assertEqual(len(index._candidates(_trigrams("BANDERA DE ORIO"))), 1)
+            self.assertEqual([e.race_id for e, _ in index.search("BANDERA DE ORIO", limit=1)], ["ORIO"])
+            self.assertEqual(len(index.search("BANDERA DE", limit=size + 1)), size + 1)
+
+    def test_update(self) -> None:
+        client = mock.Mock(DATASOURCE=Datasource.ACT, is_female=False)
+        client.get_race_names_by_year.return_value = [
+            RaceName("1", "BANDERA DE ORIO"),
+            RaceName("5", "BANDERA DE ZUMAIA"),
+        ]
+
+        self.assertEqual(self.index.update(client, 2023), 2)
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual([e.race_id for e, _ in self.index.search("ZARAUTZ")], [])
+        self.assertEqual([e.race_id for e, _ in self.index.search("ZUMAIA")], ["5"])
+
+    def test_persistence(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, "race_names.json")
+            self.assertEqual(len(RaceNameIndex.load(file_name)), 0)
+
+            self.index.save(file_name)
+            index = RaceNameIndex.load(file_name)
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.search("BANDERA DE ORIO"), self.index.search("BANDERA DE ORIO"))
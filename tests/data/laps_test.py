@@ -0,0 +1,57 @@
+import unittest
+
+from rscraping.data.laps import NO_TIME, LapMatrix, centiseconds_to_lap, lap_to_centiseconds
+
+
+class TestLapMatrix(unittest.TestCase):
+    def setUp(self) -> None:
+        self.matrix = LapMatrix.from_laps(
+            [
+                ["06:35.000000", "11:59.000000", "19:08.000000", "24:24.970000"],
+                ["06:11.000000", "11:22.000000", "17:49.000000", "22:55.920000"],
+                ["05:59.000000", "11:02.000000"],
+                [],
+            ]
+        )
+
+    def test_lap_conversions(self) -> None:
+        self.assertEqual(lap_to_centiseconds("24:24.970000"), 146497)
+        self.assertEqual(lap_to_centiseconds("06:35"), 39500)
+        self.assertEqual(centiseconds_to_lap(146497), "24:24.970000")
+
+    def test_from_laps(self) -> None:
+        self.assertEqual((self.matrix.participants, self.matrix.laps), (4, 4))
+        self.assertEqual(list(self.matrix.row(2)), [35900, 66200, NO_TIME, NO_TIME])
+        self.assertEqual(list(self.matrix.row(3)), [NO_TIME] * 4)
+
+    def test_final_times(self) -> None:
+        self.assertEqual(list(self.matrix.final_times()), [146497, 137592, 66200, NO_TIME])
+
+    def test_finished_times(self) -> None:
+        matrix = LapMatrix.from_laps([["05:00.000000", "20:10.000000"], ["20:05.000000"], ["05:03.000000"], []])
+        self.assertEqual(list(matrix.finished_times()), [121000, 120500, NO_TIME, NO_TIME])
+        self.assertEqual(list(matrix.ranking(partial=True)), [2, 1, 0, 0])
+
+    def test_finished_times_with_a_single_complete_row(self) -> None:
+        # the shorter rows would make the first column median a final time if they were used for the medians
+        matrix = LapMatrix.from_laps([["05:00.000000", "20:00.000000"], ["20:05.000000"], ["20:10.000000"]])
+        self.assertEqual(list(matrix.finished_times()), [120000, 120500, 121000])
+
+        matrix = LapMatrix.from_laps([["05:00.000000", "20:00.000000"], ["05:03.000000"]])
+        self.assertEqual(list(matrix.finished_times()), [120000, NO_TIME])
+
+        # without a complete row there is no reference to tell finals from splits
+        matrix = LapMatrix.from_laps([["05:00.000000", "20:00.000000"], ["20:05.000000"]])
+        matrix.values[1] = NO_TIME
+        self.assertEqual(list(matrix.finished_times()), [NO_TIME, NO_TIME])
+
+    def test_split_deltas(self) -> None:
+        deltas = self.matrix.split_deltas()
+        self.assertEqual(list(deltas.row(0)), [39500, 32400, 42900, 31697])
+        self.assertEqual(list(deltas.row(2)), [35900, 30300, NO_TIME, NO_TIME])
+
+    def test_ranking(self) -> None:
+        self.assertEqual(list(self.matrix.ranking()), [2, 1, 0, 0])
+
+        tied = LapMatrix.from_laps([["20:00.000000"], ["19:00.000000"], ["20:00.000000"], ["21:00.000000"]])
+        self.assertEqual(list(tied.ranking()), [2, 1, 2, 4])
@@ -0,0 +1,120 @@
+import unittest
+from datetime import date
+
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Participant, Penalty, Race, RaceView
+
+
+class TestModels(unittest.TestCase):
+    def setUp(self) -> None:
+        self.race = Race(
+            name="BANDEIRA VIRXE DO CARME",
+            date="07/07/2024",
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league="LIGA A",
+            town="RIVEIRA",
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDEIRA VIRXE DO CARME", 9)],
+            race_ids=["1234"],
+            url=None,
+            datasource=Datasource.LGT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
+        self.race.participants = [
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name="CR MUROS",
+                lane=4,
+                series=1,
+                laps=["06:35.000000", "11:59.000000", "19:08.000000", "24:24.970000"],
+                distance=5556,
+                handicap=None,
+                participant="MUROS",
+                race=self.race,
+                penalty=Penalty(disqualification=True, reason=None),
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+        ]
+
+    def test_models_are_slotted(self) -> None:
+        for item in [self.race, self.race.participants[0], Penalty(disqualification=False, reason=None)]:
+            self.assertFalse(hasattr(item, "__dict__"))
+
+    def test_race_year_follows_date(self) -> None:
+        self.assertEqual(self.race.year, 2024)
+        self.assertEqual(self.race.parsed_date, date(2024, 7, 7))
+
+        self.race.date = "01/08/2023"
+        self.assertEqual(self.race.year, 2023)
+        self.assertEqual(self.race.parsed_date, date(2023, 8, 1))
+
+    def test_race_json_round_trip(self) -> None:
+        race = Race.from_json(self.race.to_json())
+
+        self.assertEqual(race.to_json(), self.race.to_json())
+        self.assertEqual(race.normalized_names, self.race.normalized_names)
+        self.assertIs(race.participants[0].race, race)
+        self.assertEqual(race.participants[0].penalty, Penalty(disqualification=True, reason=None))
+
+    def test_participant_json_round_trip(self) -> None:
+        participant = Participant.from_json(self.race.participants[0].to_json())
+
+        self.assertIsNone(participant.race)
+        self.assertEqual(participant.to_dict(), self.race.participants[0].to_dict())
+
+    def test_race_view_is_lazy(self) -> None:
+        loads = []
+
+        def loader() -> Race:
+            loads.append(1)
+            return self.race
+
+        view = RaceView(
+            datasource=Datasource.LGT.value,
+            race_id="1234",
+            name=self.race.name,
+            date=self.race.date,
+            gender=GENDER_MALE,
+            loader=loader,
+            url="https://www.ligalgt.com/principal/regata/1234",
+        )
+
+        self.assertEqual((view.name, view.parsed_date, view.gender), (self.race.name, date(2024, 7, 7), GENDER_MALE))
+        self.assertEqual(loads, [])
+
+        self.assertEqual(view.participants_count, 1)
+        self.assertEqual(view.normalized_names, [("BANDEIRA VIRXE DO CARME", 9)])
+        self.assertEqual(view.url, "https://www.ligalgt.com/principal/regata/1234")
+        self.assertIs(view.race, self.race)
+        self.assertEqual(self.race.url, view.url)
+        self.assertEqual(loads, [1])
+
+        view.date = "01/08/2023"
+        self.assertEqual(view.parsed_date, date(2023, 8, 1))
+
+    def test_race_view_loader_errors_propagate(self) -> None:
+        def loader() -> Race:
+            raise AttributeError("'NoneType' object has no attribute 'xpath'")
+
+        view = RaceView(
+            datasource=Datasource.LGT.value,
+            race_id="1234",
+            name=self.race.name,
+            date=self.race.date,
+            gender=GENDER_MALE,
+            loader=loader,
+        )
+
+        for attribute in ["race", "participants", "participants_count", "year"]:
+            with self.assertRaisesRegex(AttributeError, "'NoneType' object has no attribute 'xpath'"):
+                getattr(view, attribute)
+        with self.assertRaisesRegex(AttributeError, "'RaceView' object has no attribute 'unknown'"):
+            getattr(view, "unknown")
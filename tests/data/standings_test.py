@@ -0,0 +1,128 @@
+import unittest
+
+from rscraping.data.constants import (
+    CATEGORY_ABSOLUT,
+    GENDER_MALE,
+    RACE_CONVENTIONAL,
+    RACE_TIME_TRIAL,
+    RACE_TRAINERA,
+)
+from rscraping.data.laps import NO_TIME
+from rscraping.data.models import Datasource, Participant, Penalty, Race
+from rscraping.data.standings import Standings, rank_race, table_points
+
+
+class TestStandings(unittest.TestCase):
+    def test_rank_conventional_race(self) -> None:
+        race = self._race(
+            "1",
+            [
+                ("ORIO", 1, ["05:00.00", "20:10.00"]),
+                ("URDAIBAI", 1, ["05:01.00", "20:05.00"]),
+                ("HONDARRIBIA", 2, ["05:02.00", "20:00.00"]),
+                ("ZIERBENA", 2, ["05:03.00"]),
+            ],
+        )
+
+        result = rank_race(race)
+
+        self.assertEqual(list(result.positions), [3, 2, 1, 0])
+        self.assertEqual(list(result.series_positions), [2, 1, 1, 0])
+        self.assertEqual(list(result.points), [1, 2, 3, 0])
+        self.assertEqual(list(result.times), [121000, 120500, 120000, NO_TIME])
+
+    def test_rank_participant_missing_a_split(self) -> None:
+        race = self._race(
+            "1",
+            [
+                ("ORIO", 1, ["05:00.00", "20:10.00"]),
+                ("URDAIBAI", 1, ["20:05.00"]),
+                ("HONDARRIBIA", 2, ["05:02.00", "20:00.00"]),
+                ("ZIERBENA", 2, ["05:03.00"]),
+            ],
+        )
+
+        result = rank_race(race)
+
+        self.assertEqual(list(result.positions), [3, 2, 1, 0])
+        self.assertEqual(list(result.times), [121000, 120500, 120000, NO_TIME])
+
+    def test_rank_time_trial_race(self) -> None:
+        race = self._race(
+            "1",
+            [("ORIO", 1, ["20:10.00"]), ("URDAIBAI", 2, ["20:05.00"]), ("BERMEO", 3, ["20:01.00"])],
+            ttype=RACE_TIME_TRIAL,
+        )
+        race.participants[2].guest = True
+
+        result = rank_race(race, points=table_points([10]))
+
+        self.assertEqual(list(result.positions), [2, 1, 0])
+        self.assertEqual(list(result.series_positions), [2, 1, 0])
+        self.assertEqual(list(result.points), [0, 10, 0])
+
+    def test_incremental_table(self) -> None:
+        standings = Standings()
+        standings.add_all(
+            [
+                self._race("1", [("ORIO", 1, ["20:10.00"]), ("URDAIBAI", 1, ["20:05.00"])]),
+                self._race("2", [("ORIO", 1, ["20:00.00"]), ("URDAIBAI", 1, ["20:05.00"])]),
+                None,
+            ]
+        )
+        self.assertEqual(
+            [(r.participant, r.points, r.wins) for r in standings.table()], [("ORIO", 3, 1), ("URDAIBAI", 3, 1)]
+        )
+
+        # amended results replace the previous ones
+        amended = self._race("2", [("ORIO", 1, ["20:00.00"]), ("URDAIBAI", 1, ["20:05.00"])])
+        amended.participants[0].penalty = Penalty(disqualification=True, reason=None)
+        standings.add(amended)
+
+        table = standings.table()
+        self.assertEqual(len(standings), 2)
+        self.assertEqual([(r.participant, r.points, r.races) for r in table], [("URDAIBAI", 3, 2), ("ORIO", 1, 1)])
+        self.assertEqual(table[1].best_position, 2)
+
+        standings.remove("act:1:1")
+        self.assertEqual([r.participant for r in standings.table()], ["URDAIBAI"])
+
+    @staticmethod
+    def _race(race_id: str, participants: list[tuple[str, int, list[str]]], ttype: str = RACE_CONVENTIONAL) -> Race:
+        race = Race(
+            name="BANDERA DE ORIO",
+            date="08/07/2023",
+            day=1,
+            modality=RACE_TRAINERA,
+            type=ttype,
+            league=None,
+            town=None,
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDERA DE ORIO", None)],
+            race_ids=[race_id],
+            url=None,
+            datasource=Datasource.ACT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
+        race.participants = [
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name=name,
+                lane=lane,
+                series=series,
+                laps=laps,
+                distance=5556,
+                handicap=None,
+                participant=name,
+                race=race,
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+            for lane, (name, series, laps) in enumerate(participants, start=1)
+        ]
+        return race
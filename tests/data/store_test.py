@@ -0,0 +1,91 @@
+import unittest
+
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Participant, Penalty, Race
+from rscraping.data.store import RaceStore
+
+
+class TestRaceStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = RaceStore(":memory:")
+        self.races = [
+            self._race("1", "07/07/2024", "BANDEIRA VIRXE DO CARME", "MUROS"),
+            self._race("2", "14/07/2024", "BANDEIRA CONCELLO DE MUGARDOS", "CABO"),
+            self._race("3", "09/07/2023", "BANDEIRA VIRXE DO CARME", "CABO"),
+        ]
+        self.assertEqual(self.store.save(self.races + [None], batch_size=2), 3)
+
+    def tearDown(self) -> None:
+        self.store.close()
+
+    def test_round_trip(self) -> None:
+        race = self.store.get_race(Datasource.LGT.value, "1")
+        assert race is not None
+
+        self.assertEqual(race.to_json(), self.races[0].to_json())
+        self.assertIs(race.participants[0].race, race)
+        self.assertEqual(race.participants[0].penalty, Penalty(disqualification=True, reason=None))
+        self.assertIsNone(self.store.get_race(Datasource.LGT.value, "1", day=2))
+
+    def test_save_replaces_existing_race(self) -> None:
+        race = self._race("1", "07/07/2024", "BANDEIRA VIRXE DO CARME", "CABO")
+        race.participants = []
+        self.store.save([race])
+
+        stored = self.store.get_race(Datasource.LGT.value, "1")
+        assert stored is not None
+        self.assertEqual(stored.participants, [])
+        self.assertEqual(len(self.store.get_races_by_year(2024)), 2)
+
+    def test_lookups(self) -> None:
+        self.assertTrue(self.store.has_race(Datasource.LGT.value, "2"))
+        self.assertFalse(self.store.has_race(Datasource.ACT.value, "2"))
+        self.assertEqual(self.store.get_race_ids(Datasource.LGT.value), {"1", "2", "3"})
+
+        self.assertEqual([r.race_ids for r in self.store.get_races_by_year(2024)], [["1"], ["2"]])
+        self.assertEqual(self.store.get_races_by_year(2024, datasource=Datasource.ACT.value), [])
+        self.assertEqual([r.race_ids for r in self.store.get_races_by_club("CABO")], [["3"], ["2"]])
+        self.assertEqual(
+            [r.race_ids for r in self.store.get_races_by_name("BANDEIRA VIRXE DO CARME")],
+            [["3"], ["1"]],
+        )
+
+    @staticmethod
+    def _race(race_id: str, date: str, name: str, participant: str) -> Race:
+        race = Race(
+            name=name,
+            date=date,
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league="LIGA A",
+            town="RIVEIRA",
+            organizer=None,
+            sponsor=None,
+            normalized_names=[(name, 9)],
+            race_ids=[race_id],
+            url=None,
+            datasource=Datasource.LGT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
+        race.participants.append(
+            Participant(
+                gender=GENDER_MALE,
+                category=CATEGORY_ABSOLUT,
+                club_name=f"CR {participant}",
+                lane=4,
+                series=1,
+                laps=["06:35.000000", "24:24.970000"],
+                distance=5556,
+                handicap=None,
+                participant=participant,
+                race=race,
+                penalty=Penalty(disqualification=True, reason=None),
+                absent=False,
+                retired=False,
+                guest=False,
+            )
+        )
+        return race
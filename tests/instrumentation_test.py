@@ -0,0 +1,41 @@
+import unittest
+
+from rscraping.instrumentation import StageAggregator, get_instrumentation, instrument, measure, measured
+
+
+@measured("normalize.double")
+def _double(value: int) -> int:
+    return value * 2
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_disabled_by_default(self) -> None:
+        self.assertIsNone(get_instrumentation())
+        with measure("fetch", "act") as set_size:
+            set_size(10)
+        self.assertEqual(_double(2), 4)
+
+    def test_aggregator(self) -> None:
+        with instrument(StageAggregator()) as aggregator:
+            with measure("fetch", "act") as set_size:
+                set_size(2048)
+            with measure("parse", "act"):
+                self.assertEqual(_double(2), 4)
+                self.assertEqual(_double(3), 6)
+            _double(4)
+        _double(5)  # not measured after the block
+
+        self.assertIsNone(get_instrumentation())
+        self.assertEqual(
+            {k: (s.count, s.size) for k, s in aggregator.stats.items()},
+            {
+                ("fetch", "act"): (1, 2048),
+                ("parse", "act"): (1, 0),
+                ("normalize.double", "act"): (2, 0),
+                ("normalize.double", "-"): (1, 0),
+            },
+        )
+
+        report = aggregator.report().splitlines()
+        self.assertEqual(len(report), 5)
+        self.assertTrue(report[0].startswith("stage"))
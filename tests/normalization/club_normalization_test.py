@@ -1,6 +1,6 @@
 import unittest
 
-from rscraping.data.normalization import normalize_club_name
+from rscraping.data.normalization import normalize_club_name, normalize_club_names
 
 
 class TestClubNormalization(unittest.TestCase):
@@ -44,3 +44,7 @@ class TestClubNormalization(unittest.TestCase):
 
         for idx, club_name in enumerate(self.NAMES):
             self.assertEqual(normalize_club_name(club_name), results[idx])
+
+    def test_club_names_batch_normalization(self) -> None:
+        names = self.NAMES + [f" {n.lower()} " for n in self.NAMES] + self.NAMES
+        self.assertEqual(normalize_club_names(names), [normalize_club_name(n) for n in names])
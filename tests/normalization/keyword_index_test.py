@@ -0,0 +1,34 @@
+import unittest
+
+from rscraping.data.normalization._keywords import KeywordIndex
+from rscraping.data.normalization.clubs import _NORMALIZED_ENTITIES
+from rscraping.data.normalization.races import _NORMALIZED_RACES
+
+
+class TestKeywordIndex(unittest.TestCase):
+    def test_candidates(self) -> None:
+        index = KeywordIndex(
+            {
+                "PUEBLA - CABO": [["CABO", "PUEBLA"]],
+                "CABO DA CRUZ": [["CABO", "CRUZ"], ["CABO"]],
+                "ARES": [["DE", "ARES"]],
+                "LIGA A": [["LIGA", "A"]],
+            }
+        )
+
+        self.assertEqual(list(index.candidates("CABO DE CRUZ")), ["CABO DA CRUZ"])
+        self.assertEqual(list(index.candidates("PUEBLA DEL CABO")), ["PUEBLA - CABO", "CABO DA CRUZ"])
+        self.assertEqual(list(index.candidates("club de mar ares")), ["ARES"])
+        self.assertEqual(list(index.candidates("LIGA B")), ["LIGA A"])
+        self.assertEqual(list(index.candidates("ORIO")), [])
+
+    def test_candidates_keep_every_matching_entry(self) -> None:
+        for normalizations in [_NORMALIZED_ENTITIES, _NORMALIZED_RACES]:
+            index = KeywordIndex(normalizations)
+            for key, keyword_lists in normalizations.items():
+                for keywords in keyword_lists:
+                    value = " ".join(keywords)
+                    expected = [k for k, v in normalizations.items() if any(all(w in value for w in ws) for ws in v)]
+                    candidates = list(index.candidates(value))
+                    self.assertIn(key, candidates)
+                    self.assertEqual([k for k in candidates if k in expected], expected)
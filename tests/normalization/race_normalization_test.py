@@ -1,6 +1,12 @@
 import unittest
 
-from rscraping.data.normalization import normalize_name_parts, normalize_race_name, remove_day_indicator
+from rscraping.data.normalization import (
+    normalize_name_parts,
+    normalize_names_parts,
+    normalize_race_name,
+    normalize_race_names,
+    remove_day_indicator,
+)
 
 
 class TestRaceNormalization(unittest.TestCase):
@@ -77,6 +83,12 @@ class TestRaceNormalization(unittest.TestCase):
         for idx, race_name in enumerate(races):
             self.assertEqual(normalize_name_parts(race_name), results[idx])
 
+    def test_race_names_batch_normalization(self) -> None:
+        names = self.NAMES + [n.lower() for n in self.NAMES] + self.NAMES
+        races = normalize_race_names(names)
+        self.assertEqual(races, [normalize_race_name(n) for n in names])
+        self.assertEqual(normalize_names_parts(races), [normalize_name_parts(r) for r in races])
+
     def test_day_indicator_normalization(self) -> None:
         pairs = [("PLAY-OFF LGT XORNADA 2 (ARES)", "PLAY-OFF LGT (ARES)")]
 
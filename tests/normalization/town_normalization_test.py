@@ -1,6 +1,6 @@
 import unittest
 
-from rscraping.data.normalization import normalize_town
+from rscraping.data.normalization import normalize_town, normalize_towns
 
 
 class TestTownNormalization(unittest.TestCase):
@@ -15,3 +15,7 @@ class TestTownNormalization(unittest.TestCase):
 
         for name, normalized in results:
             self.assertEqual(normalize_town(name), normalized)
+
+    def test_towns_batch_normalization(self) -> None:
+        towns = ["PORTO DA POBRA", "porto da pobra", "  POBRA   - A CORUÑA  ", "PUERTO DE TIRÁN", "PORTO DA POBRA"]
+        self.assertEqual(normalize_towns(towns), [normalize_town(t) for t in towns])
@@ -5,7 +5,7 @@ from datetime import datetime
 from parsel.selector import Selector
 
 from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
-from rscraping.data.models import Datasource, Participant, Race, RaceName
+from rscraping.data.models import Datasource, Participant, Race, RaceName, RaceSummary
 from rscraping.parsers.html.act import ACTHtmlParser
 
 
@@ -30,6 +30,17 @@ class TestACTParser(unittest.TestCase):
         self.assertEqual(race, self._RACE)
         self.assertEqual(participants, self._PARTICIPANTS)
 
+    def test_parse_race_view(self) -> None:
+        with open(os.path.join(self.fixtures, "act_details.html")) as file:
+            view = self.parser.parse_race_view(Selector(file.read()), race_id="1234", is_female=False)
+
+        self.assertEqual((view.name, view.date, view.gender), (self._RACE.name, self._RACE.date, self._RACE.gender))
+        self.assertEqual(view.participants_count, len(self._PARTICIPANTS))
+        self.assertNotIn("race", view.__dict__)
+
+        self.assertEqual([p.participant for p in view.participants], [p.participant for p in self._PARTICIPANTS])
+        self.assertEqual(view.normalized_names, self._RACE.normalized_names)
+
     def test_parse_race_ids(self) -> None:
         with open(os.path.join(self.fixtures, "act_races.html")) as file:
             ids = self.parser.parse_race_ids(Selector(file.read()))
@@ -51,6 +62,22 @@ class TestACTParser(unittest.TestCase):
 
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_parse_race_summaries(self) -> None:
+        with open(os.path.join(self.fixtures, "act_races.html")) as file:
+            summaries = list(self.parser.parse_race_summaries(Selector(file.read()), is_female=False))
+
+        self.assertEqual(len(summaries), 3)
+        self.assertEqual(
+            summaries[0],
+            RaceSummary(
+                datasource=Datasource.ACT.value,
+                race_id="1616789082",
+                name="V BANDEIRA CIDADE DA CORUÑA (J1)",
+                date="03/07/2021",
+                gender=GENDER_MALE,
+            ),
+        )
+
     _RACE = Race(
         name="ORIOKO XXXIII. ESTROPADA - ORIO KANPINA XI. BANDERA (16-07-2023)",
         date="16/07/2023",
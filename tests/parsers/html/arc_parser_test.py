@@ -51,6 +51,14 @@ class TestARCParser(unittest.TestCase):
 
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_parse_race_summaries(self) -> None:
+        with open(os.path.join(self.fixtures, "arc_races.html")) as file:
+            summaries = list(self.parser.parse_race_summaries(Selector(file.read()), year=2023, is_female=False))
+
+        self.assertEqual([s.race_id for s in summaries], ["446", "474", "475"])
+        self.assertEqual([s.date for s in summaries], ["19/06/2023", "27/08/2023", "28/08/2023"])
+        self.assertEqual([s.type for s in summaries], [None, RACE_TIME_TRIAL, RACE_TIME_TRIAL])
+
     _RACE = Race(
         name="XVII BANDERA RIA DEL ASON",
         date="22/08/2009",
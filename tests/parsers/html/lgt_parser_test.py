@@ -4,8 +4,15 @@ from datetime import datetime
 
 from parsel.selector import Selector
 
-from rscraping.data.constants import CATEGORY_ABSOLUT, DATE_FORMAT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
-from rscraping.data.models import Datasource, Participant, Race, RaceName
+from rscraping.data.constants import (
+    CATEGORY_ABSOLUT,
+    DATE_FORMAT,
+    GENDER_FEMALE,
+    GENDER_MALE,
+    RACE_CONVENTIONAL,
+    RACE_TRAINERA,
+)
+from rscraping.data.models import Datasource, Participant, Race, RaceName, RaceSummary
 from rscraping.parsers.html.lgt import LGTHtmlParser
 
 
@@ -33,6 +40,24 @@ class TestLGTParser(unittest.TestCase):
         self.assertEqual(race, self._RACE)
         self.assertEqual(participants, self._PARTICIPANTS)
 
+    def test_parse_race_view(self) -> None:
+        with (
+            open(os.path.join(self.fixtures, "lgt_details.html")) as file,
+            open(os.path.join(self.fixtures, "lgt_results.html")) as results,
+        ):
+            view = self.parser.parse_race_view(
+                Selector(file.read()),
+                race_id="1234",
+                results_selector=Selector(results.read()),
+            )
+
+        self.assertEqual((view.name, view.date, view.gender), (self._RACE.name, self._RACE.date, self._RACE.gender))
+        self.assertEqual(view.participants_count, len(self._PARTICIPANTS))
+        self.assertNotIn("race", view.__dict__)
+
+        self.assertEqual([p.participant for p in view.participants], [p.participant for p in self._PARTICIPANTS])
+        self.assertEqual(view.race_ids, ["1234"])
+
     def test_parse_race_ids(self) -> None:
         with open(os.path.join(self.fixtures, "lgt_races.html")) as file:
             ids = self.parser.parse_race_ids(Selector(file.read()))
@@ -54,6 +79,23 @@ class TestLGTParser(unittest.TestCase):
 
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_parse_race_summaries(self) -> None:
+        with open(os.path.join(self.fixtures, "lgt_calendar.html")) as file:
+            summaries = list(self.parser.parse_race_summaries(Selector(file.read()), year=2024))
+
+        self.assertEqual(len(summaries), 7)
+        self.assertEqual(
+            summaries[3],
+            RaceSummary(
+                datasource=Datasource.LGT.value,
+                race_id="194",
+                name="II BANDEIRA FEMININA CESANTES-CONCELLO DE REDONDELA",
+                date="06/07/2024",
+                gender=GENDER_FEMALE,
+            ),
+        )
+        self.assertEqual([s.race_id for s in summaries if s.date == "03/08/2024"], ["209", "210"])
+
     _RACE = Race(
         name="IX BANDEIRA VIRXE DO CARME",
         date="25/07/2020",
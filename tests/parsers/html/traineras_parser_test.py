@@ -9,6 +9,7 @@ from rscraping.data.constants import (
     CATEGORY_VETERAN,
     GENDER_FEMALE,
     GENDER_MALE,
+    GENDER_MIX,
     RACE_CONVENTIONAL,
     RACE_TIME_TRIAL,
     RACE_TRAINERA,
@@ -114,6 +115,22 @@ class TestTrainerasParser(unittest.TestCase):
         race_names = self.parser.parse_race_names(Selector(data))
         self.assertEqual(list(race_names), self._RACE_NAMES)
 
+    def test_parse_race_summaries(self) -> None:
+        with open(os.path.join(self.fixtures, "traineras_results.html")) as file:
+            summaries = list(self.parser.parse_race_summaries(Selector(file.read())))
+
+        self.assertEqual([s.race_id for s in summaries], ["5455", "5456", "5457", "5458", "5535", "5536"])
+        self.assertEqual([s.date for s in summaries[3:5]], ["15/01/2023", "21/01/2023"])
+        self.assertEqual(
+            [(s.gender, s.category) for s in summaries[:4]],
+            [
+                (GENDER_MALE, CATEGORY_ABSOLUT),
+                (GENDER_FEMALE, CATEGORY_ABSOLUT),
+                (GENDER_MALE, CATEGORY_VETERAN),
+                (GENDER_MIX, CATEGORY_ABSOLUT),
+            ],
+        )
+
     def test_parse_race_ids(self) -> None:
         with open(os.path.join(self.fixtures, "traineras_results.html")) as file:
             data = Selector(file.read())
@@ -0,0 +1,86 @@
+import os
+import unittest
+from unittest import mock
+
+from parsel.selector import Selector
+
+from rscraping.data.models import Datasource, Race, RacePage
+from rscraping.parsers.html import ACTHtmlParser, HtmlParser, LGTHtmlParser
+from rscraping.pipeline import parse_race_pages
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fixtures = os.path.join(os.getcwd(), "tests", "fixtures", "html")
+
+    def test_parse_race_pages(self) -> None:
+        act_page = RacePage(
+            datasource=Datasource.ACT,
+            race_id="1234",
+            url="https://www.euskolabelliga.com/resultados/ver.php?r=1234",
+            content=self._read("act_details.html"),
+            is_female=False,
+        )
+        lgt_page = RacePage(
+            datasource=Datasource.LGT,
+            race_id="1234",
+            url="https://www.ligalgt.com/principal/regata/1234",
+            content=self._read("lgt_details.html"),
+            is_female=False,
+            results=self._read("lgt_results.html"),
+        )
+        invalid_page = RacePage(
+            datasource=Datasource.ACT, race_id="1", url="", content=b"<html></html>", is_female=False
+        )
+
+        for threads in [False, True]:
+            with self.subTest(threads=threads):
+                races = list(parse_race_pages([act_page, lgt_page, invalid_page], max_workers=2, threads=threads))
+                self._assert_races(races, act_page, lgt_page)
+
+    def test_pages_are_consumed_as_they_are_parsed(self) -> None:
+        consumed = []
+
+        def pages():
+            for race_id in range(20):
+                consumed.append(race_id)
+                yield RacePage(Datasource.ACT, str(race_id), url="", content=b"<html></html>", is_female=False)
+
+        races = parse_race_pages(pages(), max_workers=1, threads=True)
+        self.assertIsNone(next(races))
+        self.assertLessEqual(len(consumed), 3)
+
+        self.assertEqual(list(races), [None] * 19)
+        self.assertEqual(len(consumed), 20)
+
+    def test_parsers_are_created_on_demand(self) -> None:
+        page = RacePage(datasource=Datasource.ACT, race_id="1", url="", content=b"<html></html>", is_female=False)
+
+        with mock.patch.dict(HtmlParser._instances, clear=True):
+            self.assertEqual(list(parse_race_pages([page], max_workers=1, threads=True)), [None])
+            self.assertEqual(list(HtmlParser._instances.keys()), [ACTHtmlParser])
+
+    def _assert_races(self, races: list[Race | None], act_page: RacePage, lgt_page: RacePage) -> None:
+        act_race, lgt_race, invalid_race = races
+
+        expected_act = ACTHtmlParser().parse_race(
+            Selector(act_page.content.decode("utf-8")),
+            race_id="1234",
+            is_female=False,
+        )
+        expected_lgt = LGTHtmlParser().parse_race(
+            Selector(lgt_page.content.decode("utf-8")),
+            race_id="1234",
+            is_female=False,
+            results_selector=Selector((lgt_page.results or b"").decode("utf-8")),
+        )
+        assert act_race and lgt_race and expected_act and expected_lgt
+
+        expected_act.url, expected_lgt.url = act_page.url, lgt_page.url
+        self.assertEqual(act_race.to_json(), expected_act.to_json())
+        self.assertEqual(lgt_race.to_json(), expected_lgt.to_json())
+        self.assertIsNone(invalid_race)
+
+    def _read(self, file_name: str) -> bytes:
+        with open(os.path.join(self.fixtures, file_name), "rb") as file:
+            return file.read()
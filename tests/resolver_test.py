@@ -0,0 +1,89 @@
+import unittest
+
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_FEMALE, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Race
+from rscraping.resolver import RaceResolver, resolve_races
+
+
+class TestRaceResolver(unittest.TestCase):
+    def test_cross_source_clusters(self) -> None:
+        races = [
+            self._race(Datasource.ACT, "1", "08/07/2023", "BANDERA DE ORIO", 51),
+            self._race(Datasource.ARC, "2", "08/07/2023", "BANDERA DE ORIO", 51),
+            self._race(Datasource.TRAINERAS, "3", "09/07/2023", "BANDERA DE ORIO - ORIO KAIXA", 51),
+            self._race(Datasource.LGT, "4", "08/07/2023", "BANDERA DE BUEU", 20),
+            self._race(Datasource.TRAINERAS, "5", "08/07/2023", "BANDERA DE BUEU", 20),
+        ]
+
+        clusters = resolve_races(races)
+
+        self.assertEqual([[r.race_ids[0] for r in c.races] for c in clusters], [["1", "2", "3"], ["4", "5"]])
+        self.assertEqual(len(clusters[0].matches), 2)
+        self.assertGreaterEqual(clusters[0].score, 0.6)
+
+    def test_never_merges_races_of_the_same_datasource(self) -> None:
+        races = [
+            self._race(Datasource.ACT, "1", "08/07/2023", "BANDERA DE ORIO", 51),
+            self._race(Datasource.ACT, "2", "08/07/2023", "BANDERA DE ORIO", 51),
+            self._race(Datasource.TRAINERAS, "3", "08/07/2023", "BANDERA DE ORIO", 51),
+        ]
+
+        clusters = resolve_races(races)
+
+        self.assertEqual([[r.race_ids[0] for r in c.races] for c in clusters], [["1", "3"], ["2"]])
+        self.assertEqual(clusters[1].score, 1.0)
+
+    def test_keeps_different_races_apart(self) -> None:
+        resolver = RaceResolver()
+        resolver.add(self._race(Datasource.ACT, "1", "08/07/2023", "BANDERA DE ORIO", 51))
+
+        self.assertEqual(resolver.add(self._race(Datasource.ARC, "2", "15/07/2023", "BANDERA DE ORIO", 52)), [])
+        self.assertEqual(resolver.add(self._race(Datasource.ARC, "3", "08/07/2023", "BANDERA DE ZARAUTZ", 51)), [])
+        female = self._race(Datasource.TRAINERAS, "4", "08/07/2023", "BANDERA DE ORIO", 51, gender=GENDER_FEMALE)
+        self.assertEqual(resolver.add(female), [])
+
+        self.assertEqual(len(resolver.clusters()), 4)
+
+    def test_blocking_scales_linearly(self) -> None:
+        def season(size: int) -> RaceResolver:
+            resolver = RaceResolver()
+            resolver.add_all(
+                self._race(d, f"{d}-{i}", "08/07/2023", f"BANDERA DE CLUB{i}", i)
+                for d in [Datasource.ACT, Datasource.ARC, Datasource.LGT, Datasource.TRAINERAS]
+                for i in range(size)
+            )
+            return resolver
+
+        # every race held the same day, only the blocking by name tokens keeps the pairs from growing quadratically
+        small, large = season(150), season(1500)
+
+        self.assertEqual(len(large.clusters()), 1500)
+        self.assertEqual(large.comparisons, 10 * small.comparisons)
+
+    @staticmethod
+    def _race(
+        datasource: Datasource,
+        race_id: str,
+        date: str,
+        name: str,
+        edition: int,
+        gender: str = GENDER_MALE,
+    ) -> Race:
+        return Race(
+            name=name,
+            date=date,
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league=None,
+            town=None,
+            organizer=None,
+            sponsor=None,
+            normalized_names=[(name, edition)],
+            race_ids=[race_id],
+            url=None,
+            datasource=datasource.value,
+            gender=gender,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+import requests
+
+from rscraping.clients import ACTClient, Client
+from rscraping.data.constants import CATEGORY_ABSOLUT, GENDER_MALE, RACE_CONVENTIONAL, RACE_TRAINERA
+from rscraping.data.models import Datasource, Race, RaceName
+from rscraping.sync import load_manifest, sync_season
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.manifest_file = os.path.join(self.folder.name, "manifest.json")
+        self.client = Client(source=Datasource.ACT)
+        self.listing = [RaceName(race_id="1", name="BANDERA DE ZARAUTZ"), RaceName(race_id="2", name="BANDERA DE ORIO")]
+        self.races = {"1": self._race("1", "07/07/2024"), "2": self._race("2", "14/07/2024")}
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_first_sync_fetches_everything(self) -> None:
+        report = self._sync()
+
+        self.assertEqual(report.new, ["1", "2"])
+        self.assertEqual(report.requests, 2)
+        self.assertEqual(len(report.races), 2)
+        self.assertEqual(set(load_manifest(self.manifest_file).keys()), {"act:MALE:1", "act:MALE:2"})
+
+    def test_sync_only_fetches_new_renamed_and_recent_races(self) -> None:
+        self._sync()
+
+        self.listing[0] = RaceName(race_id="1", name="BANDERA DE ZARAUTZ - EUSKOTREN")
+        self.listing.append(RaceName(race_id="3", name="BANDERA DE GETARIA"))
+        self.races["3"] = self._race("3", "20/07/2024")
+        self.races["2"].town = "ORIO"
+
+        report = self._sync(today=date(2024, 7, 21))
+        self.assertEqual(report.new, ["3"])
+        self.assertEqual(report.changed, ["2"])
+        self.assertEqual(report.rechecked, ["1"])
+        self.assertEqual(report.unchanged, [])
+        self.assertEqual([r.race_ids for r in report.races], [["2"], ["3"]])
+
+        report = self._sync(today=date(2024, 9, 1))
+        self.assertEqual(report.requests, 0)
+        self.assertEqual(report.unchanged, ["1", "2", "3"])
+
+    def test_missing_races_are_not_retried(self) -> None:
+        race = self.races.pop("2")
+        self.assertEqual(self._sync().failed, ["2"])
+        self.assertEqual(load_manifest(self.manifest_file)["act:MALE:2"].failure, "not found")
+
+        self.races["2"] = race
+        report = self._sync(today=date(2024, 9, 1))
+        self.assertEqual((report.skipped, report.unchanged, report.requests), (["2"], ["1"], 0))
+
+        # a new name in the listing means the page changed
+        self.listing[1] = RaceName(race_id="2", name="BANDERA DE ORIO - ORIO KAIXA")
+        self.assertEqual(self._sync(today=date(2024, 9, 1)).new, ["2"])
+
+    def test_request_errors_are_retried(self) -> None:
+        def get_race_by_id(race_id: str, **_) -> Race:
+            if race_id == "2":
+                raise requests.ConnectionError("connection reset")
+            return self.races[race_id]
+
+        with (
+            mock.patch.object(ACTClient, "get_race_names_by_year", side_effect=lambda *_, **__: iter(self.listing)),
+            mock.patch.object(ACTClient, "get_race_by_id", side_effect=get_race_by_id),
+        ):
+            self.assertEqual(sync_season(self.client, 2024, self.manifest_file).failed, ["2"])
+        self.assertIsNone(load_manifest(self.manifest_file)["act:MALE:2"].failure)
+
+        report = self._sync(today=date(2024, 9, 1))
+        self.assertEqual((report.new, report.unchanged), (["2"], ["1"]))
+
+    def test_manifest_is_saved_when_the_sync_fails(self) -> None:
+        def get_race_by_id(race_id: str, **_) -> Race:
+            if race_id == "2":
+                raise RuntimeError()
+            return self.races[race_id]
+
+        with (
+            mock.patch.object(ACTClient, "get_race_names_by_year", side_effect=lambda *_, **__: iter(self.listing)),
+            mock.patch.object(ACTClient, "get_race_by_id", side_effect=get_race_by_id),
+            self.assertRaises(RuntimeError),
+        ):
+            sync_season(self.client, 2024, self.manifest_file)
+
+        self.assertEqual(set(load_manifest(self.manifest_file).keys()), {"act:MALE:1"})
+
+    def _sync(self, today: date = date(2024, 7, 8)):
+        with (
+            mock.patch.object(ACTClient, "get_race_names_by_year", side_effect=lambda *_, **__: iter(self.listing)),
+            mock.patch.object(ACTClient, "get_race_by_id", side_effect=lambda race_id, **_: self.races.get(race_id)),
+        ):
+            return sync_season(self.client, 2024, self.manifest_file, recent_days=7, today=today)
+
+    @staticmethod
+    def _race(race_id: str, date: str) -> Race:
+        return Race(
+            name="BANDERA",
+            date=date,
+            day=1,
+            modality=RACE_TRAINERA,
+            type=RACE_CONVENTIONAL,
+            league="ACT",
+            town=None,
+            organizer=None,
+            sponsor=None,
+            normalized_names=[("BANDERA", 1)],
+            race_ids=[race_id],
+            url=None,
+            datasource=Datasource.ACT.value,
+            gender=GENDER_MALE,
+            category=CATEGORY_ABSOLUT,
+            participants=[],
+        )